@@ -0,0 +1,57 @@
+"""Benchmark skala training/inference RandomForest terhadap jumlah core.
+
+Contoh:
+    python benchmarks/bench_forest_scaling.py --jobs 1 2 4 8 16 --scale 10
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from encoding import SparseOneHotEncoder  # noqa: E402
+from execution import MODEL_BACKEND, PhaseTimer, predict, resolve_n_jobs, train_forest  # noqa: E402
+from occupancy import OccupancyMatrix  # noqa: E402
+
+
+def main():
+    base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rooms', default=os.path.join(base, 'uploads', 'Rooms.csv'))
+    parser.add_argument('--schedule', default=os.path.join(base, 'uploads', 'updated_Raw_Schedule.csv'))
+    parser.add_argument('--scale', type=int, default=1, help='Gandakan daftar ruangan dan jadwal N kali')
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    rooms_df = pd.read_csv(args.rooms)
+    schedule_df = pd.read_csv(args.schedule)
+    if args.scale > 1:
+        # Salinan ruangan diberi suffix agar grid benar-benar bertambah besar
+        rooms_df = pd.concat(
+            [rooms_df.assign(Name=rooms_df['Name'] + f'#{i}') for i in range(args.scale)], ignore_index=True
+        )
+        schedule_df = pd.concat(
+            [schedule_df.assign(Room=schedule_df['Room'] + f'#{i}') for i in range(args.scale)], ignore_index=True
+        )
+
+    features_df = OccupancyMatrix.from_schedule(schedule_df, rooms_df['Name'].unique()).to_frame()
+    X = SparseOneHotEncoder(['Room', 'Sched. Time']).fit_transform(features_df)
+    y = features_df['Is Occupied']
+    print(f"Grid: {X.shape[0]} rows x {X.shape[1]} features, backend={MODEL_BACKEND}")
+
+    baseline = None
+    print(f"{'n_jobs':>6} {'workers':>7} {'fit':>8} {'evaluate':>9} {'predict':>8} {'speedup':>8}")
+    for n_jobs in args.jobs:
+        timer = PhaseTimer()
+        artifact = train_forest(X, y, timer, n_jobs=n_jobs)
+        predict(artifact['model'], X, timer, n_jobs=n_jobs)
+        timings = timer.timings
+        baseline = baseline or timings['fit']
+        print(f"{n_jobs:>6} {resolve_n_jobs(n_jobs):>7} {timings['fit']:>8.3f} {timings['evaluate']:>9.3f} "
+              f"{timings['predict']:>8.3f} {baseline / timings['fit']:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
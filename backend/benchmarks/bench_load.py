@@ -0,0 +1,238 @@
+"""Load test server gunicorn: request/detik untuk /api/schedule/calendar dan /api/room/predict.
+
+Untuk setiap jumlah worker di --workers, script menjalankan gunicorn dengan
+gunicorn.conf.py (WEB_CONCURRENCY=n), menunggu /api/health, lalu menembak
+setiap endpoint selama --duration detik dari --concurrency thread client
+(koneksi keep-alive per thread). Dengan --url, server yang sudah berjalan
+dipakai dan --workers diabaikan.
+
+/api/schedule/calendar membaca tabel schedule, jadi database harus sudah
+berisi jadwal: --database-url menjalankan migrate ke database tersebut dan
+--seed-csv mengisi jadwal lewat /api/schedule/save sebelum pengukuran.
+/api/room/predict memakai Rooms.csv dan conflict_schedule.csv di uploads/;
+model untuk data yang sama dilatih sekali (request warm-up) lalu diambil dari
+registry. Client dan server berbagi CPU jika dijalankan di mesin yang sama.
+
+Contoh:
+    python benchmarks/bench_load.py --workers 1,4,16 --database-url sqlite:////tmp/load.db \\
+        --seed-csv uploads/schedule_with_lecturers.csv --output /tmp/load.json
+    python benchmarks/bench_load.py --url http://localhost:8787 --duration 30
+"""
+import argparse
+import http.client
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from urllib.parse import urlsplit
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+UPLOADS = os.path.join(BACKEND, 'uploads')
+ENDPOINTS = ('calendar', 'room_predict')
+
+MIGRATE = '''
+import sys
+from app import create_app, migrate_database
+with create_app({'SQLALCHEMY_DATABASE_URI': sys.argv[1]}).app_context():
+    migrate_database()
+'''
+
+
+def multipart(files):
+    """Body multipart/form-data dari {field: path}; dibuat sekali dan dipakai ulang setiap request"""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for field, path in files.items():
+        with open(path, 'rb') as f:
+            content = f.read()
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{field}"; '
+            f'filename="{os.path.basename(path)}"\r\nContent-Type: text/csv\r\n\r\n'.encode() + content + b'\r\n'
+        )
+    body = b''.join(parts) + f'--{boundary}--\r\n'.encode()
+    return body, f'multipart/form-data; boundary={boundary}'
+
+
+def endpoint_requests(args):
+    """(method, path, body, headers) per endpoint"""
+    body, content_type = multipart({
+        'rooms_file': os.path.join(UPLOADS, 'Rooms.csv'),
+        'schedule_file': os.path.join(UPLOADS, 'conflict_schedule.csv'),
+    })
+    return {
+        'calendar': ('GET', f'/api/schedule/calendar?limit={args.calendar_limit}', None, {}),
+        'room_predict': ('POST', '/api/room/predict', body, {'Content-Type': content_type}),
+    }
+
+
+def client_loop(base_url, request, deadline, results):
+    method, path, body, headers = request
+    parts = urlsplit(base_url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=300)
+    latencies, errors = [], 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            ok = response.status == 200
+        except (OSError, http.client.HTTPException):
+            ok = False
+            conn.close()
+            conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=300)
+        if ok:
+            latencies.append(time.perf_counter() - start)
+        else:
+            errors += 1
+    conn.close()
+    results.append((latencies, errors))
+
+
+def run_load(base_url, request, concurrency, duration):
+    """Jalankan `concurrency` client selama `duration` detik; kembalikan req/s dan persentil latency"""
+    results = []
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(target=client_loop, args=(base_url, request, deadline, results))
+        for _ in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for lat, _ in results for latency in lat)
+    errors = sum(err for _, err in results)
+
+    def percentile(q):
+        return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 1) if latencies else None
+
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'requests_per_second': round(len(latencies) / elapsed, 2),
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'max_ms': round(latencies[-1] * 1000, 1) if latencies else None,
+        'mean_ms': round(statistics.fmean(latencies) * 1000, 1) if latencies else None,
+    }
+
+
+def wait_healthy(base_url, process=None, timeout=120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f'gunicorn exited with status {process.returncode}')
+        try:
+            with urllib.request.urlopen(f'{base_url}/api/health', timeout=5) as response:
+                if response.status == 200:
+                    return
+        except (OSError, urllib.error.URLError):
+            pass
+        time.sleep(0.25)
+    raise RuntimeError(f'{base_url} not healthy after {timeout}s')
+
+
+def seed_schedule(base_url, path, term):
+    body, content_type = multipart({'file': path})
+    request = urllib.request.Request(
+        f'{base_url}/api/schedule/save?term={term}', data=body, headers={'Content-Type': content_type}
+    )
+    with urllib.request.urlopen(request, timeout=300) as response:
+        return json.load(response)
+
+
+def start_server(workers, port, args):
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), GUNICORN_BIND=f'127.0.0.1:{port}')
+    if args.database_url:
+        env['GUNICORN_APP'] = f"app:create_app({{'SQLALCHEMY_DATABASE_URI': {args.database_url!r}}})"
+    log = open(os.path.join(args.log_dir, f'gunicorn_{workers}.log'), 'w')
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py'],
+        cwd=BACKEND, env=env, stdout=log, stderr=subprocess.STDOUT,
+    )
+    return process, log
+
+
+def bench_server(base_url, requests, args, seed=False):
+    if seed and args.seed_csv:
+        stats = seed_schedule(base_url, args.seed_csv, args.term)
+        print(f'seeded schedule: {stats.get("rows", stats)}')
+    results = {}
+    for name in args.endpoints:
+        # Request pertama melatih/memuat model dan mengisi cache parse; tidak ikut diukur
+        run_load(base_url, requests[name], 1, 0.01)
+        results[name] = run_load(base_url, requests[name], args.concurrency, args.duration)
+        result = results[name]
+        print(f'  {name:13s} {result["requests_per_second"]:8.2f} req/s  p50 {result["p50_ms"]} ms  '
+              f'p95 {result["p95_ms"]} ms  errors {result["errors"]}')
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', default='1,4,16', help='jumlah worker gunicorn, mis. 1,4,16')
+    parser.add_argument('--url', help='pakai server yang sudah berjalan (tidak menjalankan gunicorn)')
+    parser.add_argument('--endpoints', default=','.join(ENDPOINTS))
+    parser.add_argument('--duration', type=float, default=10.0, help='detik per endpoint')
+    parser.add_argument('--concurrency', type=int, default=16, help='jumlah thread client')
+    parser.add_argument('--calendar-limit', type=int, default=500)
+    parser.add_argument('--database-url', help='database untuk gunicorn (default: URI di create_app)')
+    parser.add_argument('--seed-csv', help='CSV jadwal yang diisi lewat /api/schedule/save sebelum mengukur')
+    parser.add_argument('--term', default='loadtest')
+    parser.add_argument('--port', type=int, default=8799)
+    parser.add_argument('--log-dir', default='/tmp', help='folder log gunicorn')
+    parser.add_argument('--output', help='tulis hasil ke file JSON ini')
+    args = parser.parse_args()
+
+    args.endpoints = [name for name in args.endpoints.split(',') if name]
+    unknown = set(args.endpoints) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f'unknown endpoints: {", ".join(sorted(unknown))}')
+    requests = endpoint_requests(args)
+
+    results = {}
+    if args.url:
+        base_url = args.url.rstrip('/')
+        wait_healthy(base_url)
+        print(f'== {base_url}')
+        results['external'] = bench_server(base_url, requests, args, seed=True)
+    else:
+        if args.database_url:
+            subprocess.run([sys.executable, '-c', MIGRATE, args.database_url], cwd=BACKEND, check=True)
+        base_url = f'http://127.0.0.1:{args.port}'
+        for i, workers in enumerate(int(n) for n in args.workers.split(',')):
+            process, log = start_server(workers, args.port, args)
+            try:
+                wait_healthy(base_url, process)
+                print(f'== {workers} worker(s)')
+                results[f'{workers}_workers'] = bench_server(base_url, requests, args, seed=i == 0)
+            finally:
+                process.terminate()
+                process.wait(timeout=60)
+                log.close()
+
+    report = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'cpu_count': os.cpu_count(),
+        'duration_seconds': args.duration,
+        'concurrency': args.concurrency,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
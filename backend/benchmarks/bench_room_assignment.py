@@ -0,0 +1,87 @@
+"""Benchmark assignment room/sesi /api/schedule/optimize: rejection sampling (lama) vs engine.
+
+Raw_Schedule.csv digandakan --scale kali. Ruangan juga digandakan --room-scale
+kali (dengan suffix) agar kapasitas cukup; dengan --room-scale 1 loop lama
+tidak pernah selesai sehingga dibatasi --max-retries per kelas.
+
+Contoh:
+    python benchmarks/bench_room_assignment.py --scale 10 --room-scale 10
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from room_assignment import assign_rooms_and_sessions, build_rooms_by_major  # noqa: E402
+
+
+def legacy_assign(data_df, rooms_df, sessions_list, max_retries):
+    """Loop lama: shuffle seluruh daftar ruangan per baris lalu random.choice sampai pasangan belum dipakai"""
+    rooms_by_major = build_rooms_by_major(rooms_df)
+    room_session_pairs = set()
+    retries = 0
+    stuck = 0
+    for major in data_df.sort_values(by='Major')['Major'].tolist():
+        available_rooms = rooms_by_major.get(major, []) or rooms_by_major.get('general', [])
+        random.shuffle(available_rooms)
+        room = available_rooms[0]
+        session_time = random.choice(sessions_list)
+        attempts = 0
+        while (room, session_time) in room_session_pairs:
+            attempts += 1
+            if attempts > max_retries:
+                break
+            session_time = random.choice(sessions_list)
+        retries += attempts
+        if attempts > max_retries:
+            stuck += 1
+            continue
+        room_session_pairs.add((room, session_time))
+    return retries, stuck
+
+
+def main():
+    base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rooms', default=os.path.join(base, 'uploads', 'Rooms.csv'))
+    parser.add_argument('--sched', default=os.path.join(base, 'uploads', 'Sched.csv'))
+    parser.add_argument('--data', default=os.path.join(base, 'uploads', 'Raw_Schedule.csv'))
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--room-scale', type=int, default=10)
+    parser.add_argument('--max-retries', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rooms_df = pd.read_csv(args.rooms)
+    sched_df = pd.read_csv(args.sched)
+    data_df = pd.concat([pd.read_csv(args.data)] * args.scale, ignore_index=True)
+    if args.room_scale > 1:
+        rooms_df = pd.concat(
+            [rooms_df.assign(Name=rooms_df['Name'] + f'#{i}') for i in range(args.room_scale)], ignore_index=True
+        )
+    sessions_list = (sched_df['Day'] + sched_df['Session'].astype(str)).tolist()
+    print(f"{len(data_df)} classes, {len(rooms_df)} rooms x {len(sessions_list)} sessions "
+          f"= {len(rooms_df) * len(sessions_list)} slots")
+
+    random.seed(args.seed)
+    start = time.perf_counter()
+    retries, stuck = legacy_assign(data_df, rooms_df, sessions_list, args.max_retries)
+    legacy_time = time.perf_counter() - start
+    print(f"legacy : {legacy_time:.3f}s, {retries} retries, {stuck} classes hit --max-retries")
+
+    start = time.perf_counter()
+    result_df, unassigned = assign_rooms_and_sessions(data_df, rooms_df, sessions_list, seed=args.seed)
+    engine_time = time.perf_counter() - start
+    pairs = result_df.dropna(subset=['Room'])[['Room', 'Sched. Time']]
+    print(f"engine : {engine_time:.3f}s, {len(unassigned)} unassignable classes, "
+          f"duplicate slots: {int(pairs.duplicated().sum())}")
+    print(f"speedup: {legacy_time / engine_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
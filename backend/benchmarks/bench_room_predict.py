@@ -0,0 +1,77 @@
+"""Benchmark prediksi ketersediaan ruangan: per-cell (lama) vs batch.
+
+Contoh:
+    python benchmarks/bench_room_predict.py --rooms uploads/Rooms.csv --schedule uploads/updated_Raw_Schedule.csv
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from encoding import SparseOneHotEncoder  # noqa: E402
+from occupancy import OccupancyMatrix  # noqa: E402
+from room_availability import predict_grid  # noqa: E402
+
+
+def predict_per_cell(model, feature_names, rooms_list, sessions_list):
+    """Jalur lama: satu DataFrame, get_dummies dan model.predict per (room, session)"""
+    statuses = []
+    for room in rooms_list:
+        for session_time in sessions_list:
+            input_data = pd.DataFrame([[room, session_time]], columns=['Room', 'Sched. Time'])
+            input_encoded = pd.get_dummies(input_data, columns=['Room', 'Sched. Time'])
+            missing_cols = set(feature_names) - set(input_encoded.columns)
+            for col in missing_cols:
+                input_encoded[col] = 0
+            input_encoded = input_encoded[feature_names]
+            prediction = model.predict(input_encoded.to_numpy(dtype='float32'))
+            statuses.append("Available" if prediction == 0 else "Occupied")
+    return statuses
+
+
+def main():
+    base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rooms', default=os.path.join(base, 'uploads', 'Rooms.csv'))
+    parser.add_argument('--schedule', default=os.path.join(base, 'uploads', 'updated_Raw_Schedule.csv'))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rooms_df = pd.read_csv(args.rooms)
+    schedule_df = pd.read_csv(args.schedule)
+
+    occupancy = OccupancyMatrix.from_schedule(schedule_df, rooms_df['Name'].unique())
+    features_df = occupancy.to_frame()
+    encoder = SparseOneHotEncoder(['Room', 'Sched. Time'])
+    X_encoded = encoder.fit_transform(features_df)
+    model = RandomForestClassifier(n_estimators=100, random_state=42)
+    model.fit(X_encoded, features_df['Is Occupied'])
+
+    print(f"Grid: {occupancy.shape[0]} rooms x {occupancy.shape[1]} sessions = {X_encoded.shape[0]} cells")
+
+    start = time.perf_counter()
+    legacy = predict_per_cell(model, encoder.feature_names, occupancy.rooms, occupancy.sessions)
+    legacy_time = time.perf_counter() - start
+
+    batch_times = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        batch = predict_grid(model, X_encoded)
+        batch_times.append(time.perf_counter() - start)
+    batch_time = min(batch_times)
+
+    print(f"per-cell : {legacy_time:.3f}s")
+    print(f"batch    : {batch_time:.3f}s (best of {args.repeat})")
+    print(f"speedup  : {legacy_time / batch_time:.1f}x")
+    print(f"identical: {legacy == batch}")
+    if legacy != batch:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
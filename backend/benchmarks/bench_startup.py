@@ -0,0 +1,97 @@
+"""Benchmark waktu start aplikasi: import app, create_app dan request /api/health pertama.
+
+Setiap pengukuran dijalankan di proses Python baru (seperti worker gunicorn
+yang baru di-spawn). `-X importtime` dipakai untuk mencari modul yang paling
+mahal di-import, dan dicek apakah pandas/sklearn/scipy ikut ter-load.
+
+Contoh:
+    python benchmarks/bench_startup.py --runs 5 --output /tmp/startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('pandas', 'numpy', 'sklearn', 'scipy', 'joblib')
+
+# Dijalankan di proses baru; mencetak satu baris JSON
+PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+client = app.app.test_client()
+status = client.get('/api/health').status_code
+done = time.perf_counter()
+print(json.dumps({
+    'import_seconds': imported - start,
+    'first_health_seconds': done - imported,
+    'total_seconds': done - start,
+    'health_status': status,
+    'heavy_modules_loaded': [m for m in %r if m in sys.modules],
+}))
+''' % (HEAVY_MODULES,)
+
+
+def run_probe():
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE], cwd=BACKEND, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def import_profile(top):
+    """Modul dengan waktu import kumulatif terbesar (`python -X importtime -c 'import app'`)"""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'], cwd=BACKEND, capture_output=True, text=True,
+        check=True,
+    ).stderr
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        # depth 0 = app, depth 1 = import langsung dari app
+        if depth <= 1:
+            modules.append({'module': name.strip(), 'cumulative_ms': round(int(cumulative) / 1000, 1)})
+    return sorted(modules, key=lambda m: m['cumulative_ms'], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=12)
+    parser.add_argument('--output', help='tulis hasil ke file JSON ini')
+    args = parser.parse_args()
+
+    runs = [run_probe() for _ in range(args.runs)]
+    report = {
+        'runs': args.runs,
+        'python': sys.version.split()[0],
+        'median': {
+            key: round(statistics.median(run[key] for run in runs), 4)
+            for key in ('import_seconds', 'first_health_seconds', 'total_seconds')
+        },
+        'heavy_modules_loaded': runs[-1]['heavy_modules_loaded'],
+        'imports': import_profile(args.top),
+    }
+
+    for key, value in report['median'].items():
+        print(f'{key:22s} {value:.4f}s (median of {args.runs})')
+    print(f'heavy modules loaded   {report["heavy_modules_loaded"] or "none"}')
+    print('slowest imports (cumulative):')
+    for module in report['imports']:
+        print(f'  {module["cumulative_ms"]:8.1f} ms  {module["module"]}')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
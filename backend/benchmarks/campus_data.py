@@ -0,0 +1,149 @@
+"""Generator data kampus sintetis (Rooms, Sched, Raw_Schedule, Lecturer) untuk benchmark.
+
+Skala 1 kira-kira seukuran file contoh di uploads/ (60 ruangan, 878 kelas,
+322 dosen); skala N mengalikan jumlah ruangan, kelas dan dosen dengan N.
+Jumlah sesi tetap 24 (Sched.csv), karena satu minggu tidak bertambah
+panjang. Distribusi Notes ruangan/dosen, Major dan SKS mengikuti file contoh,
+termasuk token Notes yang tidak dikenali (mis. 'No B4'). Hasil sama untuk
+seed yang sama.
+
+Contoh:
+    python benchmarks/campus_data.py --scale 10 --out /tmp/campus_10x
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+BASE_ROOMS = 60
+BASE_CLASSES = 878
+BASE_LECTURERS = 322
+
+SESSIONS = [('Mon', 5), ('Tue', 5), ('Wed', 5), ('Thu', 5), ('Fri', 4)]
+
+# Frekuensi dari uploads/Raw_Schedule.csv
+MAJORS = {
+    'PS_HI': 125, 'PS_Man': 117, 'PS_Hukum': 85, 'PS_TInf': 74, 'PS_TInd': 68, 'PS_IKom': 60,
+    'PS_Ak': 59, 'PS_SI': 48, 'PS_DKV_2017': 37, 'PS_TS': 29, 'PS_BA': 29, 'PS_AR': 23,
+    'PS_TL': 22, 'PS_PGSD': 22, 'PS_TE': 21, 'PS_AB': 17, 'PS_DI': 17, 'PS_TM': 9,
+    'PS_TInf_KKP': 7, 'PS_SI_KKP': 7, 'PS_IA': 2,
+}
+CREDITS = {3.0: 699, 0.0: 138, 2.0: 37, 6.0: 2, 4.0: 1, 1.0: 1}
+
+# Frekuensi dari uploads/Rooms.csv
+ROOM_NOTES = {
+    'general': 42, 'PS_SI, PS_TInf': 8, 'PS_DKV_2017': 3, 'PS_AR': 2,
+    'PS_SI_KKP, PS_TInf_KKP': 2, 'PS_MMTek': 1, 'PS_DI': 1, 'PS_Ikom': 1,
+}
+
+# Frekuensi dari uploads/Lecturer.csv
+LECTURER_NOTES = {
+    'general': 280, 'No Fri': 9, 'No B4': 8, 'No Wed': 3, 'Mon-Wed': 3, 'Mon-Thu': 2, 'No A4': 2,
+    'No C': 2, 'No Session1': 2, 'No Mon': 1, 'No Tue': 1, 'B2': 1, 'B3': 1, 'A2': 1, 'No Mon1': 1,
+    'No Session5': 1, 'Thu-Fri': 1, 'Session2-Session4': 1, 'Wed-Fri': 1, 'No Thu': 1,
+}
+LECTURER_TYPES = {'Full': 159, 'Part': 159, None: 4}
+
+FIRST_NAMES = ['Nabila', 'Gilang', 'Jihan', 'Tommy', 'Rizky', 'Putri', 'Andi', 'Dewi', 'Bayu', 'Sari',
+               'Fajar', 'Intan', 'Yoga', 'Maya', 'Hendra', 'Laras']
+LAST_NAMES = ['Khairani', 'Saputro', 'Azzahra', 'Wicaksono', 'Pratama', 'Lestari', 'Nugroho', 'Hidayat',
+              'Siregar', 'Wijaya', 'Kusuma', 'Santoso']
+BUILDINGS = 'ABCDEFGH'
+
+
+def _sample(rng, weights, size):
+    """Ambil `size` nilai dari dict nilai -> frekuensi"""
+    values = list(weights)
+    p = np.array(list(weights.values()), dtype=float)
+    picks = rng.choice(len(values), size=size, p=p / p.sum())
+    return [values[i] for i in picks]
+
+
+def generate_rooms(rng, scale):
+    n = BASE_ROOMS * scale
+    names = [f'{BUILDINGS[i % len(BUILDINGS)]}{100 + i // len(BUILDINGS)}' for i in range(n)]
+    return pd.DataFrame({'Name': names, 'Notes': _sample(rng, ROOM_NOTES, n)})
+
+
+def generate_sched():
+    return pd.DataFrame(
+        [(day, session) for day, sessions in SESSIONS for session in range(1, sessions + 1)],
+        columns=['Day', 'Session'],
+    )
+
+
+def generate_raw_schedule(rng, scale):
+    n = BASE_CLASSES * scale
+    majors = _sample(rng, MAJORS, n)
+    years = rng.integers(2019, 2025, size=n)
+    subject_ids = rng.integers(0, 12 * scale, size=n)
+    class_ids = rng.integers(1, 4, size=n)
+    curricula = [f'{major[3:]}-{year}' for major, year in zip(majors, years)]
+    subjects = [f'{major[3:]} Subject {subject}' for major, subject in zip(majors, subject_ids)]
+    return pd.DataFrame({
+        'Program Session': 'M',
+        'Major': majors,
+        'Curriculum': curricula,
+        'Class': [f'M {cur} {subject.upper()} CLASS {c} #{i}'
+                  for i, (cur, subject, c) in enumerate(zip(curricula, subjects, class_ids))],
+        'Subject': subjects,
+        'Cr': _sample(rng, CREDITS, n),
+    })
+
+
+def generate_lecturers(rng, scale):
+    n = BASE_LECTURERS * scale
+    first = rng.integers(0, len(FIRST_NAMES), size=n)
+    last = rng.integers(0, len(LAST_NAMES), size=n)
+    return pd.DataFrame({
+        # Nomor urut agar nama unik di skala besar
+        'Lecturer Name': [f'{FIRST_NAMES[a]} {LAST_NAMES[b]} {i}' for i, (a, b) in enumerate(zip(first, last))],
+        'Lec. Type': _sample(rng, LECTURER_TYPES, n),
+        'Notes': _sample(rng, LECTURER_NOTES, n),
+    })
+
+
+def generate_campus(scale=1, seed=42):
+    """Dict DataFrame {'rooms', 'sched', 'raw_schedule', 'lecturer'} untuk skala tertentu"""
+    rng = np.random.default_rng(seed)
+    return {
+        'rooms': generate_rooms(rng, scale),
+        'sched': generate_sched(),
+        'raw_schedule': generate_raw_schedule(rng, scale),
+        'lecturer': generate_lecturers(rng, scale),
+    }
+
+
+# Nama file sama seperti file contoh di uploads/
+FILENAMES = {
+    'rooms': 'Rooms.csv',
+    'sched': 'Sched.csv',
+    'raw_schedule': 'Raw_Schedule.csv',
+    'lecturer': 'Lecturer.csv',
+}
+
+
+def write_campus(folder, scale=1, seed=42):
+    """Tulis keempat CSV ke `folder` dan kembalikan path per jenis file"""
+    os.makedirs(folder, exist_ok=True)
+    paths = {}
+    for name, df in generate_campus(scale, seed).items():
+        paths[name] = os.path.join(folder, FILENAMES[name])
+        df.to_csv(paths[name], index=False)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', required=True)
+    args = parser.parse_args()
+
+    for name, path in write_campus(args.out, args.scale, args.seed).items():
+        print(f'{name:13s} {path}')
+
+
+if __name__ == '__main__':
+    main()
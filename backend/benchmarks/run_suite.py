@@ -0,0 +1,219 @@
+"""Benchmark suite fungsi inti pada data kampus sintetis 1x/10x/100x.
+
+Setiap case memanggil fungsi inti langsung (tanpa Flask dan tanpa CSV):
+  optimize            assign_rooms_and_sessions (loop /api/schedule/optimize)
+  room_availability   train_and_predict_room_availability (/api/room/predict)
+  conflict_resolve    detect_conflicts + resolve_conflicts (/api/conflict/resolve)
+  lecturer            assign_lecturers_to_schedule (/api/schedule/lecturer)
+
+Wall time adalah waktu terbaik dari --repeat kali jalan; peak memory diukur
+dengan tracemalloc pada satu jalan tambahan (alokasi Python dan numpy;
+buffer C internal sklearn tidak tercatat, lihat max_rss_mb untuk total proses).
+Skala 100x memakan waktu lama (model ruangan dan assignment dosen tumbuh
+superlinear) sehingga tidak termasuk default.
+Hasil ditulis ke JSON (--output). Dengan --baseline, hasil dibandingkan dengan
+baseline lama dan script keluar dengan status 1 jika ada case yang lebih
+lambat atau lebih boros memori dari --tolerance kali baseline.
+
+Contoh:
+    python benchmarks/run_suite.py --scales 1,10 --output benchmarks/baseline.json
+    python benchmarks/run_suite.py --scales 1,10 --baseline benchmarks/baseline.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from campus_data import generate_campus  # noqa: E402
+from conflict_detection import detect_conflicts  # noqa: E402
+from conflict_resolution import resolve_conflicts  # noqa: E402
+from execution import resolve_n_jobs  # noqa: E402
+from lecturer_assignment import assign_lecturers_to_schedule  # noqa: E402
+from lecturer_rules import LecturerAvailability  # noqa: E402
+from pipeline import session_codes, valid_lecturers  # noqa: E402
+from room_assignment import assign_rooms_and_sessions  # noqa: E402
+from room_availability import train_and_predict_room_availability  # noqa: E402
+
+CASES = ('optimize', 'room_availability', 'conflict_resolve', 'lecturer')
+
+# Porsi baris yang dipindah ke slot baris lain agar terjadi bentrok ruangan
+CONFLICT_FRACTION = 0.05
+
+
+def make_conflicts(schedule_df, seed):
+    """Salin (Room, Sched. Time) baris lain ke CONFLICT_FRACTION baris jadwal"""
+    rng = np.random.default_rng(seed)
+    schedule_df = schedule_df.copy()
+    n = int(len(schedule_df) * CONFLICT_FRACTION)
+    targets = rng.choice(len(schedule_df), size=n, replace=False)
+    sources = rng.choice(len(schedule_df), size=n)
+    for column in ('Room', 'Sched. Time'):
+        values = schedule_df[column].to_numpy(copy=True)
+        values[targets] = values[sources]
+        schedule_df[column] = values
+    return schedule_df
+
+
+def prepare(scale, seed):
+    """Data input setiap case; jadwal dan ketersediaan ruangan dihitung sekali di luar pengukuran"""
+    data = generate_campus(scale, seed)
+    sessions = session_codes(data['sched'])
+    schedule_df, _ = assign_rooms_and_sessions(data['raw_schedule'], data['rooms'], sessions, seed=seed)
+    schedule_df = schedule_df.dropna(subset=['Room']).reset_index(drop=True)
+    conflict_df = make_conflicts(schedule_df, seed)
+    conflict_df['Conflict'], _ = detect_conflicts(conflict_df)
+    room_df = train_and_predict_room_availability(conflict_df, data['rooms'])['all_predictions']
+    lecturer_df, _ = valid_lecturers(data['lecturer'])
+    return {
+        **data,
+        'sessions': sessions,
+        'schedule': schedule_df,
+        'conflict_schedule': conflict_df,
+        'room_availability': pd.DataFrame(room_df),
+        'valid_lecturers': lecturer_df,
+    }
+
+
+def case_functions(inputs, seed):
+    def optimize():
+        return assign_rooms_and_sessions(inputs['raw_schedule'], inputs['rooms'], inputs['sessions'], seed=seed)
+
+    def room_availability():
+        return train_and_predict_room_availability(inputs['schedule'], inputs['rooms'])
+
+    def conflict_resolve():
+        schedule_df = inputs['conflict_schedule'].drop(columns=['Conflict'])
+        schedule_df['Conflict'], _ = detect_conflicts(schedule_df)
+        return resolve_conflicts(schedule_df, inputs['room_availability'])
+
+    def lecturer():
+        random.seed(seed)  # lecturer greedy mengacak urutan dosen
+        lecturer_df = inputs['valid_lecturers']
+        availability = LecturerAvailability.from_dataframe(lecturer_df)
+        return assign_lecturers_to_schedule(inputs['schedule'], lecturer_df, availability)
+
+    return {
+        'optimize': (optimize, len(inputs['raw_schedule'])),
+        'room_availability': (room_availability, len(inputs['rooms']) * len(inputs['sessions'])),
+        'conflict_resolve': (conflict_resolve, len(inputs['conflict_schedule'])),
+        'lecturer': (lecturer, len(inputs['schedule'])),
+    }
+
+
+def measure(fn, repeat, memory=True):
+    """Waktu terbaik dan median dari `repeat` kali jalan, plus peak memory tracemalloc (MB)"""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    result = {'seconds': round(min(times), 4), 'median_seconds': round(statistics.median(times), 4)}
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result['peak_mb'] = round(peak / 2 ** 20, 2)
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """Daftar case yang lebih lambat/boros dari tolerance x baseline"""
+    regressions = []
+    for scale, cases in results.items():
+        for case, current in cases.items():
+            previous = baseline.get('results', {}).get(scale, {}).get(case)
+            if previous is None:
+                continue
+            for metric in ('seconds', 'peak_mb'):
+                if metric in current and metric in previous and previous[metric] > 0:
+                    ratio = current[metric] / previous[metric]
+                    if ratio > tolerance:
+                        regressions.append(
+                            f'{scale} {case} {metric}: {previous[metric]} -> {current[metric]} ({ratio:.2f}x)'
+                        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', default='1,10', help='mis. 1,10,100')
+    parser.add_argument('--cases', default=','.join(CASES))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help='lewati pengukuran tracemalloc')
+    parser.add_argument('--output', help='tulis hasil ke file JSON ini')
+    parser.add_argument('--baseline', help='bandingkan dengan file JSON hasil sebelumnya')
+    parser.add_argument('--tolerance', type=float, default=1.5)
+    args = parser.parse_args()
+
+    scales = [int(scale) for scale in args.scales.split(',')]
+    cases = [case for case in args.cases.split(',') if case]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f'unknown cases: {", ".join(sorted(unknown))}')
+
+    results = {}
+    for scale in scales:
+        start = time.perf_counter()
+        inputs = prepare(scale, args.seed)
+        print(f'== {scale}x: {len(inputs["rooms"])} rooms, {len(inputs["raw_schedule"])} classes, '
+              f'{len(inputs["lecturer"])} lecturers (setup {time.perf_counter() - start:.1f}s)')
+        functions = case_functions(inputs, args.seed)
+        results[f'{scale}x'] = {}
+        for case in cases:
+            fn, rows = functions[case]
+            result = {'rows': rows, **measure(fn, args.repeat, memory=not args.no_memory)}
+            results[f'{scale}x'][case] = result
+            print(f'{case:18s} {result["seconds"]:9.4f}s  median {result["median_seconds"]:9.4f}s'
+                  + (f'  peak {result["peak_mb"]:8.2f} MB' if 'peak_mb' in result else ''))
+
+    report = {
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'model_n_jobs': resolve_n_jobs(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'max_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'written to {args.output}')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f'regressions (> {args.tolerance}x baseline):')
+            for line in regressions:
+                print(f'  {line}')
+            sys.exit(1)
+        print(f'no regressions against {args.baseline} (tolerance {args.tolerance}x)')
+
+
+if __name__ == '__main__':
+    main()
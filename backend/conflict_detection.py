@@ -0,0 +1,72 @@
+import pandas as pd
+
+# Jenis konflik -> kolom resource yang tidak boleh dipakai dua kali di slot yang sama
+CONFLICT_TYPES = {
+    'room': 'Room',
+    'lecturer': 'Lecturer',
+    'class': 'Class',
+}
+
+
+def _is_blank(value):
+    return value is None or (isinstance(value, float) and pd.isna(value)) or value == ''
+
+
+def detect_conflicts(schedule_df):
+    """Deteksi bentrok jadwal dalam satu pass dengan hash map (resource, slot).
+
+    Mengembalikan (conflict_flags, groups):
+      - conflict_flags: list 0/1 per baris untuk bentrok ruangan (kolom 'Conflict'
+        yang dipakai /api/conflict/resolve)
+      - groups: daftar grup konflik {'type', 'key', 'Sched. Time', 'rows'} untuk
+        bentrok ruangan, dosen yang double-booked, dan kelas yang jadwalnya overlap.
+    Baris tanpa nilai resource atau Sched. Time diabaikan untuk jenis itu.
+    """
+    slots = schedule_df['Sched. Time'].tolist()
+    columns = {
+        conflict_type: schedule_df[column].tolist()
+        for conflict_type, column in CONFLICT_TYPES.items()
+        if column in schedule_df.columns
+    }
+
+    index = {conflict_type: {} for conflict_type in columns}
+    for row, slot in enumerate(slots):
+        if _is_blank(slot):
+            continue
+        for conflict_type, values in columns.items():
+            value = values[row]
+            if _is_blank(value):
+                continue
+            index[conflict_type].setdefault((value, slot), []).append(row)
+
+    conflict_flags = [0] * len(slots)
+    groups = []
+    for conflict_type, slot_map in index.items():
+        for (value, slot), rows in slot_map.items():
+            if len(rows) < 2:
+                continue
+            groups.append({'type': conflict_type, 'key': value, 'Sched. Time': slot, 'rows': rows})
+            if conflict_type == 'room':
+                for row in rows:
+                    conflict_flags[row] = 1
+
+    return conflict_flags, groups
+
+
+def describe_groups(schedule_df, groups, columns=('Class', 'Subject', 'Room', 'Lecturer')):
+    """Tambahkan detail baris (Class, Subject, Room, Lecturer) ke setiap grup konflik"""
+    columns = [col for col in columns if col in schedule_df.columns]
+    records = schedule_df[columns].astype(object).where(schedule_df[columns].notna(), None).to_dict('records')
+    return [
+        {**group, 'entries': [{'row': row, **records[row]} for row in group['rows']]}
+        for group in groups
+    ]
+
+
+def summarize_groups(groups):
+    """Jumlah grup dan baris yang terlibat per jenis konflik"""
+    summary = {conflict_type: {'groups': 0, 'rows': 0} for conflict_type in CONFLICT_TYPES}
+    for group in groups:
+        summary[group['type']]['groups'] += 1
+        summary[group['type']]['rows'] += len(group['rows'])
+    return summary
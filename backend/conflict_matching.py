@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+from scipy.optimize import linear_sum_assignment
+
+from conflict_resolution import FreeSlotIndex, resolve_conflicts, rows_to_move
+
+# Biaya memindahkan jadwal: ganti ruangan lebih murah daripada ganti waktu
+# (ganti waktu berdampak ke mahasiswa dan dosen), ruangan general diberi
+# penalti agar ruangan khusus major dipakai lebih dulu.
+ROOM_MOVE_COST = 1.0
+TIME_MOVE_COST = 2.0
+GENERAL_ROOM_COST = 0.5
+# Biaya pasangan yang tidak diizinkan (ruangan milik major lain); harus lebih
+# besar dari total biaya matching mana pun agar jumlah konflik terselesaikan
+# dimaksimalkan lebih dulu.
+FORBIDDEN_COST = 1e9
+
+
+def move_cost(index, major, old_room, old_time, new_room, new_time):
+    """Biaya satu perpindahan jadwal; FORBIDDEN_COST jika ruangan baru tidak cocok dengan major"""
+    if new_room == old_room:
+        cost = 0.0  # Tetap di ruangan yang sama, Notes ruangan tidak dipermasalahkan
+    elif new_room in index.rooms_by_note.get(major, {}):
+        cost = 0.0
+    elif new_room in index.rooms_by_note.get('general', {}):
+        cost = GENERAL_ROOM_COST
+    else:
+        return FORBIDDEN_COST
+    if new_room != old_room:
+        cost += ROOM_MOVE_COST
+    if new_time != old_time:
+        cost += TIME_MOVE_COST
+    return cost
+
+
+def build_cost_matrix(index, majors, old_rooms, old_times, cells):
+    """Matriks biaya (baris konflik x slot kosong), sama dengan move_cost tetapi dihitung vektor per major"""
+    cell_rooms = np.array([room for room, _ in cells], dtype=object)
+    cell_times = np.array([session for _, session in cells], dtype=object)
+    old_rooms = np.array(old_rooms, dtype=object)
+    old_times = np.array(old_times, dtype=object)
+
+    costs = np.full((len(majors), len(cells)), FORBIDDEN_COST)
+    general = np.isin(cell_rooms, list(index.rooms_by_note.get('general', {})))
+    majors = pd.Series(majors, dtype=object)
+    for major, positions in majors.groupby(majors, dropna=False).indices.items():
+        specific = np.isin(cell_rooms, list(index.rooms_by_note.get(major, {})))
+        room_base = np.where(specific, 0.0, np.where(general, GENERAL_ROOM_COST, np.inf))
+        room_moves = old_rooms[positions][:, None] != cell_rooms[None, :]
+        time_moves = old_times[positions][:, None] != cell_times[None, :]
+        block = np.where(room_moves, room_base[None, :] + ROOM_MOVE_COST, 0.0) + TIME_MOVE_COST * time_moves
+        costs[positions] = np.where(np.isfinite(block), block, FORBIDDEN_COST)
+    return costs
+
+
+def resolve_conflicts_optimal(schedule_df, room_df):
+    """Perbaikan konflik global: min-cost assignment baris konflik ke slot kosong.
+
+    Semua baris yang harus dipindah dicocokkan sekaligus dengan slot kosong
+    (scipy linear_sum_assignment) sehingga jumlah konflik terselesaikan
+    maksimal dan total biaya perpindahan minimal. Hasil sama formatnya dengan
+    resolve_conflicts, ditambah ringkasan perbandingan dengan greedy.
+    """
+    # Greedy pada input yang sama, hanya untuk perbandingan
+    greedy_df, _, greedy_resolved, _ = resolve_conflicts(schedule_df, room_df)
+
+    schedule_df = schedule_df.copy()
+    room_df = room_df.copy()
+
+    rooms = schedule_df['Room'].tolist()
+    times = schedule_df['Sched. Time'].tolist()
+    original_rooms, original_times = list(rooms), list(times)
+    index = FreeSlotIndex(room_df, occupied=zip(rooms, times))
+    cells = [(room, session) for room, sessions in index.sessions_by_room.items() for session in sessions]
+
+    majors = schedule_df['Major'].tolist() if 'Major' in schedule_df.columns else [None] * len(rooms)
+    subjects = schedule_df['Subject'].tolist() if 'Subject' in schedule_df.columns else [None] * len(rooms)
+    lecturers = schedule_df['Lecturer'].tolist() if 'Lecturer' in schedule_df.columns else [None] * len(rooms)
+
+    positions = rows_to_move(schedule_df)
+    matched = {}
+    if positions and cells:
+        costs = build_cost_matrix(
+            index,
+            [majors[pos] for pos in positions],
+            [rooms[pos] for pos in positions],
+            [times[pos] for pos in positions],
+            cells,
+        )
+        row_ind, col_ind = linear_sum_assignment(costs)
+        matched = {
+            positions[r]: (cells[c], costs[r, c])
+            for r, c in zip(row_ind, col_ind)
+            if costs[r, c] < FORBIDDEN_COST
+        }
+
+    resolved = []
+    unresolved = []
+    taken_rows = []
+    total_cost = 0.0
+    for pos in positions:
+        if pos not in matched:
+            unresolved.append(pos)
+            continue
+        (new_room, new_time), cost = matched[pos]
+        total_cost += float(cost)
+        row = index.take(new_room, new_time)
+        if row is not None:
+            taken_rows.append(row)
+        rooms[pos], times[pos] = new_room, new_time
+        resolved.append({
+            'Room': new_room,
+            'Sched. Time': new_time,
+            'Subject': subjects[pos],
+            'Lecturer': None if pd.isna(lecturers[pos]) else lecturers[pos],
+        })
+
+    schedule_df['Room'] = rooms
+    schedule_df['Sched. Time'] = times
+    if taken_rows:
+        room_df.loc[taken_rows, 'Status'] = 'Occupied'
+
+    greedy_rooms = greedy_df['Room'].tolist()
+    greedy_times = greedy_df['Sched. Time'].tolist()
+    greedy_cost = sum(
+        move_cost(index, majors[pos], original_rooms[pos], original_times[pos], greedy_rooms[pos], greedy_times[pos])
+        for pos in positions
+        if (greedy_rooms[pos], greedy_times[pos]) != (original_rooms[pos], original_times[pos])
+    )
+    comparison = {
+        'rows_to_move': len(positions),
+        'free_slots': len(cells),
+        'greedy_resolved': len(greedy_resolved),
+        'greedy_cost': round(greedy_cost, 2),
+        'optimal_resolved': len(resolved),
+        'optimal_cost': round(total_cost, 2),
+    }
+    return schedule_df, room_df, resolved, unresolved, comparison
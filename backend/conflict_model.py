@@ -0,0 +1,27 @@
+from encoding import SparseOneHotEncoder
+from execution import PhaseTimer, train_forest
+
+# Naikkan jika fitur atau hyperparameter model berubah agar artifact lama tidak dipakai
+CONFLICT_MODEL_VERSION = 'v2'
+
+
+def fit_conflict_model(schedule_df, timer=None):
+    """Latih RandomForest deteksi konflik dari kolom Room, Sched. Time dan Conflict"""
+    timer = timer or PhaseTimer()
+    with timer.phase('encode'):
+        encoder = SparseOneHotEncoder(['Room', 'Sched. Time'])
+        X = encoder.fit_transform(schedule_df)
+    artifact = train_forest(X, schedule_df['Conflict'], timer)
+    artifact['encoder'] = encoder
+    return artifact
+
+
+def train_conflict_model(schedule_df, registry=None, timer=None):
+    """Kembalikan (artifact, cached, key). Model dari registry dipakai jika input sama"""
+    if registry is None:
+        return fit_conflict_model(schedule_df, timer), False, None
+
+    # Label Conflict diturunkan dari Room dan Sched. Time, jadi cukup dua kolom ini
+    key = registry.make_key('schedule_conflict', CONFLICT_MODEL_VERSION, schedule_df[['Room', 'Sched. Time']])
+    artifact, cached = registry.get_or_train(key, lambda: fit_conflict_model(schedule_df, timer))
+    return artifact, cached, key
@@ -0,0 +1,150 @@
+import pandas as pd
+
+# Status di file ketersediaan ruangan yang berarti slot masih kosong
+FREE_STATUSES = {'Available', 'Empty'}
+
+
+def parse_room_notes(note):
+    """'PS_SI, PS_TInf' -> {'PS_SI', 'PS_TInf'}; kosong -> {'general'}"""
+    if not isinstance(note, str) or not note.strip():
+        return {'general'}
+    return {n.strip() for n in note.split(',') if n.strip()}
+
+
+class FreeSlotIndex:
+    """Index slot (room, session) yang masih kosong dari file ketersediaan ruangan.
+
+    Menyimpan ruangan kosong per sesi, sesi kosong per ruangan dan ruangan per
+    major (dari Notes). Urutan mengikuti urutan baris file sehingga pilihan
+    "pertama" sama seperti iloc[0] pada filter DataFrame. take() memperbarui
+    semua index dalam O(1).
+    """
+
+    def __init__(self, room_df, occupied=()):
+        occupied = set(occupied)
+        self.rooms_by_session = {}
+        self.sessions_by_room = {}
+        self.rooms_by_note = {}
+        self.cell_rows = {}
+        self._compatible = {}
+
+        for row, room, session, status, note in zip(
+            room_df.index, room_df['Room'], room_df['Session_Time'], room_df['Status'], room_df['Notes']
+        ):
+            for n in parse_room_notes(note):
+                self.rooms_by_note.setdefault(n, {})[room] = None
+            self.cell_rows.setdefault((room, session), row)
+            if status not in FREE_STATUSES or (room, session) in occupied:
+                continue
+            self.rooms_by_session.setdefault(session, {})[room] = None
+            self.sessions_by_room.setdefault(room, {})[session] = None
+
+    def compatible_rooms(self, major):
+        """Ruangan khusus major lebih dulu, lalu ruangan general"""
+        if major not in self._compatible:
+            rooms = dict(self.rooms_by_note.get(major, {}))
+            rooms.update(self.rooms_by_note.get('general', {}))
+            self._compatible[major] = list(rooms)
+        return self._compatible[major]
+
+    def room_at(self, session, major):
+        """Ruangan kosong pertama yang cocok dengan major pada sesi tertentu"""
+        free_rooms = self.rooms_by_session.get(session, {})
+        for room in self.compatible_rooms(major):
+            if room in free_rooms:
+                return room
+        return None
+
+    def session_for(self, room):
+        """Sesi kosong pertama untuk ruangan tertentu"""
+        return next(iter(self.sessions_by_room.get(room, {})), None)
+
+    def any_cell(self, major):
+        """Slot kosong pertama di ruangan yang cocok dengan major"""
+        for room in self.compatible_rooms(major):
+            session = self.session_for(room)
+            if session is not None:
+                return room, session
+        return None
+
+    def take(self, room, session):
+        self.rooms_by_session.get(session, {}).pop(room, None)
+        self.sessions_by_room.get(room, {}).pop(session, None)
+        return self.cell_rows.get((room, session))
+
+
+def rows_to_move(schedule_df):
+    """Posisi baris Conflict == 1 yang harus dipindah (baris pertama tiap grup bentrok tetap)"""
+    kept = set()
+    positions = []
+    rooms = schedule_df['Room'].tolist()
+    times = schedule_df['Sched. Time'].tolist()
+    for pos, flag in enumerate(schedule_df['Conflict'].tolist()):
+        if flag != 1:
+            continue
+        if (rooms[pos], times[pos]) not in kept:
+            kept.add((rooms[pos], times[pos]))
+            continue
+        positions.append(pos)
+    return positions
+
+
+def resolve_conflicts(schedule_df, room_df):
+    """Pindahkan jadwal yang bentrok ruangan (Conflict == 1) ke slot kosong.
+
+    Baris pertama di setiap (Room, Sched. Time) tetap di tempat; baris lain
+    dipindah dengan urutan langkah:
+      1. ruangan lain yang kosong di sesi yang sama
+      2. sesi lain yang kosong di ruangan yang sama
+      3. slot kosong mana pun di ruangan yang cocok dengan major
+    Mengembalikan (schedule_df, room_df, resolved, unresolved) dengan Status
+    slot yang dipakai di room_df diubah menjadi 'Occupied'.
+    """
+    schedule_df = schedule_df.copy()
+    room_df = room_df.copy()
+
+    rooms = schedule_df['Room'].tolist()
+    times = schedule_df['Sched. Time'].tolist()
+    index = FreeSlotIndex(room_df, occupied=zip(rooms, times))
+
+    majors = schedule_df['Major'].tolist() if 'Major' in schedule_df.columns else [None] * len(rooms)
+    subjects = schedule_df['Subject'].tolist() if 'Subject' in schedule_df.columns else [None] * len(rooms)
+    lecturers = schedule_df['Lecturer'].tolist() if 'Lecturer' in schedule_df.columns else [None] * len(rooms)
+
+    resolved = []
+    unresolved = []
+    taken_rows = []
+    for pos in rows_to_move(schedule_df):
+        conflicting_room, conflicting_time, major = rooms[pos], times[pos], majors[pos]
+
+        new_room, new_time = None, None
+        room = index.room_at(conflicting_time, major)
+        if room is not None:
+            new_room, new_time = room, conflicting_time
+        elif index.session_for(conflicting_room) is not None:
+            new_room, new_time = conflicting_room, index.session_for(conflicting_room)
+        else:
+            cell = index.any_cell(major)
+            if cell is not None:
+                new_room, new_time = cell
+
+        if new_room is None:
+            unresolved.append(pos)
+            continue
+
+        row = index.take(new_room, new_time)
+        if row is not None:
+            taken_rows.append(row)
+        rooms[pos], times[pos] = new_room, new_time
+        resolved.append({
+            'Room': new_room,
+            'Sched. Time': new_time,
+            'Subject': subjects[pos],
+            'Lecturer': None if pd.isna(lecturers[pos]) else lecturers[pos],
+        })
+
+    schedule_df['Room'] = rooms
+    schedule_df['Sched. Time'] = times
+    if taken_rows:
+        room_df.loc[taken_rows, 'Status'] = 'Occupied'
+    return schedule_df, room_df, resolved, unresolved
@@ -0,0 +1,144 @@
+import io
+from importlib.util import find_spec
+
+import pandas as pd
+
+from upload_store import read_upload
+
+# pyarrow opsional: parser multi-thread jika terpasang, selain itu parser C pandas
+CSV_ENGINE = 'pyarrow' if find_spec('pyarrow') is not None else 'c'
+
+
+class SchemaError(ValueError):
+    """File CSV tidak sesuai schema; to_dict() dipakai langsung sebagai response 400"""
+
+    def __init__(self, schema, found_columns, detail=None):
+        self.schema = schema
+        self.found_columns = list(found_columns)
+        self.missing_columns = [col for col in schema.required if col not in self.found_columns]
+        self.detail = detail
+        super().__init__(detail or f'Invalid {schema.label} file format, missing columns: {", ".join(self.missing_columns)}')
+
+    def to_dict(self):
+        error = {
+            'error': f'Invalid {self.schema.label} file format',
+            'file': self.schema.name,
+            'required_columns': list(self.schema.required),
+            'missing_columns': self.missing_columns,
+            'found_columns': self.found_columns,
+        }
+        if self.detail:
+            error['detail'] = self.detail
+        return error
+
+
+class CsvSchema:
+    """Kolom wajib/opsional dan dtype satu jenis file CSV.
+
+    `keep_extra=False` hanya membaca kolom yang ada di schema (usecols);
+    `keep_extra=True` untuk file yang ditulis ulang apa adanya ke output.
+    Kolom dengan kardinalitas kecil (Room, Major, Sched. Time, ...) dibaca
+    sebagai `category`. Kolom yang nilainya diubah per sel setelah dibaca
+    (mis. Status) tidak boleh `category`.
+    """
+
+    def __init__(self, name, label, required, optional=(), dtypes=None, keep_extra=False, version=1):
+        self.name = name
+        self.label = label
+        self.required = tuple(required)
+        self.optional = tuple(optional)
+        self.dtypes = dict(dtypes or {})
+        self.keep_extra = keep_extra
+        self.version = version
+
+    @property
+    def columns(self):
+        return self.required + self.optional
+
+    @property
+    def cache_key(self):
+        return f'{self.name}-v{self.version}'
+
+    def validate(self, columns):
+        if any(col not in columns for col in self.required):
+            raise SchemaError(self, columns)
+
+    def read(self, source):
+        """Baca CSV: cek header dulu, lalu baca kolom yang diperlukan dengan dtype dari schema"""
+        if not isinstance(source, str):
+            source = io.BytesIO(source.read())
+
+        header = pd.read_csv(source, nrows=0).columns
+        stripped = [col.strip() for col in header]
+        self.validate(stripped)
+        if not isinstance(source, str):
+            source.seek(0)
+
+        raw_names = dict(zip(stripped, header))
+        usecols = None if self.keep_extra else [raw_names[col] for col in self.columns if col in raw_names]
+        dtype = {raw_names[col]: dt for col, dt in self.dtypes.items() if col in raw_names}
+        try:
+            df = pd.read_csv(source, usecols=usecols, dtype=dtype, engine=CSV_ENGINE)
+        except (ValueError, TypeError) as e:
+            # Nilai yang tidak bisa dikonversi ke dtype schema (mis. Session bukan angka)
+            raise SchemaError(self, stripped, detail=str(e))
+        df.columns = df.columns.str.strip()
+        return df
+
+
+ROOMS = CsvSchema('rooms', 'rooms', ['Name', 'Notes'], dtypes={'Name': 'str', 'Notes': 'category'})
+
+SCHED = CsvSchema('sched', 'sched', ['Day', 'Session'], dtypes={'Day': 'str', 'Session': 'int64'})
+
+_SCHEDULE_DTYPES = {
+    'Program Session': 'category',
+    'Major': 'category',
+    'Curriculum': 'category',
+    'Class': 'str',
+    'Subject': 'str',
+    'Cr': 'float64',
+    'Room': 'category',
+    'Sched. Time': 'category',
+    'Lecturer': 'category',
+}
+
+RAW_SCHEDULE = CsvSchema(
+    'raw_schedule', 'data',
+    ['Program Session', 'Major', 'Curriculum', 'Class', 'Subject', 'Cr'],
+    dtypes=_SCHEDULE_DTYPES, keep_extra=True,
+)
+
+# Jadwal yang sudah punya ruangan/sesi (input assignment dosen)
+SCHEDULE = CsvSchema(
+    'schedule', 'schedule',
+    ['Program Session', 'Major', 'Curriculum', 'Class', 'Subject', 'Cr', 'Room', 'Sched. Time'],
+    dtypes=_SCHEDULE_DTYPES, keep_extra=True,
+)
+
+# Pemakaian ruangan untuk prediksi ketersediaan: hanya Room dan Sched. Time
+ROOM_USAGE = CsvSchema('room_usage', 'schedule', ['Room', 'Sched. Time'], dtypes=_SCHEDULE_DTYPES)
+
+# Jadwal untuk deteksi/penyelesaian konflik; kolom lain ikut ditulis ke output
+CONFLICT_SCHEDULE = CsvSchema(
+    'conflict_schedule', 'schedule', ['Room', 'Sched. Time'],
+    optional=['Major', 'Subject', 'Lecturer', 'Class', 'Conflict'],
+    dtypes=_SCHEDULE_DTYPES, keep_extra=True,
+)
+
+# Hasil prediksi ketersediaan ruangan (room_file /api/conflict/resolve); Status diubah per sel
+ROOM_AVAILABILITY = CsvSchema(
+    'room_availability', 'room',
+    ['Room', 'Session_Time', 'Status', 'Notes'],
+    dtypes={'Room': 'category', 'Session_Time': 'category', 'Status': 'str', 'Notes': 'category'},
+    keep_extra=True,
+)
+
+LECTURER = CsvSchema(
+    'lecturer', 'lecturer', ['Lecturer Name', 'Lec. Type'], optional=['Notes'],
+    dtypes={'Lecturer Name': 'str', 'Lec. Type': 'category', 'Notes': 'category'},
+)
+
+
+def load_csv(source, schema):
+    """Baca CSV upload sesuai schema; hasil parse CSV di upload store di-cache per schema"""
+    return read_upload(source, parse=schema.read, cache_key=schema.cache_key)
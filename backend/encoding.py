@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class SparseOneHotEncoder:
+    """One-hot encoder dengan vocabulary tetap yang menghasilkan scipy CSR matrix.
+
+    Pengganti pd.get_dummies untuk fitur kategorikal (Room, Sched. Time).
+    Kategori yang tidak ada di vocabulary di-encode sebagai baris nol, sehingga
+    tidak perlu lagi menambah kolom yang hilang secara manual.
+    """
+
+    def __init__(self, columns, dtype=np.float32):
+        self.columns = list(columns)
+        self.dtype = dtype
+        self.vocabulary = {}
+
+    def fit(self, df):
+        """Bangun vocabulary terurut dari nilai unik setiap kolom"""
+        self.vocabulary = {
+            col: pd.Index(df[col].dropna().unique()).sort_values()
+            for col in self.columns
+        }
+        return self
+
+    @property
+    def feature_names(self):
+        """Nama fitur dengan format yang sama seperti pd.get_dummies (Room_A420, ...)"""
+        return [f'{col}_{value}' for col in self.columns for value in self.vocabulary[col]]
+
+    def transform(self, df):
+        if not self.vocabulary:
+            raise ValueError('Encoder has not been fitted')
+
+        n_rows = len(df)
+        row_idx = np.arange(n_rows)
+        rows, cols = [], []
+        offset = 0
+        for col in self.columns:
+            vocab = self.vocabulary[col]
+            codes = vocab.get_indexer(df[col])
+            known = codes >= 0
+            rows.append(row_idx[known])
+            cols.append(codes[known] + offset)
+            offset += len(vocab)
+
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        data = np.ones(len(rows), dtype=self.dtype)
+        return sparse.csr_matrix((data, (rows, cols)), shape=(n_rows, offset))
+
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
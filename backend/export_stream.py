@@ -0,0 +1,230 @@
+"""Export hasil sebagai stream CSV, CSV gzip atau Parquet.
+
+Setiap fungsi mengembalikan generator bytes untuk response Flask yang
+di-stream (chunked), sehingga file hasil atau isi tabel schedule tidak
+pernah dibangun utuh di memori. Parquet butuh pyarrow (opsional); row group
+ditulis per batch dan langsung dikirim ke client.
+"""
+import csv
+import io
+import os
+import zlib
+from importlib.util import find_spec
+
+from instrumentation import METRICS
+
+# format -> (mimetype, ekstensi file)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', '.csv'),
+    'gzip': ('application/gzip', '.csv.gz'),
+    'parquet': ('application/vnd.apache.parquet', '.parquet'),
+}
+EXPORT_CHUNK_SIZE = int(os.environ.get('EXPORT_CHUNK_SIZE', 64 * 1024))
+EXPORT_GZIP_LEVEL = int(os.environ.get('EXPORT_GZIP_LEVEL', 6))
+PARQUET_COMPRESSION = os.environ.get('PARQUET_COMPRESSION', 'zstd')
+# Baris DataFrame yang dikonversi sekaligus saat menulis file hasil
+EXPORT_BATCH_ROWS = int(os.environ.get('EXPORT_BATCH_ROWS', 5000))
+
+
+class ExportError(ValueError):
+    """Format export tidak dikenal atau tidak tersedia"""
+
+
+def check_format(fmt):
+    if fmt not in EXPORT_FORMATS:
+        raise ExportError(f'Invalid format {fmt!r}, expected one of {", ".join(EXPORT_FORMATS)}')
+    if fmt == 'parquet' and find_spec('pyarrow') is None:
+        raise ExportError('Parquet export requires pyarrow (pip install pyarrow)')
+    return fmt
+
+
+def export_filename(name, fmt):
+    """Nama file download: stem `name` + ekstensi format"""
+    return os.path.splitext(name)[0] + EXPORT_FORMATS[fmt][1]
+
+
+def _counted(chunks, fmt):
+    for chunk in chunks:
+        METRICS.inc('export_bytes_total', len(chunk), format=fmt)
+        yield chunk
+
+
+def _gzip(chunks):
+    # wbits=31: header dan trailer gzip, bukan zlib mentah
+    compressor = zlib.compressobj(EXPORT_GZIP_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _file_chunks(path):
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(EXPORT_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _csv_chunks(columns, rows, lineterminator='\r\n'):
+    """Header + baris CSV, dikirim setiap buffer mencapai EXPORT_CHUNK_SIZE"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator=lineterminator)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode('utf-8')
+
+
+class _StreamSink:
+    """File-like tulis-saja untuk ParquetWriter; bytes ditampung sampai diambil generator.
+
+    tell() menghitung total bytes yang sudah ditulis agar offset di footer Parquet benar.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _parquet(batches, schema):
+    """Tulis RecordBatch pyarrow sebagai row group dan kirim setiap row group yang selesai"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sink = _StreamSink()
+    with pq.ParquetWriter(pa.PythonFile(sink, mode='w'), schema, compression=PARQUET_COMPRESSION) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            data = sink.drain()
+            if data:
+                yield data
+    yield sink.drain()  # footer
+
+
+def _csv_file_batches(path):
+    """Baca CSV per blok dengan pyarrow; semua kolom string nullable.
+
+    Tipe tidak ditebak dari blok pertama: kolom yang kosong di blok pertama
+    lalu berisi nilai di blok berikutnya akan gagal di tengah stream, setelah
+    header response 200 terkirim.
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    with open(path, newline='', encoding='utf-8') as f:
+        header = next(csv.reader(f), [])
+    reader = pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=EXPORT_CHUNK_SIZE * 16),
+        # Sel kosong menjadi null seperti pd.read_csv, bukan string kosong
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in header}, strings_can_be_null=True
+        ),
+    )
+    return reader.schema, iter(reader)
+
+
+def _row_batches(rows, batch_size, schema):
+    """Kelompokkan baris (tuple) menjadi RecordBatch pyarrow berisi `batch_size` baris"""
+    import pyarrow as pa
+
+    def to_batch(batch):
+        columns = zip(*batch)
+        return pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, schema)], schema=schema
+        )
+
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield to_batch(batch)
+            batch = []
+    if batch:
+        yield to_batch(batch)
+
+
+def frame_rows(df, batch_size=EXPORT_BATCH_ROWS):
+    """Baris DataFrame sebagai tuple nilai Python (NaN -> None), dikonversi per `batch_size` baris"""
+    for start in range(0, len(df), batch_size):
+        chunk = df.iloc[start:start + batch_size].astype(object)
+        yield from chunk.where(chunk.notna(), None).itertuples(index=False, name=None)
+
+
+def write_frame(df, path, batch_size=EXPORT_BATCH_ROWS):
+    """Tulis DataFrame hasil ke CSV `path` per chunk (format sama dengan to_csv(index=False)).
+
+    Teks CSV tidak pernah dibangun utuh di memori; file ditulis ke file
+    sementara lalu di-rename, jadi download yang berjalan bersamaan tidak
+    pernah membaca file setengah jadi.
+    """
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            # '\n' seperti to_csv, agar file hasil sama persis dengan sebelumnya
+            for chunk in _csv_chunks(list(df.columns), frame_rows(df, batch_size), lineterminator='\n'):
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
+
+
+def export_file(path, fmt='csv'):
+    """Stream file CSV hasil (uploads/) dalam format `fmt`"""
+    check_format(fmt)
+    if fmt == 'parquet':
+        schema, batches = _csv_file_batches(path)
+        chunks = _parquet(batches, schema)
+    elif fmt == 'gzip':
+        chunks = _gzip(_file_chunks(path))
+    else:
+        chunks = _file_chunks(path)
+    return _counted(chunks, fmt)
+
+
+def export_rows(columns, types, rows, fmt='csv', batch_size=1000):
+    """Stream iterable baris (tuple) dengan header `columns` dalam format `fmt`.
+
+    `types` berisi tipe Python per kolom (int atau str) untuk schema Parquet.
+    """
+    check_format(fmt)
+    if fmt == 'parquet':
+        import pyarrow as pa
+
+        schema = pa.schema([(name, pa.int64() if t is int else pa.string()) for name, t in zip(columns, types)])
+        chunks = _parquet(_row_batches(rows, batch_size, schema), schema)
+    elif fmt == 'gzip':
+        chunks = _gzip(_csv_chunks(columns, rows))
+    else:
+        chunks = _csv_chunks(columns, rows)
+    return _counted(chunks, fmt)
@@ -0,0 +1,79 @@
+"""Konfigurasi gunicorn untuk production.
+
+    gunicorn -c gunicorn.conf.py
+    WEB_CONCURRENCY=4 gunicorn -c gunicorn.conf.py
+
+Aplikasi dimuat sekali di master (preload_app), lalu warm_up() meng-import
+modul berat dan memuat model terlatih dari uploads/models sebelum worker
+di-fork. Worker berbagi memori tersebut secara copy-on-write; gc.freeze()
+mencegah garbage collector di worker menyentuh (dan menyalin) halaman memori
+objek warisan master.
+
+Setiap worker punya JobQueue (process pool job async) dan METRICS sendiri,
+jadi /api/metrics menampilkan angka worker yang menjawab request tersebut.
+Job async dicatat dengan pid worker pemiliknya; saat worker keluar (restart
+max_requests, timeout, crash) master menandai job yang belum selesai sebagai
+gagal, bukan tertinggal di status running.
+"""
+import gc
+import os
+
+# Spec aplikasi; bisa juga factory dengan config, mis.
+# GUNICORN_APP="app:create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:////tmp/schedule.db'})"
+wsgi_app = os.environ.get('GUNICORN_APP', 'app:app')
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8787')
+
+# Jumlah worker; default satu per CPU karena endpoint berat CPU-bound (model dan assignment)
+workers = int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+worker_class = 'gthread' if threads > 1 else 'sync'
+# Endpoint sinkron bisa melatih model; job panjang sebaiknya lewat ?async=1
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+# Restart worker setelah N request (0 = tidak pernah) untuk membatasi pertumbuhan memori
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 0))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 0))
+
+preload_app = True
+accesslog = os.environ.get('GUNICORN_ACCESSLOG')  # mis. '-' untuk stdout
+loglevel = os.environ.get('GUNICORN_LOGLEVEL', 'info')
+
+# Thread model (RandomForest n_jobs) dibagi rata antar worker agar tidak oversubscribe CPU.
+# Harus di-set sebelum app di-load karena execution.MODEL_N_JOBS dibaca saat import.
+os.environ.setdefault('MODEL_N_JOBS', str(max(1, (os.cpu_count() or 1) // workers)))
+
+
+def _flask_app(server):
+    # wsgi() mengembalikan app yang sudah di-load (preload_app)
+    return server.app.wsgi()
+
+
+def on_starting(server):
+    """Master: tandai job dari proses sebelumnya gagal dan siapkan state bersama sebelum fork"""
+    from app import warm_up
+
+    app = _flask_app(server)
+    app.extensions['job_queue'].store.fail_unfinished('server restarted')
+    models = warm_up(app)
+    server.log.info('Preloaded %d model(s) from %s', len(models), app.config['MODEL_FOLDER'])
+
+    # Objek yang sudah ada dipindah ke generasi permanen: GC di worker tidak menulis ke halamannya
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """Worker: jangan pakai koneksi database milik master"""
+    from models import db
+
+    app = _flask_app(server)
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    """Master: job milik worker yang keluar tidak akan diselesaikan oleh worker lain"""
+    failed = _flask_app(server).extensions['job_queue'].store.fail_owned(worker.pid, 'web worker exited')
+    if failed:
+        server.log.warning('Marked %d job(s) of worker %s as failed', failed, worker.pid)
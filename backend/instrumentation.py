@@ -0,0 +1,232 @@
+"""Metrics proses dan profiling per request.
+
+METRICS menyimpan counter, histogram durasi dan gauge peak memory di memori
+proses dan dirender dalam format teks Prometheus untuk /api/metrics. Durasi
+setiap fase PhaseTimer (parse, encode, fit, predict, ...) otomatis dicatat
+sebagai stage_duration_seconds. Worker job mengirim snapshot metrics-nya ke
+proses Flask lewat hasil future (lihat jobs.run_job).
+"""
+import cProfile
+import math
+import os
+import pstats
+import resource
+import threading
+import time
+import tracemalloc
+
+# ?profile=1 di semua endpoint; set 0 untuk mematikan di production
+PROFILE_ENABLED = os.environ.get('PROFILE_ENABLED', '0') == '1'
+PROFILE_TOP = int(os.environ.get('PROFILE_TOP', 25))
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, math.inf)
+
+METRIC_HELP = {
+    'http_requests_total': 'HTTP requests by endpoint, method and status',
+    'http_request_duration_seconds': 'HTTP request latency by endpoint',
+    'stage_duration_seconds': 'Duration of processing stages (parse, encode, fit, predict, assign, ...)',
+    'jobs_total': 'Finished background jobs by kind and status',
+    'job_duration_seconds': 'Background job run time by kind',
+    'lecturer_can_assign_calls_total': 'Lecturer constraint checks in the greedy assignment loop',
+    'lecturer_unassigned_total': 'Subjects left without a lecturer',
+    'room_assign_retries_total': 'Room picks discarded because the room had no free session',
+    'room_assign_fallbacks_total': 'Classes placed in a general room because their major rooms were full',
+    'room_assign_unassigned_total': 'Classes left without a room and session',
+    'schedule_rows_ingested_total': 'Schedule rows written to the database',
+    'export_bytes_total': 'Bytes streamed by result and schedule exports by format',
+    'db_pool_checkouts_total': 'Connections checked out of the SQLAlchemy pool',
+    'db_pool_checkout_wait_seconds': 'Time spent waiting for a pooled database connection',
+    'db_pool_timeouts_total': 'Checkouts that gave up after DB_POOL_TIMEOUT',
+    'db_pool_overflow_checkouts_total': 'Checkouts served by an overflow connection above DB_POOL_SIZE',
+    'db_pool_connections_created_total': 'New database connections opened by the pool',
+    'db_pool_invalidated_total': 'Pooled connections discarded after an error or failed pre-ping',
+    'db_pool_checked_out_max': 'Most connections checked out at the same time',
+    'db_pool_size': 'Configured pool size',
+    'db_pool_checked_out': 'Connections currently checked out',
+    'db_pool_checked_in': 'Idle connections in the pool',
+    'db_pool_overflow': 'Overflow connections currently open',
+    'process_max_rss_bytes': 'Peak resident set size of the process',
+    'job_worker_max_rss_bytes': 'Peak resident set size of job worker processes',
+}
+
+
+def max_rss_bytes():
+    """Peak RSS proses ini (ru_maxrss dalam KB di Linux)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _label_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (f'{name}="{value}"'.replace('\n', ' ') for name, value in pairs)
+    return '{' + ','.join(escaped) + '}'
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metrics:
+    """Counter, histogram dan gauge (nilai terakhir atau maksimum) thread-safe di memori proses"""
+
+    def __init__(self, buckets=DURATION_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+        self.gauges = {}
+
+    def inc(self, name, value=1, **labels):
+        if not value:
+            return
+        key = (name, _label_key(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram['buckets'][i] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self.gauges[(name, _label_key(labels))] = value
+
+    def set_max(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self.gauges[key] = max(self.gauges.get(key, value), value)
+
+    def snapshot(self, reset=False):
+        """Salinan semua metrics (bisa di-pickle); reset=True mengosongkan metrics proses ini"""
+        with self._lock:
+            snapshot = {
+                'counters': dict(self.counters),
+                'histograms': {key: {**h, 'buckets': list(h['buckets'])} for key, h in self.histograms.items()},
+                'gauges': dict(self.gauges),
+            }
+            if reset:
+                self.counters, self.histograms, self.gauges = {}, {}, {}
+        return snapshot
+
+    def merge(self, snapshot):
+        """Tambahkan snapshot dari proses lain (counter/histogram dijumlah, gauge diambil maksimum)"""
+        with self._lock:
+            for key, value in snapshot['counters'].items():
+                self.counters[key] = self.counters.get(key, 0) + value
+            for key, other in snapshot['histograms'].items():
+                histogram = self.histograms.setdefault(
+                    key, {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+                )
+                histogram['buckets'] = [a + b for a, b in zip(histogram['buckets'], other['buckets'])]
+                histogram['sum'] += other['sum']
+                histogram['count'] += other['count']
+            for key, value in snapshot['gauges'].items():
+                self.gauges[key] = max(self.gauges.get(key, value), value)
+
+    def render(self):
+        """Format teks Prometheus (text/plain; version=0.0.4)"""
+        self.set_max('process_max_rss_bytes', max_rss_bytes())
+        snapshot = self.snapshot()
+        families = {}
+        for kind in ('counters', 'gauges', 'histograms'):
+            for (name, labels), value in snapshot[kind].items():
+                families.setdefault(name, (kind, []))[1].append((labels, value))
+
+        lines = []
+        for name in sorted(families):
+            kind, samples = families[name]
+            if name in METRIC_HELP:
+                lines.append(f'# HELP {name} {METRIC_HELP[name]}')
+            lines.append(f'# TYPE {name} {kind[:-1]}')
+            for labels, value in sorted(samples):
+                if kind != 'histograms':
+                    lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+                    continue
+                for bound, count in zip(self.buckets, value['buckets']):
+                    lines.append(f'{name}_bucket{_format_labels(labels, [("le", _format_value(bound))])} {count}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(round(value["sum"], 6))}')
+                lines.append(f'{name}_count{_format_labels(labels)} {value["count"]}')
+        return '\n'.join(lines) + '\n'
+
+
+METRICS = Metrics()
+
+
+class RequestProfile:
+    """cProfile + tracemalloc untuk satu request (?profile=1).
+
+    cProfile hanya merekam thread request ini; tracemalloc bersifat global,
+    jadi peak memory ikut menghitung request lain yang berjalan bersamaan.
+    Hanya satu profil per proses pada satu waktu (tracemalloc global, dan
+    cProfile di Python 3.12+ menolak dua profiler aktif): start() mengembalikan
+    False jika profil lain sedang berjalan.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, top=PROFILE_TOP):
+        self.top = top
+        self.profiler = cProfile.Profile()
+        self._owns_tracemalloc = False
+        self._running = False
+
+    def start(self):
+        if not self._lock.acquire(blocking=False):
+            return False
+        self._running = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        tracemalloc.reset_peak()
+        self.start_time = time.perf_counter()
+        self.profiler.enable()
+        return True
+
+    def release(self):
+        """Hentikan cProfile/tracemalloc tanpa ringkasan (request gagal sebelum after_request)"""
+        if not self._running:
+            return
+        self._running = False
+        self.profiler.disable()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+        self._lock.release()
+
+    def stop(self):
+        """Hentikan profiling dan kembalikan ringkasan (wall time, peak memory, fungsi terberat)"""
+        self.profiler.disable()
+        wall = time.perf_counter() - self.start_time
+        _, peak = tracemalloc.get_traced_memory()
+        self.release()
+
+        stats = pstats.Stats(self.profiler).stats
+        rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:self.top]
+        return {
+            'wall_seconds': round(wall, 4),
+            'peak_memory_mb': round(peak / 2 ** 20, 2),
+            'sort': 'cumulative',
+            'functions': [
+                {
+                    'function': f'{os.path.basename(filename)}:{line}({function})',
+                    'calls': calls,
+                    'total_seconds': round(total, 4),
+                    'cumulative_seconds': round(cumulative, 4),
+                }
+                for (filename, line, function), (_, calls, total, cumulative, _) in rows
+            ],
+        }
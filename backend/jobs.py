@@ -0,0 +1,179 @@
+import json
+import multiprocessing
+import os
+import sqlite3
+import time
+import traceback
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from instrumentation import METRICS, max_rss_bytes
+
+# Jumlah proses worker job (pandas/sklearn tidak terikat GIL request thread)
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))
+
+
+def _json_default(value):
+    """numpy scalar -> tipe Python agar payload task bisa disimpan sebagai JSON"""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class JobStore:
+    """Tabel job di SQLite; setiap operasi membuka koneksi sendiri sehingga aman dipakai lintas proses.
+
+    owner_pid adalah proses (worker gunicorn) yang memegang ProcessPoolExecutor
+    job tersebut; jika proses itu mati, job-nya tidak akan pernah selesai.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                ' id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL,'
+                ' progress REAL NOT NULL DEFAULT 0, stage TEXT, params TEXT,'
+                ' result TEXT, status_code INTEGER, error TEXT,'
+                ' created_at REAL, started_at REAL, finished_at REAL, owner_pid INTEGER)'
+            )
+            columns = {row['name'] for row in conn.execute('PRAGMA table_info(jobs)')}
+            if 'owner_pid' not in columns:
+                conn.execute('ALTER TABLE jobs ADD COLUMN owner_pid INTEGER')
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def create(self, kind, params):
+        job_id = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO jobs (id, kind, status, params, created_at, owner_pid) VALUES (?, ?, ?, ?, ?, ?)',
+                (job_id, kind, 'queued', json.dumps(params, default=_json_default), time.time(), os.getpid()),
+            )
+        return job_id
+
+    def update(self, job_id, **fields):
+        if 'result' in fields:
+            fields['result'] = json.dumps(fields['result'], default=_json_default)
+        columns = ', '.join(f'{name} = ?' for name in fields)
+        with self._connect() as conn:
+            conn.execute(f'UPDATE jobs SET {columns} WHERE id = ?', (*fields.values(), job_id))
+
+    def get(self, job_id):
+        """Dict job (result sudah di-decode) atau None"""
+        with self._connect() as conn:
+            row = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job['params'] = json.loads(job['params']) if job['params'] else {}
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        return job
+
+    def fail_unfinished(self, reason):
+        """Tandai job queued/running dari proses sebelumnya sebagai gagal (worker-nya sudah mati)"""
+        with self._connect() as conn:
+            return conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE status IN ('queued', 'running')",
+                (reason, time.time()),
+            ).rowcount
+
+    def fail_owned(self, owner_pid, reason):
+        """Tandai job queued/running milik proses `owner_pid` (yang sudah keluar) sebagai gagal.
+
+        Proses pool yang masih hidup setelah pemiliknya mati tetap boleh
+        menimpa status ini dengan hasil akhirnya.
+        """
+        with self._connect() as conn:
+            return conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, finished_at = ?"
+                " WHERE owner_pid = ? AND status IN ('queued', 'running')",
+                (reason, time.time(), owner_pid),
+            ).rowcount
+
+
+def run_job(store_path, job_id, kind, params):
+    """Dijalankan di proses worker: eksekusi task dan simpan progress/hasil ke JobStore.
+
+    Mengembalikan snapshot METRICS worker sejak job sebelumnya; JobQueue
+    menggabungkannya ke METRICS proses Flask agar terlihat di /api/metrics.
+    """
+    from tasks import TASKS
+
+    store = JobStore(store_path)
+    store.update(job_id, status='running', started_at=time.time())
+    start = time.perf_counter()
+
+    def progress(fraction, stage):
+        store.update(job_id, progress=fraction, stage=stage)
+
+    try:
+        payload, status_code = TASKS[kind](**params, progress=progress)
+    except Exception as e:
+        store.update(job_id, status='failed', error=str(e), result={'error': traceback.format_exc()},
+                     status_code=500, finished_at=time.time())
+        return _finish_metrics(kind, 'failed', start)
+    store.update(
+        job_id,
+        status='finished' if status_code < 400 else 'failed',
+        progress=1.0,
+        stage='done',
+        result=payload,
+        status_code=status_code,
+        error=payload.get('error') if status_code >= 400 else None,
+        finished_at=time.time(),
+    )
+    return _finish_metrics(kind, 'finished' if status_code < 400 else 'failed', start)
+
+
+def _finish_metrics(kind, status, start):
+    METRICS.observe('job_duration_seconds', time.perf_counter() - start, kind=kind)
+    METRICS.inc('jobs_total', kind=kind, status=status)
+    METRICS.set_max('job_worker_max_rss_bytes', max_rss_bytes())
+    return METRICS.snapshot(reset=True)
+
+
+class JobQueue:
+    """Antrian job lokal: JobStore SQLite + ProcessPoolExecutor, tanpa broker eksternal"""
+
+    def __init__(self, store_path, max_workers=JOB_WORKERS):
+        self.store = JobStore(store_path)
+        self.max_workers = max_workers
+        self._executor = None
+
+    def _pool(self):
+        # Pool dibuat saat job pertama; 'spawn' agar worker tidak mewarisi
+        # koneksi database dan thread milik proses Flask
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._executor
+
+    def submit(self, kind, **params):
+        job_id = self.store.create(kind, params)
+        future = self._pool().submit(run_job, self.store.path, job_id, kind, params)
+        future.add_done_callback(lambda f: self._on_done(job_id, kind, f))
+        return job_id
+
+    def _on_done(self, job_id, kind, future):
+        # Worker mati (mis. kehabisan memori) sebelum run_job sempat mencatat hasil
+        error = future.exception()
+        if error is not None:
+            self.store.update(job_id, status='failed', error=f'worker crashed: {error}', finished_at=time.time())
+            METRICS.inc('jobs_total', kind=kind, status='crashed')
+            return
+        METRICS.merge(future.result())
+
+    def get(self, job_id):
+        return self.store.get(job_id)
+
+    def shutdown(self, wait=True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
@@ -0,0 +1,189 @@
+import random
+from collections import defaultdict
+
+import pandas as pd
+
+from instrumentation import METRICS
+from lecturer_rules import LecturerAvailability
+
+# Batas beban dosen per tipe
+MAX_DAILY_CREDITS = {'Full': 12, 'Part': 6}
+MAX_WORKING_DAYS = {'Full': 5, 'Part': 2}
+
+
+def extract_day_from_schedule(schedule_time):
+    """Extract day from schedule time format like 'Wed14:30-17:15'"""
+    try:
+        if pd.isna(schedule_time) or schedule_time == '':
+            return None
+
+        # Extract day part (first 3 characters)
+        day = schedule_time[:3]
+        return day
+    except:
+        return None
+
+
+def extract_session_from_schedule(schedule_time):
+    """Extract session number from schedule time format like 'Thu3' -> 3"""
+    try:
+        return int(schedule_time[3:])
+    except (TypeError, ValueError):
+        return None
+
+
+class LecturerWorkloadIndex:
+    """Beban kerja setiap dosen yang diperbarui secara incremental.
+
+    Menyimpan kredit per hari, total kredit/jumlah mata kuliah dan sesi yang
+    sudah terisi per dosen, sehingga pengecekan constraint tidak perlu
+    memfilter ulang DataFrame hasil assignment.
+    """
+
+    def __init__(self):
+        self.credits_per_day = defaultdict(dict)  # lecturer -> {day: credits}
+        self.sessions_per_day = defaultdict(lambda: defaultdict(set))  # lecturer -> {day: {session}}
+        self.total_credits = defaultdict(float)
+        self.subjects = defaultdict(int)
+
+    def can_assign(self, lecturer_name, lecturer_type, new_day, new_credits, new_session=None):
+        """Cek batas kredit harian, batas hari kerja dan kelas berurutan"""
+        current_credits_per_day = self.credits_per_day[lecturer_name]
+
+        # Check daily credit limit
+        current_day_credits = current_credits_per_day.get(new_day, 0)
+        max_daily_credits = MAX_DAILY_CREDITS.get(lecturer_type, MAX_DAILY_CREDITS['Part'])
+        if current_day_credits + new_credits > max_daily_credits:
+            return False, f"Daily credit limit exceeded ({current_day_credits + new_credits} > {max_daily_credits})"
+
+        # Check weekly working days limit
+        working_days = len([day for day, credits in current_credits_per_day.items() if credits > 0])
+        if new_day not in current_credits_per_day:
+            working_days += 1
+
+        max_working_days = MAX_WORKING_DAYS.get(lecturer_type, MAX_WORKING_DAYS['Part'])
+        if working_days > max_working_days:
+            return False, f"Working days limit exceeded ({working_days} > {max_working_days})"
+
+        # Check consecutive classes on the same day
+        if new_session is not None:
+            existing_sessions = self.sessions_per_day[lecturer_name].get(new_day, ())
+            if new_session - 1 in existing_sessions or new_session + 1 in existing_sessions:
+                return False, "Cannot assign consecutive classes on the same day"
+
+        return True, "OK"
+
+    def add(self, lecturer_name, day, credits, session=None):
+        """Catat assignment baru ke index"""
+        day_credits = self.credits_per_day[lecturer_name]
+        day_credits[day] = day_credits.get(day, 0) + credits
+        if session is not None:
+            self.sessions_per_day[lecturer_name][day].add(session)
+        self.total_credits[lecturer_name] += credits
+        self.subjects[lecturer_name] += 1
+
+    def summary(self, lecturer_type_map):
+        """Ringkasan beban per dosen yang mendapat assignment"""
+        return {
+            lecturer: {
+                'type': lecturer_type_map[lecturer],
+                'working_days': len(days),
+                'total_credits': self.total_credits[lecturer],
+                'total_subjects': self.subjects[lecturer],
+                'days_list': list(days)
+            }
+            for lecturer, days in self.credits_per_day.items()
+        }
+
+
+def can_assign_lecturer(workload, availability, lecturer_name, lecturer_type, schedule_time, new_day, new_credits, new_session):
+    """Check if lecturer can be assigned based on constraints, including no consecutive classes"""
+
+    # Check the lecturer's availability based on Notes (satu bit test)
+    if not availability.is_available(lecturer_name, schedule_time):
+        return False, f"Lecturer is not available at {schedule_time}"
+
+    # Daily credit limit, weekly working days limit, consecutive classes (O(1) dari index)
+    return workload.can_assign(lecturer_name, lecturer_type, new_day, new_credits, new_session)
+
+
+def assign_lecturers_to_schedule(schedule_df, lecturer_df, availability=None):
+    """Main function to assign lecturers to schedule.
+
+    `availability` adalah LecturerAvailability hasil compile Notes; jika tidak
+    diberikan, Notes di lecturer_df di-compile di sini.
+    """
+    try:
+        if availability is None:
+            availability = LecturerAvailability.from_dataframe(lecturer_df)
+
+        # Create a copy of schedule dataframe
+        result_df = schedule_df.copy()
+        result_df['Lecturer'] = None
+
+        # Create lecturer pools
+        full_lecturers = lecturer_df[lecturer_df['Lec. Type'] == 'Full']['Lecturer Name'].tolist()
+        part_lecturers = lecturer_df[lecturer_df['Lec. Type'] == 'Part']['Lecturer Name'].tolist()
+
+        # Create lecturer type mapping
+        lecturer_type_map = dict(zip(lecturer_df['Lecturer Name'], lecturer_df['Lec. Type']))
+
+        # Beban kerja dosen, diperbarui setiap kali assignment berhasil
+        workload = LecturerWorkloadIndex()
+
+        # Statistics tracking
+        assignment_stats = {
+            'total_subjects': len(result_df),
+            'assigned': 0,
+            'unassigned': 0
+        }
+
+        # Sort schedule by credits (descending) to assign high-credit subjects first
+        sorted_rows = result_df.sort_values('Cr', ascending=False)[['Cr', 'Sched. Time']]
+        assigned_lecturers = {}
+        checks = 0  # Jumlah pemanggilan can_assign_lecturer, dicatat ke METRICS sekali di akhir
+
+        for idx, subject_credits, schedule_time in sorted_rows.itertuples(name=None):
+            # Extract day and session from schedule
+            day = extract_day_from_schedule(schedule_time)
+            if not day:
+                continue
+            session = extract_session_from_schedule(schedule_time)
+
+            # Try to assign lecturer
+            assigned = False
+
+            # First try full-time lecturers (they have more capacity)
+            lecturers_to_try = full_lecturers + part_lecturers
+            random.shuffle(lecturers_to_try)  # Randomize for fair distribution
+
+            for lecturer in lecturers_to_try:
+                lecturer_type = lecturer_type_map[lecturer]
+                checks += 1
+
+                can_assign, reason = can_assign_lecturer(
+                    workload, availability, lecturer, lecturer_type, schedule_time, day, subject_credits, session
+                )
+
+                if can_assign:
+                    assigned_lecturers[idx] = lecturer
+                    workload.add(lecturer, day, subject_credits, session)
+                    assignment_stats['assigned'] += 1
+                    assigned = True
+                    break
+
+            if not assigned:
+                assignment_stats['unassigned'] += 1
+
+        METRICS.inc('lecturer_can_assign_calls_total', checks)
+        METRICS.inc('lecturer_unassigned_total', assignment_stats['unassigned'])
+        result_df['Lecturer'] = pd.Series(assigned_lecturers, dtype=object).reindex(result_df.index)
+
+        # Prepare final statistics
+        assignment_stats['lecturer_summary'] = workload.summary(lecturer_type_map)
+        assignment_stats['notes_issues'] = availability.issues
+
+        return result_df, assignment_stats
+
+    except Exception as e:
+        raise Exception(f"Error in lecturer assignment: {str(e)}")
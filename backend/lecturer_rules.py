@@ -0,0 +1,118 @@
+import re
+
+import pandas as pd
+
+from timeslots import ALL_SLOTS_MASK, DAYS, SLOT_INDEX, slots_mask
+
+# Token Notes yang berarti tidak ada batasan waktu
+NO_RESTRICTION = {'', 'general'}
+
+_NO_DAY = re.compile(r'^No (Mon|Tue|Wed|Thu|Fri)$')
+_NO_SLOT = re.compile(r'^No (Mon|Tue|Wed|Thu|Fri)(\d+)$')
+_NO_SESSION = re.compile(r'^No Session(\d+)$')
+_DAY_RANGE = re.compile(r'^(Mon|Tue|Wed|Thu|Fri)-(Mon|Tue|Wed|Thu|Fri)$')
+_SESSION_RANGE = re.compile(r'^Session(\d+)-Session(\d+)$')
+
+
+def compile_note(note):
+    """Ubah satu token Notes menjadi bitmask slot yang diblokir; None jika token tidak dikenali.
+
+    Format yang didukung:
+      'No Mon'             -> seluruh hari Senin diblokir
+      'No Mon1'            -> hanya slot Mon1 diblokir
+      'No Session1'        -> sesi 1 di semua hari diblokir
+      'Mon-Wed'            -> hanya boleh Senin s/d Rabu
+      'Session2-Session4'  -> sesi 2 s/d 4 di semua hari diblokir
+    """
+    note = note.strip()
+    if note in NO_RESTRICTION:
+        return 0
+
+    match = _NO_DAY.match(note)
+    if match:
+        return slots_mask(lambda day, session: day == match.group(1))
+
+    match = _NO_SLOT.match(note)
+    if match:
+        slot = f'{match.group(1)}{match.group(2)}'
+        return 1 << SLOT_INDEX[slot] if slot in SLOT_INDEX else 0
+
+    match = _NO_SESSION.match(note)
+    if match:
+        return slots_mask(lambda day, session: session == int(match.group(1)))
+
+    match = _DAY_RANGE.match(note)
+    if match:
+        start, end = DAYS.index(match.group(1)), DAYS.index(match.group(2))
+        return slots_mask(lambda day, session: not (start <= DAYS.index(day) <= end))
+
+    match = _SESSION_RANGE.match(note)
+    if match:
+        start, end = int(match.group(1)), int(match.group(2))
+        return slots_mask(lambda day, session: start <= session <= end)
+
+    return None
+
+
+class LecturerAvailability:
+    """Bitmask ketersediaan per dosen atas slot di time_mapping, di-compile sekali dari Notes.
+
+    Bit i bernilai 1 jika dosen boleh mengajar di slot ke-i. Token Notes yang
+    tidak dikenali (misalnya batasan gedung 'No B4') diabaikan dan dicatat di
+    `issues` agar bisa dilaporkan sebelum assignment dimulai.
+
+    Slot di luar time_mapping (mis. Fri3) tidak punya bit, jadi hanya dosen di
+    `unrestricted` (tanpa aturan waktu sama sekali) yang boleh mengajar di
+    sana; aturan seperti 'No Fri3' tidak mengubah mask tetapi tetap membatasi.
+    """
+
+    def __init__(self, masks, issues=None, unrestricted=None):
+        self.masks = masks
+        self.issues = issues or []
+        if unrestricted is None:
+            unrestricted = {lecturer for lecturer, mask in masks.items() if mask == ALL_SLOTS_MASK}
+        self.unrestricted = unrestricted
+
+    @classmethod
+    def from_dataframe(cls, lecturer_df):
+        masks = {}
+        issues = []
+        unrestricted = set()
+        has_notes = 'Notes' in lecturer_df.columns
+        notes_values = lecturer_df['Notes'] if has_notes else [None] * len(lecturer_df)
+
+        for lecturer, notes in zip(lecturer_df['Lecturer Name'], notes_values):
+            if lecturer in masks:
+                continue  # Baris pertama yang dipakai jika nama dosen duplikat
+
+            blocked = 0
+            restricted = False
+            if isinstance(notes, str) and not pd.isna(notes):
+                for note in notes.split(','):
+                    note_mask = compile_note(note)
+                    if note_mask is None:
+                        issues.append({
+                            'lecturer': lecturer,
+                            'note': note.strip(),
+                            'reason': 'Unrecognized availability rule, ignored'
+                        })
+                        continue
+                    blocked |= note_mask
+                    restricted = restricted or note.strip() not in NO_RESTRICTION
+            masks[lecturer] = ALL_SLOTS_MASK & ~blocked
+            if not restricted:
+                unrestricted.add(lecturer)
+
+        return cls(masks, issues, unrestricted)
+
+    def allows_unmapped(self, lecturer_name):
+        """Boleh mengajar di slot yang tidak ada di time_mapping (dosen tanpa aturan waktu)"""
+        return lecturer_name not in self.masks or lecturer_name in self.unrestricted
+
+    def is_available(self, lecturer_name, sched_time):
+        mask = self.masks.get(lecturer_name, ALL_SLOTS_MASK)
+        slot = SLOT_INDEX.get(sched_time)
+        if slot is None:
+            # Slot di luar time_mapping hanya untuk dosen tanpa batasan waktu
+            return self.allows_unmapped(lecturer_name)
+        return bool(mask >> slot & 1)
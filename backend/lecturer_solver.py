@@ -0,0 +1,307 @@
+import time
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+from lecturer_assignment import (
+    MAX_DAILY_CREDITS,
+    MAX_WORKING_DAYS,
+    LecturerWorkloadIndex,
+    assign_lecturers_to_schedule,
+    extract_day_from_schedule,
+    extract_session_from_schedule,
+)
+from lecturer_rules import LecturerAvailability
+from timeslots import ALL_SLOTS_MASK, DAYS, SLOT_INDEX
+
+DEFAULT_TIME_BUDGET = 30.0
+# Jumlah dosen per mata kuliah tanpa dosen yang penempatan greedy-nya di hari itu ikut dioptimalkan ulang
+RELEASE_PER_SUBJECT = 3
+
+
+class _ConstraintRows:
+    """Pengumpul baris constraint sparse: lb <= A x <= ub"""
+
+    def __init__(self):
+        self.rows, self.cols, self.vals = [], [], []
+        self.lb, self.ub = [], []
+
+    def add(self, cols, vals, lb, ub):
+        row = len(self.lb)
+        self.rows.extend([row] * len(cols))
+        self.cols.extend(cols)
+        self.vals.extend(vals)
+        self.lb.append(lb)
+        self.ub.append(ub)
+
+    def build(self, n_vars):
+        A = sparse.csr_matrix((self.vals, (self.rows, self.cols)), shape=(len(self.lb), n_vars))
+        return LinearConstraint(A, self.lb, self.ub)
+
+
+class _Capacity:
+    """Sisa kapasitas dosen dari `workload` dalam bentuk array numpy (dosen x hari x sesi)"""
+
+    def __init__(self, subjects, lecturers, lecturer_type_map, availability, workload):
+        self.days = list(dict.fromkeys(DAYS + [subject[3] for subject in subjects]))
+        day_index = {day: i for i, day in enumerate(self.days)}
+        self.max_session = max([subject[4] for subject in subjects] + [
+            session for sessions in workload.sessions_per_day.values() for day_sessions in sessions.values()
+            for session in day_sessions
+        ])
+
+        types = [lecturer_type_map[lecturer] for lecturer in lecturers]
+        self.daily_cap = np.array([MAX_DAILY_CREDITS.get(t, MAX_DAILY_CREDITS['Part']) for t in types], dtype=float)
+        self.max_days = np.array([MAX_WORKING_DAYS.get(t, MAX_WORKING_DAYS['Part']) for t in types])
+        self.masks = np.array(
+            [availability.masks.get(lecturer, ALL_SLOTS_MASK) for lecturer in lecturers], dtype=np.int64
+        )
+        self.unmapped_ok = np.array([availability.allows_unmapped(lecturer) for lecturer in lecturers], dtype=bool)
+
+        self.used_credits = np.zeros((len(lecturers), len(self.days)))
+        self.occupied = np.zeros((len(lecturers), len(self.days), self.max_session + 2), dtype=bool)
+        for l, lecturer in enumerate(lecturers):
+            for day, credits in workload.credits_per_day.get(lecturer, {}).items():
+                self.used_credits[l, day_index[day]] = credits
+            for day, sessions in workload.sessions_per_day.get(lecturer, {}).items():
+                self.occupied[l, day_index[day], list(sessions)] = True
+        self.used_days = (self.used_credits > 0).sum(axis=1)
+
+        self.credits = np.array([subject[1] for subject in subjects], dtype=float)
+        self.day_idx = np.array([day_index[subject[3]] for subject in subjects])
+        self.session = np.array([subject[4] for subject in subjects])
+        self.slot = np.array([SLOT_INDEX.get(subject[2], -1) for subject in subjects])
+
+    def notes_ok(self):
+        """subject x dosen: Notes mengizinkan slot dan SKS muat dalam batas kredit harian tipe dosen"""
+        # Slot di luar time_mapping hanya untuk dosen tanpa batasan waktu
+        by_notes = np.where(
+            (self.slot >= 0)[:, None],
+            (self.masks[None, :] >> np.maximum(self.slot, 0)[:, None]) & 1 == 1,
+            self.unmapped_ok[None, :],
+        )
+        return by_notes & (self.credits[:, None] <= self.daily_cap[None, :])
+
+    def day_load(self):
+        """subject x dosen: kredit yang sudah dipakai dosen pada hari mata kuliah"""
+        return self.used_credits[:, self.day_idx].T
+
+    def eligible(self):
+        """subject x dosen: semua constraint terpenuhi dengan beban saat ini"""
+        load = self.day_load()
+        eligible = self.notes_ok() & (self.credits[:, None] <= self.daily_cap[None, :] - load)
+        # Hari baru hanya jika batas hari kerja belum tercapai
+        eligible &= (load > 0) | (self.used_days < self.max_days)[None, :]
+        # Tidak berurutan dengan sesi yang sudah terisi
+        for offset in (-1, 1):
+            sessions = np.clip(self.session + offset, 0, self.max_session + 1)
+            eligible &= ~self.occupied[:, self.day_idx, sessions].T
+        return eligible
+
+
+def _released_placements(unassigned, placed, lecturers, lecturer_type_map, availability, workload, per_subject):
+    """Penempatan greedy yang dilepas agar mata kuliah tanpa dosen bisa masuk ke model.
+
+    Untuk setiap mata kuliah tanpa dosen dipilih `per_subject` dosen yang
+    boleh mengajar di slot tersebut menurut Notes tetapi sudah punya beban di
+    hari itu (beban terkecil lebih dulu); semua mata kuliah dosen tersebut pada
+    hari itu dilepas dan ikut dioptimalkan ulang.
+    """
+    capacity = _Capacity(unassigned, lecturers, lecturer_type_map, availability, workload)
+    load = capacity.day_load()
+    candidates = capacity.notes_ok() & (load > 0)
+    released_keys = set()
+    for u, subject in enumerate(unassigned):
+        options = np.flatnonzero(candidates[u])
+        for l in options[np.argsort(load[u, options], kind='stable')[:per_subject]]:
+            released_keys.add((lecturers[l], subject[3]))
+    return [p for p in placed if (p[5], p[3]) in released_keys]
+
+
+def _solve_milp(subjects, lecturers, lecturer_type_map, availability, workload, deadline):
+    """Integer program untuk `subjects` dengan sisa kapasitas dosen (`workload`).
+
+    Waktu membangun model dihitung sampai `deadline` (time.perf_counter());
+    jika sudah lewat, solver tidak dijalankan. Hasil ({subject_idx: lecturer}, status solver).
+    """
+    # Variabel x[s, l] hanya untuk pasangan yang lolos Notes dan sisa kapasitas (dihitung dengan numpy)
+    capacity = _Capacity(subjects, lecturers, lecturer_type_map, availability, workload)
+    subject_ids, lecturer_ids = np.nonzero(capacity.eligible())
+    if len(subject_ids) == 0:
+        return {}, 'no feasible pairs'
+    pairs = [(s, lecturers[l]) for s, l in zip(subject_ids.tolist(), lecturer_ids.tolist())]
+
+    # Variabel y[l, d]: dosen l mulai bekerja pada hari baru d (hari yang sudah dipakai tidak perlu variabel)
+    day_vars = {}
+    for s, lecturer in pairs:
+        key = (lecturer, subjects[s][3])
+        if key not in day_vars and not workload.credits_per_day.get(lecturer, {}).get(key[1]):
+            day_vars[key] = len(pairs) + len(day_vars)
+    n_vars = len(pairs) + len(day_vars)
+
+    by_subject = defaultdict(list)
+    by_lecturer_day = defaultdict(list)
+    by_lecturer_slot = defaultdict(list)
+    for x, (s, lecturer) in enumerate(pairs):
+        _, _, _, day, session = subjects[s]
+        by_subject[s].append(x)
+        by_lecturer_day[lecturer, day].append(x)
+        by_lecturer_slot[lecturer, day, session].append(x)
+
+    constraints = _ConstraintRows()
+
+    # Setiap mata kuliah maksimal satu dosen
+    for xs in by_subject.values():
+        constraints.add(xs, [1] * len(xs), 0, 1)
+
+    for (lecturer, day), xs in by_lecturer_day.items():
+        # Sisa kredit harian (Full 12 / Part 6 dikurangi beban yang tetap)
+        cap = MAX_DAILY_CREDITS.get(lecturer_type_map[lecturer], MAX_DAILY_CREDITS['Part'])
+        cap -= workload.credits_per_day.get(lecturer, {}).get(day, 0)
+        constraints.add(xs, [subjects[pairs[x][0]][1] for x in xs], 0, cap)
+        # x[s, l] pada hari baru hanya boleh 1 jika y[l, d] = 1
+        y = day_vars.get((lecturer, day))
+        if y is not None:
+            constraints.add(xs + [y], [1] * len(xs) + [-len(xs)], -np.inf, 0)
+
+    # Sisa jumlah hari kerja per minggu (Full 5 / Part 2 dikurangi hari yang sudah dipakai)
+    days_by_lecturer = defaultdict(list)
+    for (lecturer, day), y in day_vars.items():
+        days_by_lecturer[lecturer].append(y)
+    for lecturer, ys in days_by_lecturer.items():
+        max_days = MAX_WORKING_DAYS.get(lecturer_type_map[lecturer], MAX_WORKING_DAYS['Part'])
+        used_days = sum(1 for credits in workload.credits_per_day.get(lecturer, {}).values() if credits > 0)
+        constraints.add(ys, [1] * len(ys), 0, max_days - used_days)
+
+    # Tidak boleh kelas di sesi berurutan pada hari yang sama (sesi yang sama boleh, seperti greedy):
+    # jika salah satu x di sesi s = 1, semua x di sesi s + 1 harus 0
+    for (lecturer, day, session), xs in by_lecturer_slot.items():
+        next_xs = by_lecturer_slot.get((lecturer, day, session + 1), [])
+        for x in xs if next_xs else ():
+            constraints.add([x] + next_xs, [len(next_xs)] + [1] * len(next_xs), 0, len(next_xs))
+
+    # Waktu membangun model ikut dihitung dalam time budget
+    remaining = deadline - time.perf_counter()
+    if remaining <= 0:
+        return {}, 'time budget exhausted while building the model'
+
+    c = np.zeros(n_vars)
+    c[:len(pairs)] = -1  # Maksimalkan jumlah mata kuliah yang mendapat dosen
+    result = milp(
+        c,
+        constraints=constraints.build(n_vars),
+        integrality=np.ones(n_vars),
+        bounds=Bounds(0, 1),
+        options={'time_limit': remaining, 'disp': False},
+    )
+    if result.x is None:
+        return {}, result.message
+
+    chosen = np.flatnonzero(result.x[:len(pairs)] > 0.5)
+    assignment = {subjects[pairs[x][0]][0]: pairs[x][1] for x in chosen}
+    return assignment, result.message
+
+
+def solve_lecturer_assignment(schedule_df, lecturer_df, availability=None, time_budget=DEFAULT_TIME_BUDGET):
+    """Assignment dosen dengan integer program (scipy/HiGHS) dan batas waktu `time_budget` detik.
+
+    Greedy dijalankan lebih dulu. Integer program hanya menyusun ulang mata
+    kuliah yang tidak mendapat dosen ditambah sebagian kecil penempatan greedy
+    yang menghalanginya (RELEASE_PER_SUBJECT dosen per mata kuliah, pada hari
+    yang sama); penempatan lain tetap dan hanya sisa kapasitasnya yang dipakai.
+    Waktu membangun model ikut dihitung dalam budget; jika budget habis atau
+    solver tidak menambah mata kuliah yang mendapat dosen, hasil greedy
+    dikembalikan. Format hasil sama dengan assign_lecturers_to_schedule.
+    """
+    if availability is None:
+        availability = LecturerAvailability.from_dataframe(lecturer_df)
+
+    start = time.perf_counter()
+    greedy_df, greedy_stats = assign_lecturers_to_schedule(schedule_df, lecturer_df, availability)
+    greedy_time = time.perf_counter() - start
+
+    lecturer_type_map = dict(zip(lecturer_df['Lecturer Name'], lecturer_df['Lec. Type']))
+    lecturers = list(dict.fromkeys(lecturer_df['Lecturer Name']))
+
+    start = time.perf_counter()
+    deadline = start + time_budget
+    placed, unassigned = [], []
+    for idx, credits, schedule_time, lecturer in greedy_df[['Cr', 'Sched. Time', 'Lecturer']].itertuples(name=None):
+        day = extract_day_from_schedule(schedule_time)
+        session = extract_session_from_schedule(schedule_time)
+        if not day or session is None:
+            continue
+        credits = 0 if pd.isna(credits) else credits
+        if isinstance(lecturer, str):
+            placed.append((idx, credits, schedule_time, day, session, lecturer))
+        else:
+            unassigned.append((idx, credits, schedule_time, day, session))
+
+    released = []
+    if not unassigned:
+        # Greedy sudah menempatkan semua mata kuliah yang punya slot, solver tidak bisa lebih baik
+        assignment, solver_status = {}, 'skipped: greedy assigned every subject'
+    else:
+        try:
+            greedy_workload = _workload(placed)
+            released = _released_placements(
+                unassigned, placed, lecturers, lecturer_type_map, availability, greedy_workload, RELEASE_PER_SUBJECT
+            )
+            released_ids = {p[0] for p in released}
+            fixed_workload = _workload(p for p in placed if p[0] not in released_ids)
+            assignment, solver_status = _solve_milp(
+                unassigned + [p[:5] for p in released], lecturers, lecturer_type_map, availability, fixed_workload,
+                deadline,
+            )
+        except Exception as e:
+            assignment, solver_status = {}, f'solver error: {e}'
+    solve_time = time.perf_counter() - start
+
+    # Dilepas len(released), ditempatkan ulang len(assignment)
+    assigned = greedy_stats['assigned'] - len(released) + len(assignment)
+    solver_info = {
+        'solver_status': solver_status,
+        'solve_time': round(solve_time, 3),
+        'greedy_time': round(greedy_time, 3),
+        'greedy_assigned': greedy_stats['assigned'],
+        'solver_assigned': assigned if assignment else 0,
+        'solver_released': len(released),
+        'time_budget': time_budget,
+    }
+
+    if assigned <= greedy_stats['assigned']:
+        greedy_stats.update(solver_info, mode='greedy_fallback')
+        return greedy_df, greedy_stats
+
+    result_df = greedy_df.copy()
+    result_df.loc[[p[0] for p in released], 'Lecturer'] = None
+    result_df.loc[list(assignment), 'Lecturer'] = list(assignment.values())
+
+    released_ids = {p[0] for p in released}
+    subject_by_idx = {subject[0]: subject for subject in unassigned + [p[:5] for p in released]}
+    workload = _workload(
+        [p for p in placed if p[0] not in released_ids]
+        + [(*subject_by_idx[idx], lecturer) for idx, lecturer in assignment.items()]
+    )
+
+    stats = {
+        'total_subjects': len(result_df),
+        'assigned': assigned,
+        'unassigned': len(result_df) - assigned,
+        'lecturer_summary': workload.summary(lecturer_type_map),
+        'notes_issues': availability.issues,
+        'mode': 'optimal',
+    }
+    stats.update(solver_info)
+    return result_df, stats
+
+
+def _workload(placements):
+    """LecturerWorkloadIndex dari (idx, credits, schedule_time, day, session, lecturer)"""
+    workload = LecturerWorkloadIndex()
+    for _, credits, _, day, session, lecturer in placements:
+        workload.add(lecturer, day, credits, session)
+    return workload
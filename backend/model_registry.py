@@ -0,0 +1,153 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import joblib
+import pandas as pd
+
+# Batas total ukuran file .joblib di folder model; yang paling lama tidak dipakai dihapus lebih dulu
+MODEL_STORE_MAX_BYTES = int(os.environ.get('MODEL_STORE_MAX_BYTES', 256 * 1024 * 1024))
+
+
+class ModelRegistry:
+    """Registry model terlatih yang di-key dengan hash konten data pelatihan.
+
+    Artifact disimpan dengan joblib di `folder` dan dimuat ulang dengan
+    memory-map, sementara model yang sering dipakai disimpan di LRU in-process
+    (maksimal `max_models`). Jika data input sama, model tidak dilatih ulang.
+    Ukuran file di disk dibatasi `max_bytes` dengan menghapus artifact yang
+    paling lama tidak dipakai (mtime).
+    """
+
+    def __init__(self, folder, max_models=8, max_bytes=MODEL_STORE_MAX_BYTES):
+        self.folder = folder
+        self.max_models = max_models
+        self.max_bytes = max_bytes
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(folder, exist_ok=True)
+
+    @staticmethod
+    def make_key(name, version, *frames):
+        """Key artifact: nama model, versi kode pelatihan, dan sha256 isi DataFrame input"""
+        digest = hashlib.sha256()
+        for df in frames:
+            digest.update('\x1f'.join(map(str, df.columns)).encode('utf-8'))
+            digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        return f'{name}-{version}-{digest.hexdigest()[:32]}'
+
+    def path_for(self, key):
+        return os.path.join(self.folder, f'{key}.joblib')
+
+    def get(self, key):
+        """Ambil artifact dari LRU atau dari disk (memory-mapped); None jika belum ada"""
+        path = self.path_for(key)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._touch(path)
+                return self._cache[key]
+
+        try:
+            artifact = joblib.load(path, mmap_mode='r')
+        except FileNotFoundError:  # Belum pernah dilatih atau sudah di-evict proses lain
+            return None
+        self._touch(path)
+        self._remember(key, artifact)
+        return artifact
+
+    def put(self, key, artifact):
+        """Simpan artifact ke disk (atomic rename) dan ke LRU, lalu evict file lama"""
+        path = self.path_for(key)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        joblib.dump(artifact, tmp_path)
+        os.replace(tmp_path, path)
+        self._remember(key, artifact)
+        self.evict(keep=key)
+
+    def get_or_train(self, key, train_fn):
+        """Kembalikan (artifact, cached). `train_fn` hanya dipanggil jika key belum ada"""
+        artifact = self.get(key)
+        if artifact is not None:
+            return artifact, True
+        artifact = train_fn()
+        self.put(key, artifact)
+        return artifact, False
+
+    def preload(self, limit=None):
+        """Muat artifact terbaru di `folder` ke LRU (maksimal `limit`, default max_models).
+
+        Dipanggil master gunicorn sebelum fork: worker mewarisi model yang
+        sudah dimuat (copy-on-write) dan array besarnya tetap memory-mapped
+        dari file yang sama, jadi tidak ada worker yang memuat atau melatih
+        ulang model yang sudah ada di disk. Mengembalikan key yang dimuat.
+        """
+        limit = self.max_models if limit is None else min(limit, self.max_models)
+        entries = [
+            entry for entry in os.scandir(self.folder)
+            if entry.is_file() and entry.name.endswith('.joblib')
+        ]
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        keys = [entry.name[:-len('.joblib')] for entry in entries[:limit]]
+        # Yang paling baru dimuat terakhir agar menjadi yang paling akhir di-evict
+        for key in reversed(keys):
+            self.get(key)
+        return keys
+
+    def evict(self, keep=None):
+        """Hapus file .joblib yang paling lama tidak dipakai sampai ukuran <= max_bytes.
+
+        Model yang masih ada di LRU tetap bisa dipakai (mmap tetap valid setelah
+        file dihapus); proses lain akan melatih ulang jika membutuhkannya.
+        """
+        with self._lock:
+            entries = []
+            for entry in os.scandir(self.folder):
+                if entry.is_file() and entry.name.endswith('.joblib'):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.stat().st_size, entry.name))
+                    except FileNotFoundError:
+                        pass
+
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, name in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if name == f'{keep}.joblib':
+                    continue
+                try:
+                    os.remove(os.path.join(self.folder, name))
+                except FileNotFoundError:
+                    pass
+                total -= size
+                removed += 1
+            return removed
+
+    @staticmethod
+    def _touch(path):
+        # Tandai baru dipakai untuk eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+    def _remember(self, key, artifact):
+        with self._lock:
+            self._cache[key] = artifact
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_models:
+                self._cache.popitem(last=False)
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(folder, max_models=8):
+    """Satu ModelRegistry per folder per proses (dipakai app dan worker job)"""
+    with _registries_lock:
+        if folder not in _registries:
+            _registries[folder] = ModelRegistry(folder, max_models=max_models)
+        return _registries[folder]
@@ -2,6 +2,15 @@ from flask_sqlalchemy import SQLAlchemy
 
 db = SQLAlchemy()
 
+# Model untuk tabel slot (hari + sesi dari time_mapping)
+class Slot(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    code = db.Column(db.String(10), unique=True, nullable=False)  # 'Mon3'
+    day = db.Column(db.String(3), nullable=False)
+    session = db.Column(db.Integer, nullable=False)
+    start_time = db.Column(db.String(5), nullable=False)
+    end_time = db.Column(db.String(5), nullable=False)
+
 # Model untuk tabel schedule
 class Schedule(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -10,13 +19,31 @@ class Schedule(db.Model):
     curriculum = db.Column(db.String(100))
     class_name = db.Column(db.String(100))
     subject = db.Column(db.String(100))
-    credit = db.Column(db.Float)
+    credit = db.Column(db.Integer)  # Mengubah 'Cr' menjadi Integer
     room = db.Column(db.String(100))
     sched_time = db.Column(db.String(100))
     lecturer = db.Column(db.String(100))  # Nama pengajar
+    term = db.Column(db.String(50), index=True)  # Semester/term upload, kunci penggantian data
+    slot_id = db.Column(db.Integer, db.ForeignKey('slot.id'))  # None jika Sched. Time tidak ada di time_mapping
+
+    __table_args__ = (
+        db.Index('ix_schedule_major', 'major'),
+        db.Index('ix_schedule_slot_id', 'slot_id'),
+        db.Index('ix_schedule_room_slot', 'room', 'slot_id'),
+        db.Index('ix_schedule_lecturer_slot', 'lecturer', 'slot_id'),
+        # Database menolak ruangan yang dipakai dua kali di slot yang sama dalam satu term
+        db.Index('uq_schedule_term_room_slot', 'term', 'room', 'slot_id', unique=True),
+    )
+
+# Versi data jadwal (satu baris), dinaikkan setiap save; dipakai untuk ETag kalender
+class ScheduleVersion(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
 
 # Model untuk tabel user (lecturer)
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(100), unique=True)
     password = db.Column(db.String(100))
+    role = db.Column(db.String(100))  # admin, lecturer, ketua_major
+    major = db.Column(db.String(50))
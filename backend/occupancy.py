@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+
+class OccupancyMatrix:
+    """Matriks boolean ruangan x sesi yang menandai slot yang sudah terisi jadwal"""
+
+    def __init__(self, rooms, sessions, occupied):
+        self.rooms = pd.Index(rooms)
+        self.sessions = pd.Index(sessions)
+        self.occupied = occupied
+
+    @classmethod
+    def from_schedule(cls, schedule_df, rooms, sessions=None):
+        """Bangun matriks dalam satu pass dari kolom Room dan Sched. Time.
+
+        `rooms` adalah daftar ruangan (baris matriks). Jika `sessions` tidak
+        diberikan, sesi diambil dari jadwal dalam urutan kemunculan pertama.
+        Baris jadwal dengan ruangan atau sesi di luar daftar diabaikan.
+        """
+        rooms = pd.Index(rooms)
+        if sessions is None:
+            session_codes, sessions = pd.factorize(schedule_df['Sched. Time'])
+        else:
+            sessions = pd.Index(sessions)
+            session_codes = sessions.get_indexer(schedule_df['Sched. Time'])
+        room_codes = rooms.get_indexer(schedule_df['Room'])
+
+        occupied = np.zeros((len(rooms), len(sessions)), dtype=bool)
+        valid = (room_codes >= 0) & (session_codes >= 0)
+        occupied[room_codes[valid], session_codes[valid]] = True
+        return cls(rooms, sessions, occupied)
+
+    @property
+    def shape(self):
+        return self.occupied.shape
+
+    def to_frame(self):
+        """Format panjang (Room, Sched. Time, Is Occupied), urut per ruangan lalu per sesi"""
+        n_rooms, n_sessions = self.shape
+        return pd.DataFrame({
+            'Room': np.repeat(self.rooms.to_numpy(), n_sessions),
+            'Sched. Time': np.tile(self.sessions.to_numpy(), n_rooms),
+            'Is Occupied': self.occupied.ravel(),
+        })
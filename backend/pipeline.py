@@ -0,0 +1,191 @@
+"""Pipeline penjadwalan end-to-end di memori.
+
+Tahap yang sama dengan rangkaian endpoint optimize -> conflict/predict ->
+conflict/resolve -> schedule/lecturer -> schedule/save, tetapi DataFrame
+diteruskan langsung antar tahap tanpa ditulis dan di-parse ulang sebagai
+CSV. Setiap fungsi tahap menerima `state` (dict berisi frame dan parameter),
+memperbarui frame di dalamnya dan mengembalikan ringkasan tahap untuk response.
+"""
+import pandas as pd
+from sqlalchemy import MetaData, Table, create_engine
+
+from conflict_detection import detect_conflicts, summarize_groups
+from conflict_matching import resolve_conflicts_optimal
+from conflict_resolution import resolve_conflicts
+from database import engine_options
+from lecturer_assignment import assign_lecturers_to_schedule
+from lecturer_rules import LecturerAvailability
+from lecturer_solver import solve_lecturer_assignment
+from room_assignment import assign_rooms_and_sessions
+from room_availability import train_and_predict_room_availability
+from schedule_ingest import ingest_schedule
+
+# Urutan tahap tetap; tahap yang dipilih selalu dijalankan dalam urutan ini
+PIPELINE_STAGES = ('assign', 'availability', 'detect', 'resolve', 'lecturer', 'save')
+# Tanpa 'save': menyimpan ke database harus diminta secara eksplisit
+DEFAULT_PIPELINE_STAGES = ('assign', 'availability', 'detect', 'resolve', 'lecturer')
+PIPELINE_MODES = ('greedy', 'optimal')
+VALID_LECTURER_TYPES = ['Full', 'Part']
+
+
+class PipelineError(ValueError):
+    """Input atau hasil tahap pipeline tidak valid; `stage` ikut dilaporkan di response"""
+
+    def __init__(self, message, stage=None):
+        super().__init__(message)
+        self.stage = stage
+
+
+def parse_stages(value):
+    """'assign,detect' -> tahap dalam urutan PIPELINE_STAGES; kosong -> DEFAULT_PIPELINE_STAGES"""
+    if not value:
+        return list(DEFAULT_PIPELINE_STAGES)
+    requested = [stage.strip() for stage in value.split(',') if stage.strip()]
+    unknown = [stage for stage in requested if stage not in PIPELINE_STAGES]
+    if unknown:
+        raise PipelineError(f'Unknown stages: {", ".join(unknown)}; valid stages: {", ".join(PIPELINE_STAGES)}')
+    return [stage for stage in PIPELINE_STAGES if stage in requested]
+
+
+def session_codes(sched_df):
+    """Sched.csv (Day, Session) -> daftar kode sesi 'Mon1', 'Mon2', ..."""
+    return (sched_df['Day'] + sched_df['Session'].astype(str)).tolist()
+
+
+def valid_lecturers(lecturer_df):
+    """Buang dosen dengan Lec. Type kosong, 'None' atau selain Full/Part.
+
+    Mengembalikan (lecturer_df, jumlah dosen awal).
+    """
+    initial_count = len(lecturer_df)
+    lecturer_df = lecturer_df.dropna(subset=['Lec. Type'])
+    lecturer_df = lecturer_df[lecturer_df['Lec. Type'] != 'None']
+    lecturer_df = lecturer_df[lecturer_df['Lec. Type'].isin(VALID_LECTURER_TYPES)]
+    return lecturer_df, initial_count
+
+
+def assign_stage(state):
+    """Assign Room dan Sched. Time untuk setiap kelas di data mentah"""
+    data_df, unassigned_idx = assign_rooms_and_sessions(
+        state['data'], state['rooms'], session_codes(state['sched']), seed=state.get('seed')
+    )
+    unassigned = data_df.loc[unassigned_idx, ['Major', 'Class', 'Subject']].to_dict('records')
+    # Index urut 0..n-1 seperti hasil yang dibaca ulang dari updated_*.csv
+    state['schedule'] = data_df.reset_index(drop=True)
+    return {
+        'assigned_classes': len(data_df) - len(unassigned),
+        'unassigned_classes': len(unassigned),
+        'unassigned': unassigned,
+    }
+
+
+def availability_stage(state):
+    """Prediksi status setiap kombinasi ruangan x sesi dari jadwal saat ini"""
+    result = train_and_predict_room_availability(state['schedule'], state['rooms'], state.get('registry'))
+    state['room_availability'] = pd.DataFrame(
+        result['all_predictions'], columns=['Room', 'Session_Time', 'Status', 'Notes']
+    )
+    return {
+        'model_accuracy': round(result['accuracy'], 4),
+        'model_cached': result['model_cached'],
+        'total_rooms': result['total_rooms'],
+        'total_sessions': result['total_sessions'],
+        'total_empty_slots': result['total_empty_slots'],
+    }
+
+
+def detect_stage(state):
+    """Tandai bentrok ruangan di kolom 'Conflict' dan hitung grup konflik per jenis"""
+    schedule_df = state['schedule']
+    conflict_flags, groups = detect_conflicts(schedule_df)
+    schedule_df['Conflict'] = conflict_flags
+    return {
+        'total_rows': len(schedule_df),
+        'conflicting_rows': sum(conflict_flags),
+        'summary': summarize_groups(groups),
+    }
+
+
+def resolve_stage(state):
+    """Pindahkan baris yang bentrok ruangan ke slot kosong (greedy atau optimal)"""
+    if 'room_availability' not in state:
+        raise PipelineError("Stage 'resolve' needs room availability: add 'availability' or upload room_file", 'resolve')
+    schedule_df = state['schedule']
+    if 'Conflict' not in schedule_df.columns:
+        schedule_df['Conflict'] = detect_conflicts(schedule_df)[0]
+
+    comparison = None
+    if state['mode'] == 'optimal':
+        schedule_df, room_df, conflicts, unresolved, comparison = resolve_conflicts_optimal(
+            schedule_df, state['room_availability']
+        )
+    else:
+        schedule_df, room_df, conflicts, unresolved = resolve_conflicts(schedule_df, state['room_availability'])
+
+    state['schedule'] = schedule_df.drop(columns=['Conflict'])
+    state['room_availability'] = room_df
+    return {
+        'resolved_count': len(conflicts),
+        'unresolved_count': len(unresolved),
+        'conflicts': conflicts,
+        'comparison': comparison,
+    }
+
+
+def lecturer_stage(state):
+    """Alokasikan dosen ke setiap baris jadwal"""
+    lecturer_df, initial_count = valid_lecturers(state['lecturers'])
+    if lecturer_df.empty:
+        raise PipelineError(f'No valid lecturers found after filtering {initial_count} lecturers', 'lecturer')
+
+    availability = LecturerAvailability.from_dataframe(lecturer_df)
+    schedule_df = state['schedule']
+    if state['mode'] == 'optimal':
+        result_df, stats = solve_lecturer_assignment(schedule_df, lecturer_df, availability, state['time_budget'])
+    else:
+        result_df, stats = assign_lecturers_to_schedule(schedule_df, lecturer_df, availability)
+        stats['mode'] = 'greedy'
+
+    state['schedule'] = result_df
+    total = stats['total_subjects']
+    return {
+        'total_subjects': total,
+        'assigned_subjects': stats['assigned'],
+        'unassigned_subjects': stats['unassigned'],
+        'assignment_rate': round(stats['assigned'] / total * 100, 2) if total > 0 else 0,
+        'valid_lecturers': len(lecturer_df),
+        'dropped_lecturers': initial_count - len(lecturer_df),
+        'active_lecturers': len(stats['lecturer_summary']),
+        'notes_issues': availability.issues,
+        'mode': stats['mode'],
+    }
+
+
+def save_stage(state):
+    """Simpan jadwal akhir ke tabel schedule (menggantikan data term yang sama)"""
+    engine = create_engine(state['database_url'], **engine_options(state['database_url'], pooled=False))
+    try:
+        table = Table('schedule', MetaData(), autoload_with=engine)
+        return ingest_schedule(engine, table, state['schedule'], state['term'])
+    finally:
+        engine.dispose()
+
+
+STAGE_FUNCTIONS = {
+    'assign': assign_stage,
+    'availability': availability_stage,
+    'detect': detect_stage,
+    'resolve': resolve_stage,
+    'lecturer': lecturer_stage,
+    'save': save_stage,
+}
+
+
+def run_pipeline(state, stages, timer, progress):
+    """Jalankan tahap-tahap pipeline berurutan; durasi per tahap dicatat di `timer`"""
+    results = {}
+    for i, stage in enumerate(stages):
+        progress(0.1 + 0.8 * i / len(stages), stage)
+        with timer.phase(stage):
+            results[stage] = STAGE_FUNCTIONS[stage](state)
+    return results
@@ -0,0 +1,97 @@
+import random
+
+import pandas as pd
+
+from instrumentation import METRICS
+
+
+def build_rooms_by_major(rooms_df):
+    """Kelompokkan ruangan berdasarkan Notes ('PS_SI, PS_TInf' -> dua major; kosong -> 'general')"""
+    rooms_by_major = {}
+    for room, note in rooms_df[['Name', 'Notes']].values.tolist():
+        notes = note.split(', ') if pd.notna(note) else ['general']
+        for n in notes:
+            rooms_by_major.setdefault(n, [])
+            if room not in rooms_by_major[n]:
+                rooms_by_major[n].append(room)
+    return rooms_by_major
+
+
+class RoomAssignmentEngine:
+    """Assign (room, session) untuk setiap kelas tanpa rejection sampling.
+
+    Setiap ruangan menyimpan daftar sesi yang masih kosong, dan setiap major
+    menyimpan daftar ruangan yang masih punya sesi kosong. Pemilihan acak dan
+    penghapusan memakai swap-pop sehingga setiap assignment O(1) (amortized).
+    Kelas major yang ruangannya sudah penuh dialihkan ke ruangan 'general';
+    jika tidak ada slot sama sekali, assign() mengembalikan None.
+    """
+
+    def __init__(self, rooms_df, sessions, seed=None):
+        self.rng = random.Random(seed)
+        # Counter untuk METRICS: ruangan penuh yang terambil dan kelas yang dialihkan ke 'general'
+        self.retries = 0
+        self.fallbacks = 0
+        self.rooms_by_major = build_rooms_by_major(rooms_df)
+        sessions = list(dict.fromkeys(sessions))
+        self.free_sessions = {
+            room: list(sessions) for rooms in self.rooms_by_major.values() for room in rooms
+        }
+        # Salinan daftar ruangan per major yang boleh dikurangi saat ruangan penuh
+        self.pools = {major: list(rooms) for major, rooms in self.rooms_by_major.items()}
+
+    def _pop_random(self, items):
+        i = self.rng.randrange(len(items))
+        items[i], items[-1] = items[-1], items[i]
+        return items.pop()
+
+    def _pick_from_pool(self, pool):
+        while pool:
+            i = self.rng.randrange(len(pool))
+            room = pool[i]
+            free = self.free_sessions[room]
+            if free:
+                return room, self._pop_random(free)
+            # Ruangan sudah penuh (mungkin diisi lewat pool major lain), buang dari pool ini
+            self.retries += 1
+            pool[i], pool[-1] = pool[-1], pool[i]
+            pool.pop()
+        return None
+
+    def assign(self, major):
+        """Ambil (room, session) kosong untuk major, atau None jika tidak ada slot tersisa"""
+        if major in self.pools:
+            slot = self._pick_from_pool(self.pools[major])
+            if slot is not None:
+                return slot
+            self.fallbacks += 1
+        return self._pick_from_pool(self.pools.get('general', []))
+
+
+def assign_rooms_and_sessions(data_df, rooms_df, sessions, seed=None):
+    """Assign Room dan Sched. Time ke setiap baris data_df.
+
+    Mengembalikan (data_df terurut per Major dengan kolom Room/Sched. Time,
+    daftar index baris yang tidak mendapat slot).
+    """
+    engine = RoomAssignmentEngine(rooms_df, sessions, seed=seed)
+    data_df = data_df.sort_values(by="Major", ascending=True)
+
+    assigned_rooms = []
+    assigned_sessions = []
+    unassigned = []
+    for idx, major in zip(data_df.index, data_df['Major'].tolist()):
+        slot = engine.assign(major)
+        if slot is None:
+            unassigned.append(idx)
+            slot = (None, None)
+        assigned_rooms.append(slot[0])
+        assigned_sessions.append(slot[1])
+
+    METRICS.inc('room_assign_retries_total', engine.retries)
+    METRICS.inc('room_assign_fallbacks_total', engine.fallbacks)
+    METRICS.inc('room_assign_unassigned_total', len(unassigned))
+
+    data_df['Room'] = assigned_rooms
+    data_df['Sched. Time'] = assigned_sessions
+    return data_df, unassigned
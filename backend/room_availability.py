@@ -0,0 +1,99 @@
+import numpy as np
+
+from encoding import SparseOneHotEncoder
+from execution import PhaseTimer, predict, train_forest
+from occupancy import OccupancyMatrix
+
+# Naikkan jika fitur atau hyperparameter model berubah agar artifact lama tidak dipakai
+ROOM_MODEL_VERSION = 'v2'
+
+
+def fit_room_model(X, y, timer=None):
+    """Latih RandomForest ketersediaan ruangan; encoder disimpan di artifact bersama model"""
+    timer = timer or PhaseTimer()
+    with timer.phase('encode'):
+        encoder = SparseOneHotEncoder(['Room', 'Sched. Time'])
+        X_encoded = encoder.fit_transform(X)
+    artifact = train_forest(X_encoded, y, timer)
+    artifact['encoder'] = encoder
+    return artifact
+
+
+def predict_grid(model, X_encoded, timer=None):
+    """Prediksi batch untuk seluruh baris X_encoded, hasil berupa list 'Available'/'Occupied'"""
+    if X_encoded.shape[0] == 0:
+        return []
+    predictions = predict(model, X_encoded, timer)
+    return np.where(predictions == 0, 'Available', 'Occupied').tolist()
+
+
+def train_and_predict_room_availability(schedule_df, rooms_df, registry=None, timer=None):
+    """Fungsi untuk melatih model dan memprediksi ketersediaan ruangan.
+
+    Jika `registry` (ModelRegistry) diberikan, model untuk input yang sama
+    diambil dari cache dan tidak dilatih ulang. Durasi setiap fase dicatat di
+    `timer` (PhaseTimer) dan dikembalikan sebagai 'timings'.
+    """
+    timer = timer or PhaseTimer()
+    try:
+        with timer.phase('occupancy'):
+            # Mengambil daftar nama ruangan dari rooms.csv
+            rooms_list = rooms_df['Name'].unique()
+            
+            # Matriks okupansi ruangan x sesi, sesi diambil dari schedule.csv
+            occupancy = OccupancyMatrix.from_schedule(schedule_df, rooms_list)
+            sessions_list = occupancy.sessions
+            
+            # Convert to DataFrame (satu baris per kombinasi ruangan dan sesi)
+            features_df = occupancy.to_frame()
+        
+        # Fitur (X) dan target (y)
+        X = features_df[['Room', 'Sched. Time']]
+        y = features_df['Is Occupied']
+        
+        # Latih model + encoder, atau pakai artifact dari registry jika data input sama
+        if registry is not None:
+            key = registry.make_key(
+                'room_availability', ROOM_MODEL_VERSION,
+                schedule_df[['Room', 'Sched. Time']], rooms_df[['Name']]
+            )
+            artifact, model_cached = registry.get_or_train(key, lambda: fit_room_model(X, y, timer))
+        else:
+            artifact, model_cached = fit_room_model(X, y, timer), False
+        model = artifact['model']
+        accuracy = artifact['accuracy']
+        
+        # Fitur one-hot (sparse CSR) dengan encoder dari artifact, tanpa fit ulang
+        with timer.phase('encode'):
+            X_encoded = artifact['encoder'].transform(X)
+
+        # Prediksi seluruh grid ruangan x sesi dalam satu panggilan model.predict.
+        # X_encoded berisi semua kombinasi dalam urutan yang sama dengan features_df
+        statuses = predict_grid(model, X_encoded, timer)
+        
+        # Notes per ruangan (kemunculan pertama jika nama ruangan duplikat)
+        notes_by_room = rooms_df.drop_duplicates('Name').set_index('Name')['Notes']
+        room_notes = notes_by_room.reindex(features_df['Room']).tolist()
+        
+        # Buat prediksi untuk semua kombinasi dan filter hanya yang kosong
+        all_predictions = [
+            {'Room': room, 'Session_Time': session_time, 'Status': status, 'Notes': notes}
+            for room, session_time, status, notes in zip(
+                features_df['Room'].tolist(), features_df['Sched. Time'].tolist(), statuses, room_notes
+            )
+        ]
+        empty_rooms = [p for p in all_predictions if p['Status'] == 'Available']
+        
+        return {
+            'accuracy': accuracy,
+            'model_cached': model_cached,
+            'empty_rooms': empty_rooms,
+            'all_predictions': all_predictions,
+            'total_rooms': len(rooms_list),
+            'total_sessions': len(sessions_list),
+            'total_empty_slots': len(empty_rooms),
+            'timings': timer.as_dict()
+        }
+        
+    except Exception as e:
+        raise Exception(f"Error in room availability prediction: {str(e)}")
@@ -0,0 +1,134 @@
+import hashlib
+
+from sqlalchemy import column, insert, select, table as sql_table, update
+
+from database import DB_STREAM_BATCH
+from timeslots import DAYS, SLOT_IDS, time_mapping
+
+# Parameter query -> kolom tabel schedule untuk filter kesamaan
+CALENDAR_FILTERS = ('major', 'room', 'lecturer', 'term')
+CALENDAR_DEFAULT_LIMIT = 1000
+CALENDAR_MAX_LIMIT = 5000
+
+# Jam mulai/selesai per slot dihitung sekali, bukan split string per baris
+SLOT_TIMES = {slot: tuple(times.split('-')) for slot, times in time_mapping.items()}
+
+# Satu baris (id=1) berisi nomor versi data jadwal, dinaikkan setiap penulisan (models.ScheduleVersion)
+SCHEDULE_VERSION = sql_table('schedule_version', column('id'), column('version'))
+
+
+class CalendarQueryError(ValueError):
+    """Parameter query calendar tidak valid"""
+
+
+def parse_filters(args):
+    """Filter major, room, lecturer, term dan day dari query string (calendar dan export)"""
+    filters = {name: args.get(name) for name in CALENDAR_FILTERS if args.get(name)}
+
+    day = args.get('day')
+    if day:
+        if day not in DAYS:
+            raise CalendarQueryError(f'Invalid day {day!r}, expected one of {", ".join(DAYS)}')
+        filters['day'] = day
+    return filters
+
+
+def parse_calendar_args(args):
+    """Ambil filter, after_id dan limit dari query string"""
+    filters = parse_filters(args)
+    try:
+        after_id = int(args.get('after_id', 0))
+        limit = int(args.get('limit', CALENDAR_DEFAULT_LIMIT))
+    except ValueError:
+        raise CalendarQueryError('after_id and limit must be integers')
+    if limit < 1:
+        raise CalendarQueryError('limit must be positive')
+    return filters, after_id, min(limit, CALENDAR_MAX_LIMIT)
+
+
+def _where(table, filters, slotted_only=True):
+    """Kondisi SQL: filter kesamaan, hari, dan (slotted_only) hanya baris dengan slot yang ada di time_mapping"""
+    conditions = [table.c[name] == value for name, value in filters.items() if name in CALENDAR_FILTERS]
+    if 'day' in filters:
+        conditions.append(table.c.slot_id.in_(
+            [slot_id for slot, slot_id in SLOT_IDS.items() if slot.startswith(filters['day'])]
+        ))
+    elif slotted_only:
+        conditions.append(table.c.slot_id.isnot(None))
+    return conditions
+
+
+def ensure_schedule_version(conn):
+    """Sisipkan baris versi jika belum ada; True jika baris baru dibuat"""
+    if conn.execute(select(SCHEDULE_VERSION.c.id).where(SCHEDULE_VERSION.c.id == 1)).first() is not None:
+        return False
+    conn.execute(insert(SCHEDULE_VERSION).values(id=1, version=0))
+    return True
+
+
+def bump_schedule_version(conn):
+    """Naikkan versi jadwal; dipanggil di transaksi yang sama dengan penulisan tabel schedule"""
+    bumped = conn.execute(
+        update(SCHEDULE_VERSION).where(SCHEDULE_VERSION.c.id == 1).values(version=SCHEDULE_VERSION.c.version + 1)
+    ).rowcount
+    if not bumped:
+        conn.execute(insert(SCHEDULE_VERSION).values(id=1, version=1))
+
+
+def calendar_etag(conn, filters, after_id, limit):
+    """ETag dari versi jadwal dan parameter query.
+
+    Versi naik di transaksi yang sama dengan setiap save, jadi ETag lama tidak
+    berlaku setelah upload ulang walaupun jumlah baris dan id (SQLite memakai
+    ulang id) sama. Hanya satu baris yang dibaca, bukan count(*) seluruh tabel.
+    """
+    version = conn.execute(select(SCHEDULE_VERSION.c.version).where(SCHEDULE_VERSION.c.id == 1)).scalar()
+    key = f'{version or 0}:{sorted(filters.items())}:{after_id}:{limit}'
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def fetch_calendar_page(conn, table, filters, after_id, limit):
+    """Satu halaman event (keyset pagination pada id); mengembalikan (events, next_after_id)"""
+    query = (
+        select(table.c.id, table.c.major, table.c.subject, table.c.sched_time, table.c.room, table.c.lecturer)
+        .where(table.c.id > after_id, *_where(table, filters))
+        .order_by(table.c.id)
+        .limit(limit + 1)
+    )
+    # Server-side cursor: baris diambil per DB_STREAM_BATCH, bukan seluruh halaman di buffer driver
+    result = conn.execution_options(stream_results=True, yield_per=DB_STREAM_BATCH).execute(query)
+
+    events = []
+    next_after_id = None
+    for schedule_id, major, subject, sched_time, room, lecturer in result:
+        if len(events) == limit:
+            # Baris ke limit+1 hanya menandai masih ada halaman berikutnya
+            next_after_id = events[-1]['id']
+            break
+        start_time, end_time = SLOT_TIMES[sched_time]
+        events.append({
+            "id": schedule_id,
+            "major": major,
+            "title": subject,
+            "start": f"{sched_time}T{start_time}:00",  # Format waktu untuk FullCalendar
+            "end": f"{sched_time}T{end_time}:00",
+            "room": room,
+            "lecturer": lecturer
+        })
+    result.close()
+    return events, next_after_id
+
+
+def stream_schedule_rows(engine, table, columns, filters):
+    """Semua baris jadwal yang cocok dengan filter (urut id) lewat server-side cursor.
+
+    Generator memegang satu koneksi pool sampai selesai dibaca, jadi hanya
+    DB_STREAM_BATCH baris yang ada di memori sekaligus.
+    """
+    query = select(*(table.c[name] for name in columns)).where(
+        *_where(table, filters, slotted_only=False)
+    ).order_by(table.c.id)
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=DB_STREAM_BATCH).execute(query)
+        for row in result:
+            yield tuple(row)
@@ -0,0 +1,129 @@
+import csv
+import io
+import os
+import time
+
+import pandas as pd
+from sqlalchemy import delete
+
+from instrumentation import METRICS
+from schedule_calendar import bump_schedule_version
+from timeslots import SLOT_IDS
+
+# Kolom CSV jadwal -> kolom tabel schedule
+SCHEDULE_COLUMNS = {
+    'Program Session': 'program_session',
+    'Major': 'major',
+    'Curriculum': 'curriculum',
+    'Class': 'class_name',
+    'Subject': 'subject',
+    'Cr': 'credit',
+    'Room': 'room',
+    'Sched. Time': 'sched_time',
+    'Lecturer': 'lecturer',
+}
+
+# Jumlah baris per chunk CSV / per batch INSERT
+INGEST_BATCH_SIZE = int(os.environ.get('INGEST_BATCH_SIZE', 1000))
+INGEST_METHODS = ('auto', 'copy', 'insert')
+
+
+class IngestError(ValueError):
+    """CSV jadwal tidak bisa dimuat (kolom hilang, Cr bukan bilangan bulat, metode atau batch_size tidak valid)"""
+
+
+def prepare_rows(df, term):
+    """DataFrame CSV -> DataFrame dengan kolom tabel schedule (Cr integer, slot_id dari Sched. Time, NaN -> None)"""
+    df = df.rename(columns=lambda col: col.strip())
+    missing = [col for col in SCHEDULE_COLUMNS if col not in df.columns]
+    if missing:
+        raise IngestError(f'Missing columns: {", ".join(missing)}')
+
+    rows = df[list(SCHEDULE_COLUMNS)].rename(columns=SCHEDULE_COLUMNS)
+    credit = pd.to_numeric(rows['credit'], errors='coerce')
+    fractional = credit.notna() & (credit % 1 != 0)
+    if fractional.any():
+        # SKS harus bilangan bulat; nilai seperti 3.5 ditolak, bukan dipotong diam-diam
+        raise IngestError(f'Non-integer Cr values: {", ".join(map(str, credit[fractional].unique()[:5]))}')
+    rows['credit'] = credit.astype('Int64')
+    rows['term'] = term
+    rows['slot_id'] = rows['sched_time'].map(SLOT_IDS).astype('Int64')
+    return rows.astype(object).where(rows.notna(), None)
+
+
+def _copy_chunk(cursor, table_name, rows):
+    """Kirim satu chunk ke PostgreSQL dengan COPY FROM STDIN (format CSV, kosong = NULL)"""
+    buffer = io.StringIO()
+    rows.to_csv(buffer, index=False, header=False, quoting=csv.QUOTE_MINIMAL)
+    buffer.seek(0)
+    columns = ', '.join(rows.columns)
+    cursor.copy_expert(f'COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+
+def _chunks(source, batch_size):
+    """DataFrame dipotong per batch_size baris; path/file-like dibaca per chunk CSV"""
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), batch_size):
+            yield source.iloc[start:start + batch_size]
+    else:
+        yield from pd.read_csv(source, chunksize=batch_size)
+
+
+def ingest_schedule(engine, table, source, term, method='auto', batch_size=INGEST_BATCH_SIZE):
+    """Muat CSV jadwal ke tabel schedule dalam satu transaksi.
+
+    `source` adalah path, file-like atau DataFrame (hasil pipeline); CSV dibaca
+    per chunk `batch_size` baris.
+    Baris lama dengan `term` yang sama dihapus lebih dulu sehingga upload ulang
+    satu term menggantikan isinya, bukan menduplikasi. method 'copy' memakai
+    COPY FROM STDIN (hanya PostgreSQL/psycopg2), 'insert' memakai batch
+    insert().values(), 'auto' memilih COPY jika tersedia. Versi jadwal
+    (ETag kalender) dinaikkan di transaksi yang sama.
+    Mengembalikan statistik rows, deleted, seconds dan rows_per_sec.
+    """
+    if method not in INGEST_METHODS:
+        raise IngestError(f'Invalid method {method!r}, expected one of {", ".join(INGEST_METHODS)}')
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise IngestError(f'batch_size must be a positive integer, got {batch_size!r}')
+    # copy_expert hanya ada di psycopg2
+    supports_copy = engine.dialect.name == 'postgresql' and engine.dialect.driver == 'psycopg2'
+    if method == 'auto':
+        method = 'copy' if supports_copy else 'insert'
+    elif method == 'copy' and not supports_copy:
+        raise IngestError(
+            f'method copy requires PostgreSQL with psycopg2, database is {engine.dialect.name}+{engine.dialect.driver}'
+        )
+
+    start = time.perf_counter()
+    inserted = 0
+    with engine.begin() as conn:
+        deleted = conn.execute(delete(table).where(table.c.term == term)).rowcount
+        cursor = conn.connection.cursor() if method == 'copy' else None
+        try:
+            for chunk in _chunks(source, batch_size):
+                rows = prepare_rows(chunk, term)
+                if rows.empty:
+                    continue
+                if method == 'copy':
+                    _copy_chunk(cursor, table.name, rows)
+                else:
+                    conn.execute(table.insert().values(rows.to_dict('records')))
+                inserted += len(rows)
+        finally:
+            if cursor is not None:
+                cursor.close()
+        # ETag kalender berubah tepat saat transaksi ini commit
+        bump_schedule_version(conn)
+    seconds = time.perf_counter() - start
+    METRICS.observe('stage_duration_seconds', seconds, stage='db_ingest')
+    METRICS.inc('schedule_rows_ingested_total', inserted, method=method)
+
+    return {
+        'term': term,
+        'method': method,
+        'rows': inserted,
+        'deleted': deleted,
+        'batch_size': batch_size,
+        'seconds': round(seconds, 3),
+        'rows_per_sec': round(inserted / seconds, 1) if seconds > 0 else None,
+    }
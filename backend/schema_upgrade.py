@@ -0,0 +1,81 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import IntegrityError
+
+from timeslots import SLOT_IDS, split_slot, time_mapping
+
+# Index tabel schedule: nama -> (kolom, unique)
+SCHEDULE_INDEXES = {
+    'ix_schedule_term': (('term',), False),
+    'ix_schedule_major': (('major',), False),
+    'ix_schedule_slot_id': (('slot_id',), False),
+    'ix_schedule_room_slot': (('room', 'slot_id'), False),
+    'ix_schedule_lecturer_slot': (('lecturer', 'slot_id'), False),
+    # Satu ruangan hanya boleh dipakai sekali per slot dalam satu term
+    'uq_schedule_term_room_slot': (('term', 'room', 'slot_id'), True),
+}
+
+
+def slot_rows():
+    """Baris tabel slot dari time_mapping; id tetap (SLOT_IDS) agar bisa dipetakan tanpa query"""
+    rows = []
+    for code, slot_id in SLOT_IDS.items():
+        day, session = split_slot(code)
+        start_time, end_time = time_mapping[code].split('-')
+        rows.append({
+            'id': slot_id, 'code': code, 'day': day, 'session': session,
+            'start_time': start_time, 'end_time': end_time,
+        })
+    return rows
+
+
+def seed_slots(conn, slot_table):
+    """Isi tabel slot dengan slot dari time_mapping yang belum ada"""
+    existing = {code for (code,) in conn.execute(slot_table.select().with_only_columns(slot_table.c.code))}
+    missing = [row for row in slot_rows() if row['code'] not in existing]
+    if missing:
+        conn.execute(slot_table.insert(), missing)
+    return len(missing)
+
+
+def upgrade_schedule_schema(engine, slot_table, table_name='schedule'):
+    """Upgrade tabel schedule lama ke skema dengan slot_id, term dan index.
+
+    Idempotent: setiap langkah dilewati jika sudah diterapkan. db.create_all
+    hanya membuat tabel baru, jadi kolom dan index untuk tabel yang sudah ada
+    ditambahkan di sini. Mengembalikan daftar langkah yang dijalankan; unique
+    index yang gagal karena data lama sudah bentrok dilaporkan, bukan error.
+    """
+    applied = []
+    with engine.begin() as conn:
+        seeded = seed_slots(conn, slot_table)
+        if seeded:
+            applied.append(f'seed {seeded} slots')
+
+        columns = {column['name'] for column in inspect(conn).get_columns(table_name)}
+        if 'term' not in columns:
+            conn.execute(text(f'ALTER TABLE {table_name} ADD COLUMN term VARCHAR(50)'))
+            applied.append('add column term')
+        if 'slot_id' not in columns:
+            conn.execute(text(f'ALTER TABLE {table_name} ADD COLUMN slot_id INTEGER REFERENCES {slot_table.name} (id)'))
+            applied.append('add column slot_id')
+
+        backfilled = conn.execute(text(
+            f'UPDATE {table_name} SET slot_id = '
+            f'(SELECT {slot_table.name}.id FROM {slot_table.name} WHERE {slot_table.name}.code = {table_name}.sched_time) '
+            f'WHERE slot_id IS NULL AND sched_time IN (SELECT code FROM {slot_table.name})'
+        )).rowcount
+        if backfilled:
+            applied.append(f'backfill slot_id for {backfilled} rows')
+
+    existing = {index['name'] for index in inspect(engine).get_indexes(table_name)}
+    for name, (index_columns, unique) in SCHEDULE_INDEXES.items():
+        if name in existing:
+            continue
+        statement = f'CREATE {"UNIQUE " if unique else ""}INDEX {name} ON {table_name} ({", ".join(index_columns)})'
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(statement))
+            applied.append(f'create index {name}')
+        except IntegrityError:
+            applied.append(f'skip index {name}: existing rows violate it')
+    return applied
@@ -0,0 +1,464 @@
+"""Pekerjaan berat endpoint optimize/assign/predict/resolve dan pipeline.
+
+Setiap task menerima path CSV (biasanya di upload store) atau file-like dan
+parameter request, menulis hasil ke `upload_folder` (path download yang sama
+seperti sebelumnya) dan mengembalikan (payload JSON, status HTTP). Modul ini tidak meng-import app,
+sehingga task bisa dijalankan langsung di request maupun di worker proses
+job queue.
+
+DataFrame hasil tetap dibangun utuh oleh algoritma; hanya teks CSV-nya yang
+ditulis per chunk (export_stream.write_frame) ke file sementara lalu di-rename.
+"""
+import logging
+import os
+
+import pandas as pd
+from sqlalchemy.exc import IntegrityError
+
+from conflict_detection import describe_groups, detect_conflicts, summarize_groups
+from conflict_matching import resolve_conflicts_optimal
+from conflict_model import train_conflict_model
+from conflict_resolution import resolve_conflicts
+from csv_loader import (
+    CONFLICT_SCHEDULE,
+    LECTURER,
+    RAW_SCHEDULE,
+    ROOM_AVAILABILITY,
+    ROOM_USAGE,
+    ROOMS,
+    SCHED,
+    SCHEDULE,
+    SchemaError,
+    load_csv,
+)
+from execution import PhaseTimer, resolve_n_jobs
+from export_stream import write_frame
+from lecturer_assignment import assign_lecturers_to_schedule
+from lecturer_rules import LecturerAvailability
+from lecturer_solver import DEFAULT_TIME_BUDGET, solve_lecturer_assignment
+from model_registry import get_registry
+from pipeline import (
+    PIPELINE_MODES,
+    VALID_LECTURER_TYPES,
+    PipelineError,
+    parse_stages,
+    run_pipeline,
+    session_codes,
+    valid_lecturers,
+)
+from room_assignment import assign_rooms_and_sessions
+from room_availability import train_and_predict_room_availability
+from schedule_ingest import IngestError
+
+MODEL_CACHE_SIZE = int(os.environ.get('MODEL_CACHE_SIZE', 8))
+
+logger = logging.getLogger(__name__)
+
+
+def _noop_progress(fraction, message):
+    pass
+
+
+def predict_rooms(rooms_source, schedule_source, upload_folder, model_folder, progress=_noop_progress):
+    """Prediksi ruangan kosong (/api/room/predict)"""
+    try:
+        timer = PhaseTimer()
+
+        progress(0.1, 'parse')
+        with timer.phase('parse'):
+            # Kolom yang diperlukan divalidasi oleh schema loader
+            rooms_df = load_csv(rooms_source, ROOMS)
+            schedule_df = load_csv(schedule_source, ROOM_USAGE)
+
+        # Proses prediksi
+        progress(0.3, 'predict')
+        registry = get_registry(model_folder, MODEL_CACHE_SIZE)
+        result = train_and_predict_room_availability(schedule_df, rooms_df, registry, timer)
+
+        # Simpan hasil ke CSV (opsional)
+        progress(0.9, 'write')
+        empty_rooms_df = pd.DataFrame(result['empty_rooms'])
+        if not empty_rooms_df.empty:
+            csv_filename = 'empty_rooms_predictions.csv'
+            csv_path = os.path.join(upload_folder, csv_filename)
+            write_frame(empty_rooms_df, csv_path)
+
+        return {
+            'success': True,
+            'message': 'Room availability prediction completed successfully',
+            'model_accuracy': round(result['accuracy'], 4),
+            'model_cached': result['model_cached'],
+            'n_jobs': resolve_n_jobs(),
+            'timings': result['timings'],
+            'statistics': {
+                'total_rooms': result['total_rooms'],
+                'total_sessions': result['total_sessions'],
+                'total_combinations': result['total_rooms'] * result['total_sessions'],
+                'total_empty_slots': result['total_empty_slots'],
+                'empty_percentage': round((result['total_empty_slots'] / (result['total_rooms'] * result['total_sessions'])) * 100, 2)
+            },
+            'empty_rooms': result['empty_rooms'],
+            'csv_generated': not empty_rooms_df.empty
+        }, 200
+
+    except SchemaError as e:
+        return e.to_dict(), 400
+    except pd.errors.EmptyDataError:
+        return {'error': 'One or more uploaded files are empty'}, 400
+    except pd.errors.ParserError as e:
+        return {'error': f'Error parsing CSV file: {str(e)}'}, 400
+    except Exception as e:
+        return {'error': f'Processing error: {str(e)}'}, 500
+
+
+def optimize_schedule(rooms_path, sched_path, data_path, upload_folder, seed=None, data_filename=None,
+                      progress=_noop_progress):
+    """Assign room dan sesi per kelas (/api/schedule/optimize)"""
+    try:
+        timer = PhaseTimer()
+
+        progress(0.1, 'parse')
+        with timer.phase('parse'):
+            rooms_df = load_csv(rooms_path, ROOMS)
+            sched_df = load_csv(sched_path, SCHED)
+            data_raw_df = load_csv(data_path, RAW_SCHEDULE)
+
+        sessions_list = session_codes(sched_df)
+
+        # Assign room dan sesi per kelas; kelas tanpa slot kosong dilaporkan, bukan di-retry
+        progress(0.3, 'assign')
+        with timer.phase('assign'):
+            data_df, unassigned_idx = assign_rooms_and_sessions(data_raw_df, rooms_df, sessions_list, seed=seed)
+
+        # Save the updated dataframe with a new filename based on the data file's name
+        progress(0.9, 'write')
+        updated_filename = f"updated_{data_filename or os.path.basename(data_path)}"
+        file_path = os.path.join(upload_folder, updated_filename)
+        with timer.phase('write'):
+            write_frame(data_df, file_path)
+
+        logger.info('File saved at: %s', file_path)
+
+        unassigned = data_df.loc[unassigned_idx, ['Major', 'Class', 'Subject']].to_dict('records')
+
+        return {
+            'message': 'Files processed successfully',
+            'file': updated_filename,
+            'assigned_classes': len(data_df) - len(unassigned),
+            'unassigned_classes': len(unassigned),
+            'unassigned': unassigned,
+            'timings': timer.as_dict(),
+        }, 200
+
+    except SchemaError as e:
+        return e.to_dict(), 400
+    except Exception as e:
+        return {'error': f'Error processing files: {str(e)}'}, 500
+
+
+def predict_conflicts(train_path, upload_folder, model_folder, train=False, progress=_noop_progress):
+    """Deteksi konflik jadwal, training model conflict detection opsional (/api/conflict/predict)"""
+    try:
+        timer = PhaseTimer()
+
+        # Read the file and process it
+        progress(0.1, 'parse')
+        with timer.phase('parse'):
+            updated_df = load_csv(train_path, CONFLICT_SCHEDULE)
+
+        # Deteksi bentrok ruangan, dosen dan kelas dalam satu pass;
+        # kolom 'Conflict' tetap menandai bentrok ruangan untuk /api/conflict/resolve
+        progress(0.3, 'detect')
+        with timer.phase('detect'):
+            conflict_flags, groups = detect_conflicts(updated_df)
+            updated_df['Conflict'] = conflict_flags
+
+        # Save the updated DataFrame with all columns and the 'Conflict' column
+        conflict_filename = 'conflict_results.csv'
+        with timer.phase('write'):
+            write_frame(updated_df, os.path.join(upload_folder, conflict_filename))
+
+        response = {
+            'message': 'Conflict detection completed successfully',
+            'conflict_file': conflict_filename,
+            'total_rows': len(updated_df),
+            'conflicting_rows': sum(conflict_flags),
+            'summary': summarize_groups(groups),
+            'conflict_groups': describe_groups(updated_df, groups),
+        }
+
+        # Training model bersifat opt-in; model untuk data yang sama diambil dari registry
+        if train:
+            progress(0.5, 'train')
+            registry = get_registry(model_folder, MODEL_CACHE_SIZE)
+            artifact, model_cached, model_key = train_conflict_model(updated_df, registry, timer)
+            accuracy = artifact['accuracy']
+
+            logger.info('Model accuracy: %.2f', accuracy)
+
+            response.update({
+                'message': 'Conflict detection completed and model trained successfully',
+                'accuracy': accuracy,
+                'model_file': os.path.basename(registry.path_for(model_key)),
+                'model_cached': model_cached,
+                'n_jobs': resolve_n_jobs(),
+            })
+
+        response['timings'] = timer.as_dict()
+        return response, 200
+
+    except SchemaError as e:
+        return e.to_dict(), 400
+    except Exception as e:
+        return {'error': f'Error training model: {str(e)}'}, 500
+
+
+def resolve_schedule_conflicts(schedule_path, room_path, upload_folder, mode='greedy', room_filename=None,
+                               progress=_noop_progress):
+    """Pindahkan jadwal yang bentrok ke slot kosong (/api/conflict/resolve)"""
+    try:
+        timer = PhaseTimer()
+
+        # Membaca file jadwal dan file ruang
+        progress(0.1, 'parse')
+        # Nama kolom sudah di-strip oleh loader
+        with timer.phase('parse'):
+            schedule_df = load_csv(schedule_path, CONFLICT_SCHEDULE)
+            room_df = load_csv(room_path, ROOM_AVAILABILITY)
+
+        # Periksa apakah kolom 'Conflict' ada
+        if 'Conflict' not in schedule_df.columns:
+            return {'error': "Column 'Conflict' is missing from the schedule file."}, 400
+
+        # greedy (default): index slot kosong per sesi/ruangan/major
+        # optimal: min-cost matching semua baris konflik ke slot kosong sekaligus
+        progress(0.3, 'resolve')
+        comparison = None
+        if mode not in ('greedy', 'optimal'):
+            return {'error': 'Invalid mode', 'valid_modes': ['greedy', 'optimal']}, 400
+        with timer.phase('resolve'):
+            if mode == 'optimal':
+                schedule_df, room_df, conflicts, unresolved, comparison = resolve_conflicts_optimal(schedule_df, room_df)
+            else:
+                schedule_df, room_df, conflicts, unresolved = resolve_conflicts(schedule_df, room_df)
+        conflict_count = len(conflicts)  # Jumlah konflik yang berhasil diselesaikan
+
+        # Status slot yang dipakai ditulis ke file ruangan sekali saja
+        progress(0.9, 'write')
+        fixed_schedule_filename = 'fixed_schedule.csv'
+        with timer.phase('write'):
+            write_frame(room_df, os.path.join(upload_folder, room_filename or os.path.basename(room_path)))
+
+            # Menghapus kolom 'Conflict' setelah penyelesaian
+            schedule_df = schedule_df.drop(columns=['Conflict'])
+
+            # Menyimpan jadwal yang telah diperbaiki
+            write_frame(schedule_df, os.path.join(upload_folder, fixed_schedule_filename))
+
+        return {
+            'message': f'{conflict_count} conflicts resolved successfully',
+            'resolved_schedule': fixed_schedule_filename,
+            'conflicts': conflicts,  # Ensure this contains data
+            'unresolved_count': len(unresolved),
+            'mode': mode,
+            'comparison': comparison,
+            'timings': timer.as_dict(),
+        }, 200
+
+    except SchemaError as e:
+        return e.to_dict(), 400
+    except Exception as e:
+        return {'error': f'Error resolving conflicts: {str(e)}'}, 500
+
+
+def assign_lecturers(schedule_source, lecturer_source, upload_folder, mode='greedy',
+                     time_budget=DEFAULT_TIME_BUDGET, progress=_noop_progress):
+    """Alokasi dosen ke jadwal (/api/schedule/lecturer)"""
+    try:
+        timer = PhaseTimer()
+
+        progress(0.1, 'parse')
+        # Kolom yang diperlukan divalidasi oleh schema loader
+        with timer.phase('parse'):
+            schedule_df = load_csv(schedule_source, SCHEDULE)
+            lecturer_df = load_csv(lecturer_source, LECTURER)
+
+        # Filter dan drop lecturer dengan Lec. Type None atau NaN
+        lecturer_df, initial_lecturer_count = valid_lecturers(lecturer_df)
+
+        filtered_lecturer_count = len(lecturer_df)
+        dropped_count = initial_lecturer_count - filtered_lecturer_count
+
+        if lecturer_df.empty:
+            return {
+                'error': 'No valid lecturers found after filtering',
+                'message': f'All {initial_lecturer_count} lecturers were dropped due to invalid Lec. Type',
+                'valid_types': VALID_LECTURER_TYPES
+            }, 400
+
+        # Compile Notes dosen sekali; aturan yang tidak dikenali dilaporkan di response
+        availability = LecturerAvailability.from_dataframe(lecturer_df)
+
+        # Proses assignment: greedy (default) atau integer program dengan batas waktu
+        progress(0.3, 'assign')
+        if mode not in ('greedy', 'optimal'):
+            return {'error': 'Invalid mode', 'valid_modes': ['greedy', 'optimal']}, 400
+        with timer.phase('lecturer'):
+            if mode == 'optimal':
+                result_df, stats = solve_lecturer_assignment(schedule_df, lecturer_df, availability, time_budget)
+            else:
+                result_df, stats = assign_lecturers_to_schedule(schedule_df, lecturer_df, availability)
+                stats['mode'] = 'greedy'
+
+        # Simpan hasil ke CSV (hanya kolom asli + Lecturer)
+        progress(0.9, 'write')
+        output_filename = 'schedule_with_lecturers.csv'
+        csv_path = os.path.join(upload_folder, output_filename)
+        with timer.phase('write'):
+            write_frame(result_df, csv_path)
+
+        # Hitung statistik tambahan
+        assignment_rate = (stats['assigned'] / stats['total_subjects']) * 100 if stats['total_subjects'] > 0 else 0
+
+        return {
+            'success': True,
+            'message': 'Lecturer assignment completed successfully',
+            'filtering_info': {
+                'initial_lecturers': initial_lecturer_count,
+                'valid_lecturers': filtered_lecturer_count,
+                'dropped_lecturers': dropped_count,
+                'drop_reason': 'Lec. Type None, NaN, or invalid values'
+            },
+            'statistics': {
+                'total_subjects': stats['total_subjects'],
+                'assigned_subjects': stats['assigned'],
+                'unassigned_subjects': stats['unassigned'],
+                'assignment_rate': round(assignment_rate, 2),
+                'total_valid_lecturers': len(lecturer_df),
+                'active_lecturers': len(stats['lecturer_summary'])
+            },
+            'lecturer_workload': stats['lecturer_summary'],
+            'notes_issues': availability.issues,
+            'mode': stats['mode'],
+            'solver': {
+                key: stats[key]
+                for key in ('solver_status', 'solve_time', 'greedy_time', 'greedy_assigned', 'solver_assigned',
+                            'solver_released', 'time_budget')
+                if key in stats
+            },
+            'unassigned_subjects': result_df[result_df['Lecturer'].isna()][
+                ['Subject', 'Class', 'Cr', 'Sched. Time']
+            ].to_dict('records'),
+            'csv_filename': output_filename,
+            'constraints_applied': {
+                'Full-time lecturers': 'Max 5 working days, Max 12 credits per day',
+                'Part-time lecturers': 'Max 2 working days, Max 6 credits per day'
+            },
+            'csv_path': csv_path,
+            'timings': timer.as_dict(),
+        }, 200
+
+    except SchemaError as e:
+        return e.to_dict(), 400
+    except pd.errors.EmptyDataError:
+        return {'error': 'One or more uploaded files are empty'}, 400
+    except pd.errors.ParserError as e:
+        return {'error': f'Error parsing CSV file: {str(e)}'}, 400
+    except Exception as e:
+        return {'error': f'Processing error: {str(e)}'}, 500
+
+
+def run_schedule_pipeline(upload_folder, model_folder, stages=None, rooms_path=None, sched_path=None,
+                          data_path=None, schedule_path=None, room_path=None, lecturer_path=None, seed=None,
+                          mode='greedy', time_budget=DEFAULT_TIME_BUDGET, database_url=None, term=None,
+                          progress=_noop_progress):
+    """Pipeline assign -> availability -> detect -> resolve -> lecturer -> save (/api/schedule/pipeline).
+
+    Frame diteruskan di memori antar tahap; hanya jadwal akhir yang ditulis ke
+    CSV (pipeline_schedule.csv). Tanpa tahap 'assign', pipeline mulai dari
+    jadwal yang sudah punya Room/Sched. Time (`schedule_path`). `room_path`
+    (file ketersediaan ruangan) menggantikan tahap 'availability'.
+    """
+    try:
+        timer = PhaseTimer()
+        stages = parse_stages(stages) if stages is None or isinstance(stages, str) else list(stages)
+        if mode not in PIPELINE_MODES:
+            return {'error': 'Invalid mode', 'valid_modes': list(PIPELINE_MODES)}, 400
+
+        # File yang dibutuhkan tergantung tahap yang dipilih
+        sources = {'rooms_file': rooms_path, 'sched_file': sched_path, 'data_file': data_path,
+                   'schedule_file': schedule_path, 'room_file': room_path, 'lecturer_file': lecturer_path}
+        required = ['rooms_file', 'sched_file', 'data_file'] if 'assign' in stages else ['schedule_file']
+        if 'availability' in stages and 'rooms_file' not in required:
+            required.append('rooms_file')
+        if 'resolve' in stages and 'availability' not in stages:
+            required.append('room_file')
+        if 'lecturer' in stages:
+            required.append('lecturer_file')
+        missing = [name for name in required if sources[name] is None]
+        if missing:
+            return {'error': 'Missing required files', 'stages': stages, 'required_files': required,
+                    'missing_files': missing}, 400
+        if 'save' in stages and not (database_url and term):
+            return {'error': "Stage 'save' needs a database and a term", 'stages': stages}, 400
+
+        progress(0.05, 'parse')
+        state = {'seed': seed, 'mode': mode, 'time_budget': time_budget, 'database_url': database_url, 'term': term}
+        with timer.phase('parse'):
+            if 'assign' in stages:
+                state['data'] = load_csv(data_path, RAW_SCHEDULE)
+                state['sched'] = load_csv(sched_path, SCHED)
+            else:
+                # Jadwal yang akan disimpan atau diberi dosen harus lengkap kolomnya
+                full = 'lecturer' in stages or 'save' in stages
+                state['schedule'] = load_csv(schedule_path, SCHEDULE if full else CONFLICT_SCHEDULE)
+            if rooms_path is not None:
+                state['rooms'] = load_csv(rooms_path, ROOMS)
+            if room_path is not None and 'availability' not in stages:
+                state['room_availability'] = load_csv(room_path, ROOM_AVAILABILITY)
+            if 'lecturer' in stages:
+                state['lecturers'] = load_csv(lecturer_path, LECTURER)
+        if 'availability' in stages:
+            state['registry'] = get_registry(model_folder, MODEL_CACHE_SIZE)
+
+        results = run_pipeline(state, stages, timer, progress)
+
+        # Hanya hasil akhir yang ditulis, sekali
+        progress(0.95, 'write')
+        output_filename = 'pipeline_schedule.csv'
+        with timer.phase('write'):
+            write_frame(state['schedule'], os.path.join(upload_folder, output_filename))
+
+        timings = timer.as_dict()
+        timings['total'] = round(sum(timer.timings.values()), 4)
+        return {
+            'message': 'Pipeline completed successfully',
+            'stages': stages,
+            'file': output_filename,
+            'total_rows': len(state['schedule']),
+            'results': results,
+            'timings': timings,
+        }, 200
+
+    except SchemaError as e:
+        return e.to_dict(), 400
+    except PipelineError as e:
+        return {'error': str(e), 'stage': e.stage}, 400
+    except IngestError as e:
+        return {'error': str(e), 'stage': 'save'}, 400
+    except IntegrityError as e:
+        # uq_schedule_term_room_slot: jadwal akhir masih memakai ruangan dua kali di slot yang sama
+        return {'error': 'Schedule contains room double-bookings', 'stage': 'save', 'detail': str(e.orig)}, 409
+    except Exception as e:
+        return {'error': f'Pipeline error: {str(e)}'}, 500
+
+
+# Nama job -> fungsi task (dipakai job queue)
+TASKS = {
+    'room_predict': predict_rooms,
+    'schedule_optimize': optimize_schedule,
+    'conflict_predict': predict_conflicts,
+    'conflict_resolve': resolve_schedule_conflicts,
+    'schedule_lecturer': assign_lecturers,
+    'schedule_pipeline': run_schedule_pipeline,
+}
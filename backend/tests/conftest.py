@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+UPLOADS = os.path.join(BACKEND, 'uploads')
+
+# Modul backend di-import sebagai modul top-level (seperti app.py dan benchmarks/)
+sys.path.insert(0, BACKEND)
+
+
+@pytest.fixture
+def app(tmp_path):
+    """Aplikasi dengan database SQLite dan folder upload sementara"""
+    from app import create_app, migrate_database
+
+    uploads = str(tmp_path / 'uploads')
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path / "schedule.db"}',
+        'UPLOAD_FOLDER': uploads,
+        'MODEL_FOLDER': os.path.join(uploads, 'models'),
+        'JOB_FOLDER': os.path.join(uploads, 'jobs'),
+        'TESTING': True,
+    })
+    with app.app_context():
+        migrate_database()
+    yield app
+    app.extensions['job_queue'].shutdown()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture(scope='session')
+def schedule_csv():
+    return os.path.join(UPLOADS, 'schedule_with_lecturers.csv')
+
+
+@pytest.fixture(scope='session')
+def schedule_bytes(schedule_csv):
+    with open(schedule_csv, 'rb') as f:
+        return f.read()
+
+
+@pytest.fixture(scope='session')
+def schedule_df(schedule_csv):
+    return pd.read_csv(schedule_csv)
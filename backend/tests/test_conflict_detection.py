@@ -0,0 +1,81 @@
+import os
+from itertools import combinations
+
+import pandas as pd
+
+from conflict_detection import CONFLICT_TYPES, describe_groups, detect_conflicts, summarize_groups
+
+UPLOADS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'uploads')
+
+SCHEDULE = pd.DataFrame({
+    'Class': ['C1', 'C2', 'C3', 'C1', 'C4', 'C5', 'C6'],
+    'Subject': ['S1', 'S2', 'S3', 'S4', 'S5', 'S6', 'S7'],
+    'Room': ['R1', 'R1', 'R2', 'R3', 'R4', None, 'R5'],
+    'Sched. Time': ['Mon1', 'Mon1', 'Tue1', 'Mon1', 'Wed1', 'Wed1', None],
+    'Lecturer': ['L1', 'L2', 'L3', 'L4', 'L3', 'L5', 'L1'],
+})
+
+
+def clashing_pairs(schedule_df):
+    """Pasangan baris yang bentrok per jenis, dibandingkan satu per satu (O(n^2))"""
+    pairs = set()
+    records = schedule_df.to_dict('records')
+    for (i, a), (j, b) in combinations(enumerate(records), 2):
+        if pd.isna(a['Sched. Time']) or a['Sched. Time'] != b['Sched. Time']:
+            continue
+        for conflict_type, column in CONFLICT_TYPES.items():
+            if column in a and pd.notna(a[column]) and a[column] != '' and a[column] == b[column]:
+                pairs.add((conflict_type, i, j))
+    return pairs
+
+
+def group_pairs(groups):
+    return {(group['type'], i, j) for group in groups for i, j in combinations(group['rows'], 2)}
+
+
+def test_detects_room_lecturer_and_class_clashes():
+    flags, groups = detect_conflicts(SCHEDULE)
+    found = {(group['type'], group['key'], group['Sched. Time'], tuple(group['rows'])) for group in groups}
+    assert found == {
+        ('room', 'R1', 'Mon1', (0, 1)),
+        ('class', 'C1', 'Mon1', (0, 3)),
+    }
+    # Hanya bentrok ruangan yang masuk kolom Conflict
+    assert flags == [1, 1, 0, 0, 0, 0, 0]
+
+    schedule = SCHEDULE.assign(Lecturer=['L1', 'L2', 'L3', 'L1', 'L3', 'L5', 'L1'])
+    groups = detect_conflicts(schedule)[1]
+    lecturer = [group for group in groups if group['type'] == 'lecturer']
+    # L3 di Tue1 dan Wed1 bukan bentrok; L1 tanpa Sched. Time diabaikan
+    assert [(group['key'], group['rows']) for group in lecturer] == [('L1', [0, 3])]
+    assert summarize_groups(groups) == {
+        'room': {'groups': 1, 'rows': 2},
+        'lecturer': {'groups': 1, 'rows': 2},
+        'class': {'groups': 1, 'rows': 2},
+    }
+
+
+def test_missing_columns_are_skipped():
+    flags, groups = detect_conflicts(SCHEDULE.drop(columns=['Lecturer', 'Class']))
+    assert [group['type'] for group in groups] == ['room']
+    assert sum(flags) == 2
+
+
+def test_matches_pairwise_comparison_on_sample_data():
+    schedule_df = pd.read_csv(os.path.join(UPLOADS, 'conflict_schedule.csv'))
+    flags, groups = detect_conflicts(schedule_df)
+    expected = clashing_pairs(schedule_df)
+    assert {t for t, _, _ in expected} == set(CONFLICT_TYPES)
+    assert group_pairs(groups) == expected
+    room_rows = {row for t, i, j in expected if t == 'room' for row in (i, j)}
+    assert [pos for pos, flag in enumerate(flags) if flag] == sorted(room_rows)
+
+
+def test_describe_groups_adds_entries():
+    _, groups = detect_conflicts(SCHEDULE)
+    described = describe_groups(SCHEDULE, groups)
+    room = next(group for group in described if group['type'] == 'room')
+    assert room['entries'] == [
+        {'row': 0, 'Class': 'C1', 'Subject': 'S1', 'Room': 'R1', 'Lecturer': 'L1'},
+        {'row': 1, 'Class': 'C2', 'Subject': 'S2', 'Room': 'R1', 'Lecturer': 'L2'},
+    ]
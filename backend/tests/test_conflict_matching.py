@@ -0,0 +1,94 @@
+import os
+
+import pandas as pd
+import pytest
+
+from conflict_detection import detect_conflicts
+from conflict_matching import resolve_conflicts_optimal
+from conflict_resolution import FREE_STATUSES, resolve_conflicts
+from timeslots import SLOT_NAMES
+
+UPLOADS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'uploads')
+
+
+def room_grid(schedule_df, rooms_df):
+    """File ketersediaan ruangan tanpa model: slot kosong jika tidak dipakai jadwal"""
+    occupied = set(zip(schedule_df['Room'], schedule_df['Sched. Time']))
+    return pd.DataFrame([
+        {
+            'Room': room,
+            'Session_Time': slot,
+            'Status': 'Occupied' if (room, slot) in occupied else 'Available',
+            'Notes': notes,
+        }
+        for room, notes in zip(rooms_df['Name'], rooms_df['Notes'])
+        for slot in SLOT_NAMES
+    ])
+
+
+@pytest.fixture(scope='module', params=[2, 3])
+def clashing(request):
+    """conflict_schedule.csv digandakan sehingga setiap salinan bentrok, plus file ruangan"""
+    base = pd.read_csv(os.path.join(UPLOADS, 'conflict_schedule.csv'))
+    rooms_df = pd.read_csv(os.path.join(UPLOADS, 'Rooms.csv'))
+    room_df = room_grid(base, rooms_df)
+    schedule_df = pd.concat([base] * request.param, ignore_index=True)
+    schedule_df['Conflict'], _ = detect_conflicts(schedule_df)
+    return schedule_df, room_df
+
+
+def test_optimal_resolves_at_least_as_many_as_greedy(clashing):
+    schedule_df, room_df = clashing
+    greedy_df, _, greedy_resolved, _ = resolve_conflicts(schedule_df, room_df)
+    optimal_df, _, resolved, unresolved, comparison = resolve_conflicts_optimal(schedule_df, room_df)
+
+    assert comparison['greedy_resolved'] == len(greedy_resolved)
+    assert comparison['optimal_resolved'] == len(resolved) >= len(greedy_resolved)
+    assert len(resolved) + len(unresolved) == comparison['rows_to_move']
+    if len(resolved) == len(greedy_resolved):
+        assert comparison['optimal_cost'] <= comparison['greedy_cost']
+    assert sum(detect_conflicts(optimal_df)[0]) <= sum(detect_conflicts(greedy_df)[0])
+
+
+def test_optimal_moves_only_clashing_rows_into_free_cells(clashing):
+    schedule_df, room_df = clashing
+    optimal_df, updated_rooms, resolved, _, _ = resolve_conflicts_optimal(schedule_df, room_df)
+
+    before = list(zip(schedule_df['Room'], schedule_df['Sched. Time']))
+    after = list(zip(optimal_df['Room'], optimal_df['Sched. Time']))
+    moved = [pos for pos, (old, new) in enumerate(zip(before, after)) if old != new]
+    assert len(moved) == len(resolved)
+    assert all(schedule_df['Conflict'].iloc[pos] == 1 for pos in moved)
+
+    free = {
+        (room, slot) for room, slot, status in zip(room_df['Room'], room_df['Session_Time'], room_df['Status'])
+        if status in FREE_STATUSES
+    }
+    targets = [after[pos] for pos in moved]
+    assert set(targets) <= free - set(before)
+    assert len(set(targets)) == len(targets)
+    # Slot yang dipakai ditandai Occupied di file ruangan hasil
+    status = dict(zip(zip(updated_rooms['Room'], updated_rooms['Session_Time']), updated_rooms['Status']))
+    assert all(status[cell] == 'Occupied' for cell in targets)
+
+
+def test_optimal_prefers_room_move_over_time_move():
+    schedule_df = pd.DataFrame({
+        'Major': ['PS_SI', 'PS_SI'],
+        'Subject': ['A', 'B'],
+        'Room': ['R1', 'R1'],
+        'Sched. Time': ['Mon1', 'Mon1'],
+        'Lecturer': [None, None],
+        'Conflict': [1, 1],
+    })
+    room_df = pd.DataFrame({
+        'Room': ['R1', 'R1', 'R2'],
+        'Session_Time': ['Mon1', 'Mon2', 'Mon1'],
+        'Status': ['Occupied', 'Available', 'Available'],
+        'Notes': ['general', 'general', 'general'],
+    })
+    optimal_df, _, resolved, unresolved, comparison = resolve_conflicts_optimal(schedule_df, room_df)
+    assert unresolved == []
+    assert [(r['Room'], r['Sched. Time']) for r in resolved] == [('R2', 'Mon1')]
+    assert optimal_df['Room'].tolist() == ['R1', 'R2']
+    assert comparison['optimal_cost'] <= comparison['greedy_cost']
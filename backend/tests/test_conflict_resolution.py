@@ -0,0 +1,98 @@
+import os
+
+import pandas as pd
+import pytest
+
+from conflict_detection import detect_conflicts
+from conflict_resolution import FREE_STATUSES, FreeSlotIndex, resolve_conflicts, rows_to_move
+from timeslots import SLOT_NAMES
+
+UPLOADS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'uploads')
+
+
+def room_file(cells):
+    """room_df dari [(Room, Session_Time, Status, Notes)]"""
+    return pd.DataFrame(cells, columns=['Room', 'Session_Time', 'Status', 'Notes'])
+
+
+def schedule(rows):
+    """schedule_df dari [(Major, Room, Sched. Time)] dengan kolom Conflict dari detect_conflicts"""
+    df = pd.DataFrame(rows, columns=['Major', 'Room', 'Sched. Time'])
+    df['Subject'] = [f'S{i}' for i in range(len(df))]
+    df['Lecturer'] = None
+    df['Conflict'], _ = detect_conflicts(df)
+    return df
+
+
+def cells(df):
+    return list(zip(df['Room'], df['Sched. Time']))
+
+
+def test_rows_to_move_keeps_first_row_of_each_clash():
+    df = schedule([('A', 'R1', 'Mon1'), ('A', 'R1', 'Mon1'), ('A', 'R2', 'Mon1'), ('A', 'R1', 'Mon1')])
+    assert rows_to_move(df) == [1, 3]
+
+
+def test_resolution_steps_in_order():
+    rooms = room_file([
+        ('R1', 'Mon1', 'Occupied', 'PS_SI'),
+        ('R1', 'Mon2', 'Available', 'PS_SI'),
+        ('R2', 'Mon1', 'Available', 'PS_SI'),
+        ('G1', 'Tue1', 'Empty', None),
+        ('X1', 'Mon1', 'Available', 'PS_TInf'),
+    ])
+    df = schedule([('PS_SI', 'R1', 'Mon1')] * 5)
+    result, updated, resolved, unresolved = resolve_conflicts(df, rooms)
+
+    # 1. ruangan lain di sesi yang sama, 2. sesi lain di ruangan yang sama, 3. ruangan general
+    assert cells(result) == [('R1', 'Mon1'), ('R2', 'Mon1'), ('R1', 'Mon2'), ('G1', 'Tue1'), ('R1', 'Mon1')]
+    # Ruangan major lain (X1) tidak dipakai; baris yang tidak mendapat slot tetap di tempat
+    assert unresolved == [4]
+    assert [(r['Room'], r['Sched. Time']) for r in resolved] == cells(result)[1:4]
+    assert updated['Status'].tolist() == ['Occupied', 'Occupied', 'Occupied', 'Occupied', 'Available']
+    # Input tidak diubah
+    assert cells(df) == [('R1', 'Mon1')] * 5
+
+
+def test_free_cells_used_by_schedule_are_not_targets():
+    # File ketersediaan bilang R2/Mon1 kosong, tetapi jadwal sudah memakainya
+    rooms = room_file([('R2', 'Mon1', 'Available', None), ('R3', 'Mon1', 'Available', None)])
+    index = FreeSlotIndex(rooms, occupied=[('R2', 'Mon1')])
+    assert index.room_at('Mon1', 'PS_SI') == 'R3'
+
+    df = schedule([('PS_SI', 'R1', 'Mon1'), ('PS_SI', 'R1', 'Mon1'), ('PS_SI', 'R2', 'Mon1')])
+    result, _, _, unresolved = resolve_conflicts(df, rooms)
+    assert cells(result) == [('R1', 'Mon1'), ('R3', 'Mon1'), ('R2', 'Mon1')]
+    assert unresolved == []
+
+
+@pytest.mark.parametrize('copies', [2, 3])
+def test_never_moves_a_row_into_an_occupied_slot(copies):
+    base = pd.read_csv(os.path.join(UPLOADS, 'conflict_schedule.csv'))
+    rooms_df = pd.read_csv(os.path.join(UPLOADS, 'Rooms.csv'))
+    used = set(cells(base))
+    room_df = room_file([
+        (room, slot, 'Occupied' if (room, slot) in used else 'Available', notes)
+        for room, notes in zip(rooms_df['Name'], rooms_df['Notes'])
+        for slot in SLOT_NAMES
+    ])
+    df = pd.concat([base] * copies, ignore_index=True)
+    df['Conflict'], _ = detect_conflicts(df)
+
+    result, updated, resolved, unresolved = resolve_conflicts(df, room_df)
+    before, after = cells(df), cells(result)
+    moved = [pos for pos, (old, new) in enumerate(zip(before, after)) if old != new]
+    assert moved and len(moved) == len(resolved)
+    assert len(moved) + len(unresolved) == len(rows_to_move(df))
+
+    free = {
+        (room, slot) for room, slot, status in zip(room_df['Room'], room_df['Session_Time'], room_df['Status'])
+        if status in FREE_STATUSES
+    }
+    targets = [after[pos] for pos in moved]
+    assert set(targets) <= free - set(before)
+    assert len(set(targets)) == len(targets)
+    status = dict(zip(zip(updated['Room'], updated['Session_Time']), updated['Status']))
+    assert all(status[cell] == 'Occupied' for cell in targets)
+    # Bentrok ruangan yang tersisa hanya dari baris yang tidak mendapat slot
+    assert sum(detect_conflicts(result)[0]) < sum(df['Conflict'])
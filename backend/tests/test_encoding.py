@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import OneHotEncoder
+
+from encoding import SparseOneHotEncoder
+
+COLUMNS = ['Room', 'Sched. Time']
+
+
+def test_matches_sklearn_one_hot_ignore_unknown(schedule_df):
+    train = schedule_df[COLUMNS].iloc[::2]
+    # Baris ganjil sebagai data baru, ditambah ruangan/sesi yang tidak ada di vocabulary
+    test = pd.concat([
+        schedule_df[COLUMNS].iloc[1::2],
+        pd.DataFrame({'Room': ['X999', train['Room'].iloc[0]], 'Sched. Time': [train['Sched. Time'].iloc[0], 'Sun9']}),
+    ], ignore_index=True)
+
+    ours = SparseOneHotEncoder(COLUMNS).fit(train)
+    reference = OneHotEncoder(handle_unknown='ignore').fit(train)
+
+    assert ours.feature_names == list(reference.get_feature_names_out())
+    for df in (train, test):
+        actual = ours.transform(df)
+        assert actual.format == 'csr' and actual.dtype == np.float32
+        np.testing.assert_array_equal(actual.toarray(), reference.transform(df).toarray())
+
+
+def test_feature_names_match_get_dummies():
+    df = pd.DataFrame({'Room': ['B2', 'A1', 'B2'], 'Sched. Time': ['Mon1', 'Mon1', 'Tue2']})
+    assert SparseOneHotEncoder(COLUMNS).fit(df).feature_names == list(pd.get_dummies(df).columns)
@@ -0,0 +1,118 @@
+import csv
+import gzip
+import io
+from importlib.util import find_spec
+
+import pandas as pd
+import pytest
+
+from csv_loader import SCHEDULE, load_csv
+from export_stream import ExportError, check_format, export_file, export_filename, export_rows, write_frame
+
+
+def read_parquet(chunks):
+    import pyarrow.parquet as pq
+
+    return pq.read_table(io.BytesIO(b''.join(chunks)))
+
+
+# Parquet butuh pyarrow (opsional); test lain tetap jalan tanpa pyarrow
+needs_pyarrow = pytest.mark.skipif(find_spec('pyarrow') is None, reason='pyarrow not installed')
+
+
+@pytest.fixture
+def result_csv(tmp_path, schedule_df):
+    path = tmp_path / 'schedule_with_lecturers.csv'
+    schedule_df.to_csv(path, index=False)
+    return str(path)
+
+
+def test_export_file_csv_is_byte_identical(result_csv):
+    with open(result_csv, 'rb') as f:
+        assert b''.join(export_file(result_csv, 'csv')) == f.read()
+
+
+def test_export_file_gzip_round_trip(result_csv):
+    with open(result_csv, 'rb') as f:
+        assert gzip.decompress(b''.join(export_file(result_csv, 'gzip'))) == f.read()
+
+
+def test_export_rows_csv_and_gzip_round_trip():
+    columns = ['Id', 'Name']
+    rows = [(i, f'name {i}' if i % 3 else None) for i in range(5000)]
+    expected = [columns] + [[str(i), name or ''] for i, name in rows]
+
+    plain = b''.join(export_rows(columns, [int, str], iter(rows), 'csv'))
+    assert list(csv.reader(io.StringIO(plain.decode()))) == expected
+    packed = b''.join(export_rows(columns, [int, str], iter(rows), 'gzip'))
+    assert gzip.decompress(packed) == plain
+
+
+@needs_pyarrow
+def test_export_rows_parquet_schema_and_batches():
+    import pyarrow as pa
+
+    rows = [(i, None if i % 2 else str(i)) for i in range(25)]
+    table = read_parquet(export_rows(['Id', 'Name'], [int, str], iter(rows), 'parquet', batch_size=10))
+    assert table.schema.field('Id').type == pa.int64()
+    assert table.schema.field('Name').type == pa.string()
+    assert table.to_pydict() == {'Id': [r[0] for r in rows], 'Name': [r[1] for r in rows]}
+
+
+@needs_pyarrow
+def test_export_file_parquet_matches_csv(result_csv):
+    table = read_parquet(export_file(result_csv, 'parquet'))
+    expected = pd.read_csv(result_csv, dtype=str)
+    assert table.column_names == list(expected.columns)
+    actual = table.to_pandas()
+    for column in expected.columns:
+        assert actual[column].where(actual[column].notna(), None).tolist() == \
+            expected[column].where(expected[column].notna(), None).tolist()
+
+
+@needs_pyarrow
+def test_export_file_parquet_late_values_in_empty_column(tmp_path, monkeypatch):
+    # Kolom B kosong di seluruh blok pertama, lalu berisi nilai: tidak boleh gagal di tengah stream
+    monkeypatch.setattr('export_stream.EXPORT_CHUNK_SIZE', 1024)
+    path = tmp_path / 'late.csv'
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['A', 'B'])
+        writer.writerows([i, ''] for i in range(20000))
+        writer.writerow([1, 'x'])
+    table = read_parquet(export_file(str(path), 'parquet'))
+    assert table.num_rows == 20001
+    assert table.column('B').null_count == 20000
+    assert table.column('B')[-1].as_py() == 'x'
+
+
+def test_write_frame_matches_to_csv(tmp_path, schedule_csv):
+    # Frame dengan schema (category, Int64) dan NaN, ditulis dalam beberapa batch
+    df = load_csv(schedule_csv, SCHEDULE)
+    df['Room'] = df['Room'].where(df.index % 7 != 0)
+    write_frame(df, tmp_path / 'a.csv', batch_size=123)
+    df.to_csv(tmp_path / 'b.csv', index=False)
+    assert (tmp_path / 'a.csv').read_bytes() == (tmp_path / 'b.csv').read_bytes()
+
+
+def test_write_frame_keeps_old_file_on_error(tmp_path):
+    path = tmp_path / 'result.csv'
+    path.write_text('old\n')
+
+    class Broken:
+        columns = ['A']
+
+        def __len__(self):
+            raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        write_frame(Broken(), path)
+    assert path.read_text() == 'old\n'
+    assert [p.name for p in tmp_path.iterdir()] == ['result.csv']
+
+
+def test_format_checks():
+    with pytest.raises(ExportError):
+        check_format('xlsx')
+    assert export_filename('fixed_schedule.csv', 'gzip') == 'fixed_schedule.csv.gz'
+    assert export_filename('fixed_schedule.csv', 'parquet') == 'fixed_schedule.parquet'
@@ -0,0 +1,114 @@
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import jobs
+from jobs import JobQueue, JobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / 'jobs.sqlite3'))
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    # Executor thread sebagai pengganti process pool: task palsu di TASKS terlihat oleh run_job
+    queue = JobQueue(str(tmp_path / 'jobs.sqlite3'))
+    queue._executor = ThreadPoolExecutor(max_workers=1)
+
+    def ok(value, progress):
+        progress(0.5, 'halfway')
+        return {'value': np.int64(value) * 2}, 200
+
+    def bad_request(progress):
+        return {'error': 'missing file'}, 400
+
+    def boom(progress):
+        raise RuntimeError('boom')
+
+    from tasks import TASKS
+    for kind, task in (('ok', ok), ('bad_request', bad_request), ('boom', boom)):
+        monkeypatch.setitem(TASKS, kind, task)
+    yield queue
+    queue.shutdown()
+
+
+def wait(queue, job_id):
+    queue._executor.submit(lambda: None).result()  # Executor satu thread: job sebelumnya sudah selesai
+    return queue.get(job_id)
+
+
+def test_create_update_get(store):
+    job_id = store.create('ok', {'path': 'a.csv', 'n': np.int64(3)})
+    job = store.get(job_id)
+    assert job['status'] == 'queued' and job['progress'] == 0
+    assert job['params'] == {'path': 'a.csv', 'n': 3}
+    assert job['owner_pid'] == os.getpid()
+    assert job['result'] is None
+
+    store.update(job_id, status='finished', result={'score': np.float32(0.5)}, status_code=200)
+    job = store.get(job_id)
+    assert job['status'] == 'finished' and job['result'] == {'score': 0.5}
+    assert store.get('missing') is None
+
+
+def test_fail_owned_only_touches_unfinished_jobs_of_owner(store):
+    queued, running, finished = (store.create('ok', {}) for _ in range(3))
+    store.update(running, status='running')
+    store.update(finished, status='finished')
+    other = store.create('ok', {})
+    store.update(other, owner_pid=os.getpid() + 1)
+
+    assert store.fail_owned(os.getpid(), 'web worker exited') == 2
+    assert [store.get(job_id)['status'] for job_id in (queued, running, finished, other)] == \
+        ['failed', 'failed', 'finished', 'queued']
+    assert store.get(queued)['error'] == 'web worker exited'
+    assert store.get(running)['finished_at'] is not None
+
+    assert store.fail_unfinished('server restarted') == 1
+    assert store.get(other)['error'] == 'server restarted'
+
+
+def test_old_store_gets_owner_column(tmp_path):
+    path = str(tmp_path / 'old.sqlite3')
+    with sqlite3.connect(path) as conn:
+        conn.execute('CREATE TABLE jobs (id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL,'
+                     ' progress REAL NOT NULL DEFAULT 0, stage TEXT, params TEXT, result TEXT,'
+                     " status_code INTEGER, error TEXT, created_at REAL, started_at REAL, finished_at REAL)")
+        conn.execute("INSERT INTO jobs (id, kind, status) VALUES ('old', 'ok', 'running')")
+    store = JobStore(path)
+    assert store.get('old')['owner_pid'] is None
+    assert store.fail_owned(os.getpid(), 'gone') == 0
+    assert store.get(store.create('ok', {}))['owner_pid'] == os.getpid()
+
+
+def test_finished_job_stores_result(queue):
+    job = wait(queue, queue.submit('ok', value=21))
+    assert job['status'] == 'finished' and job['status_code'] == 200
+    assert job['progress'] == 1.0 and job['stage'] == 'done'
+    assert job['result'] == {'value': 42}
+    assert job['started_at'] <= job['finished_at']
+
+
+def test_failed_jobs(queue):
+    job = wait(queue, queue.submit('bad_request'))
+    assert (job['status'], job['status_code'], job['error']) == ('failed', 400, 'missing file')
+
+    job = wait(queue, queue.submit('boom'))
+    assert (job['status'], job['status_code'], job['error']) == ('failed', 500, 'boom')
+    assert 'RuntimeError' in job['result']['error']
+
+
+def test_crashed_worker_marks_job_failed(queue, monkeypatch):
+    def crash(store_path, job_id, kind, params):
+        raise MemoryError('killed')
+
+    monkeypatch.setattr(jobs, 'run_job', crash)
+    job_id = queue.submit('ok', value=1)
+    job = wait(queue, job_id)
+    assert job['status'] == 'failed'
+    assert job['error'] == 'worker crashed: killed'
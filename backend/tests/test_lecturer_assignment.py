@@ -0,0 +1,116 @@
+import os
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lecturer_assignment import (
+    MAX_DAILY_CREDITS,
+    MAX_WORKING_DAYS,
+    LecturerWorkloadIndex,
+    assign_lecturers_to_schedule,
+)
+from lecturer_rules import LecturerAvailability
+from lecturer_solver import _Capacity, solve_lecturer_assignment
+from pipeline import valid_lecturers
+
+UPLOADS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'uploads')
+
+
+@pytest.fixture(scope='module')
+def lecturer_df():
+    return valid_lecturers(pd.read_csv(os.path.join(UPLOADS, 'Lecturer.csv')))[0]
+
+
+def test_daily_credit_limit():
+    workload = LecturerWorkloadIndex()
+    workload.add('F', 'Mon', 10, 1)
+    assert workload.can_assign('F', 'Full', 'Mon', 2, 5) == (True, 'OK')
+    ok, reason = workload.can_assign('F', 'Full', 'Mon', 3, 5)
+    assert not ok and reason == 'Daily credit limit exceeded (13 > 12)'
+
+    workload.add('P', 'Tue', 4, 1)
+    assert not workload.can_assign('P', 'Part', 'Tue', 3, 5)[0]
+    assert workload.can_assign('P', 'Part', 'Wed', 6, 5)[0]  # Hari lain punya batas sendiri
+
+
+def test_working_days_limit():
+    workload = LecturerWorkloadIndex()
+    workload.add('P', 'Mon', 2, 1)
+    workload.add('P', 'Tue', 2, 1)
+    ok, reason = workload.can_assign('P', 'Part', 'Wed', 2, 1)
+    assert not ok and reason == f"Working days limit exceeded (3 > {MAX_WORKING_DAYS['Part']})"
+    assert workload.can_assign('P', 'Part', 'Tue', 2, 4)[0]
+
+    for day in ('Mon', 'Tue', 'Wed', 'Thu', 'Fri'):
+        workload.add('F', day, 2, 1)
+    assert not workload.can_assign('F', 'Full', 'Sat', 2, 1)[0]
+    assert workload.can_assign('F', 'Full', 'Fri', 2, 3)[0]
+
+
+def test_consecutive_sessions_on_same_day():
+    workload = LecturerWorkloadIndex()
+    workload.add('F', 'Mon', 2, 3)
+    for session in (2, 4):
+        ok, reason = workload.can_assign('F', 'Full', 'Mon', 2, session)
+        assert not ok and reason == 'Cannot assign consecutive classes on the same day'
+    # Sesi yang sama (kelas gabungan), sesi tidak berurutan, hari lain, atau tanpa sesi: boleh
+    for day, session in (('Mon', 3), ('Mon', 5), ('Tue', 2), ('Mon', None)):
+        assert workload.can_assign('F', 'Full', day, 2, session)[0]
+
+
+def test_solver_capacity_matches_can_assign(schedule_df, lecturer_df):
+    availability = LecturerAvailability.from_dataframe(lecturer_df)
+    types = dict(zip(lecturer_df['Lecturer Name'], lecturer_df['Lec. Type']))
+    lecturers = list(dict.fromkeys(lecturer_df['Lecturer Name']))
+
+    # Separuh penempatan dari file contoh menjadi beban tetap, sisanya dicek dengan kedua cara
+    rows = list(schedule_df[['Cr', 'Sched. Time', 'Lecturer']].itertuples(name=None))
+    random.Random(0).shuffle(rows)
+    workload, subjects = LecturerWorkloadIndex(), []
+    for k, (idx, credits, slot, lecturer) in enumerate(rows[:300]):
+        if k % 2 and lecturer in types:
+            workload.add(lecturer, slot[:3], credits, int(slot[3:]))
+        else:
+            subjects.append((idx, credits, slot, slot[:3], int(slot[3:])))
+
+    def allowed(subject, lecturer):
+        _, credits, slot, day, session = subject
+        return availability.is_available(lecturer, slot) and \
+            workload.can_assign(lecturer, types[lecturer], day, credits, session)[0]
+
+    eligible = _Capacity(subjects, lecturers, types, availability, workload).eligible()
+    expected = np.array([[allowed(subject, lecturer) for lecturer in lecturers] for subject in subjects])
+    assert expected.any()
+    np.testing.assert_array_equal(eligible, expected)
+
+
+def assert_workload_rules(result_df, lecturer_df):
+    types = dict(zip(lecturer_df['Lecturer Name'], lecturer_df['Lec. Type']))
+    assigned = result_df.dropna(subset=['Lecturer']).assign(
+        Day=lambda df: df['Sched. Time'].str[:3], Session=lambda df: df['Sched. Time'].str[3:].astype(int)
+    )
+    for lecturer, rows in assigned.groupby('Lecturer'):
+        lecturer_type = types[lecturer]
+        assert rows['Day'].nunique() <= MAX_WORKING_DAYS[lecturer_type]
+        assert rows.groupby('Day')['Cr'].sum().max() <= MAX_DAILY_CREDITS[lecturer_type]
+        for _, day_rows in rows.groupby('Day'):
+            sessions = set(day_rows['Session'])
+            assert not any(session + 1 in sessions for session in sessions), lecturer
+
+
+def test_greedy_and_solver_respect_workload_rules(schedule_df, lecturer_df):
+    # Cukup kecil agar solver selesai (optimal) jauh di bawah time budget
+    schedule = schedule_df.head(150).drop(columns=['Lecturer'])
+    lecturers = lecturer_df.sample(12, random_state=12)
+    random.seed(0)
+    greedy_df, greedy_stats = assign_lecturers_to_schedule(schedule, lecturers)
+    assert_workload_rules(greedy_df, lecturers)
+
+    random.seed(0)
+    result_df, stats = solve_lecturer_assignment(schedule, lecturers, time_budget=30)
+    assert stats['mode'] == 'optimal'
+    assert stats['assigned'] > greedy_stats['assigned']
+    assert stats['assigned'] == result_df['Lecturer'].notna().sum()
+    assert_workload_rules(result_df, lecturers)
@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+
+from lecturer_rules import LecturerAvailability, compile_note
+from timeslots import DAYS, SLOT_NAMES, split_slot
+
+NOTES = [
+    'No Mon', 'No Fri', 'No Mon1', 'No Fri3', 'No Session1', 'No Session5', 'No Session3',
+    'Mon-Wed', 'Thu-Fri', 'Mon-Fri', 'Session2-Session4', 'general', '',
+    'No Mon, No Session1', 'Mon-Thu, No Wed', 'B2, No Tue', 'No B4',
+]
+
+# Slot yang tidak ada di time_mapping
+UNMAPPED_SLOTS = ['Fri3', 'Sat1', 'Mon6']
+
+
+def string_rules_allow(notes, day, session):
+    """Aturan Notes berbasis string (sebelum bitmask) untuk satu slot.
+
+    Sama dengan check_lecturer_availability lama, kecuali 'No Mon1' yang
+    sekarang hanya memblokir slot Mon1 (bukan seluruh hari Senin).
+    """
+    for note in (n.strip() for n in notes.split(',')):
+        if note in ('', 'general'):
+            continue
+        if note in (f'No {day}', f'No {day}{session}', f'No Session{session}'):
+            return False
+        if note.startswith('Session') and '-' in note:
+            start, end = (int(part.replace('Session', '')) for part in note.split('-'))
+            if start <= session <= end:
+                return False
+        elif '-' in note:
+            start, end = (DAYS.index(part) for part in note.split('-'))
+            if not start <= DAYS.index(day) <= end:
+                return False
+    return True
+
+
+def availability_for(notes):
+    return LecturerAvailability.from_dataframe(
+        pd.DataFrame({'Lecturer Name': ['L'], 'Lec. Type': ['Full'], 'Notes': [notes]})
+    )
+
+
+@pytest.mark.parametrize('notes', NOTES)
+def test_mask_matches_string_rules_on_mapped_slots(notes):
+    availability = availability_for(notes)
+    for slot in SLOT_NAMES:
+        day, session = split_slot(slot)
+        assert availability.is_available('L', slot) == string_rules_allow(notes, day, session), slot
+
+
+@pytest.mark.parametrize('notes', NOTES)
+def test_unmapped_slots_never_allowed_against_string_rules(notes):
+    availability = availability_for(notes)
+    for slot in UNMAPPED_SLOTS:
+        day, session = slot[:3], int(slot[3:])
+        if day in DAYS and not string_rules_allow(notes, day, session):
+            assert not availability.is_available('L', slot), slot
+
+
+def test_unmapped_slots_only_for_unrestricted_lecturers():
+    for notes in ('', 'general', 'No B4'):
+        assert all(availability_for(notes).is_available('L', slot) for slot in UNMAPPED_SLOTS)
+    # 'No Fri3' tidak punya bit di mask, tetapi tetap aturan waktu
+    assert not availability_for('No Fri3').is_available('L', 'Fri3')
+    assert not availability_for('No Session1').is_available('L', 'Sat1')
+    # Dosen yang tidak ada di data Notes tidak punya batasan
+    assert availability_for('No Mon').is_available('Unknown', 'Fri3')
+
+
+def test_compile_note_unknown_tokens():
+    assert compile_note('No Fri3') == 0
+    assert compile_note('No B4') is None
+    assert compile_note('B2') is None
+    availability = availability_for('B2, No Tue')
+    assert [issue['note'] for issue in availability.issues] == ['B2']
+    assert not availability.is_available('L', 'Tue1')
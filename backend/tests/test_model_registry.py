@@ -0,0 +1,69 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from model_registry import ModelRegistry
+
+
+def artifact(value):
+    return {'weights': np.full(25_000, value, dtype=np.float64)}  # ~200 KB di disk
+
+
+def model_files(folder):
+    return sorted(name for name in os.listdir(folder) if name.endswith('.joblib'))
+
+
+def age(registry, key, seconds_ago):
+    path = registry.path_for(key)
+    mtime = os.path.getmtime(path) - seconds_ago
+    os.utime(path, (mtime, mtime))
+
+
+def test_make_key_depends_on_content_and_version():
+    df = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+    key = ModelRegistry.make_key('room', 'v2', df)
+    assert key == ModelRegistry.make_key('room', 'v2', df.copy())
+    assert key != ModelRegistry.make_key('room', 'v3', df)
+    assert key != ModelRegistry.make_key('room', 'v2', df.assign(b=['x', 'z']))
+
+
+def test_get_or_train_trains_once_and_reloads_from_disk(tmp_path):
+    calls = []
+
+    def train():
+        calls.append(1)
+        return artifact(1.0)
+
+    registry = ModelRegistry(str(tmp_path))
+    assert registry.get_or_train('m', train)[1] is False
+    assert registry.get_or_train('m', train)[1] is True
+    # Proses lain (registry baru) memuat dari disk
+    loaded, cached = ModelRegistry(str(tmp_path)).get_or_train('m', train)
+    assert cached and len(calls) == 1
+    assert loaded['weights'][0] == 1.0
+
+
+def test_put_evicts_least_recently_used_files(tmp_path):
+    registry = ModelRegistry(str(tmp_path), max_models=1, max_bytes=450_000)
+    registry.put('a', artifact(1.0))
+    registry.put('b', artifact(2.0))
+    age(registry, 'a', 20)
+    age(registry, 'b', 10)
+    # 'a' dipakai lagi (dari disk, bukan LRU) -> 'b' yang paling lama tidak dipakai
+    assert registry.get('a') is not None
+    registry.put('c', artifact(3.0))
+    assert model_files(tmp_path) == ['a.joblib', 'c.joblib']
+
+    # Artifact yang baru disimpan tidak pernah di-evict, walau lebih besar dari batas
+    registry.max_bytes = 1
+    registry.put('d', artifact(4.0))
+    assert model_files(tmp_path) == ['d.joblib']
+
+
+def test_get_after_eviction_by_other_process_retrains(tmp_path):
+    registry = ModelRegistry(str(tmp_path), max_models=0)
+    registry.put('a', artifact(1.0))
+    os.remove(registry.path_for('a'))
+    assert registry.get('a') is None
+    assert registry.get_or_train('a', lambda: artifact(5.0))[1] is False
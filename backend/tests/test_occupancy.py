@@ -0,0 +1,42 @@
+import os
+
+import pandas as pd
+
+from occupancy import OccupancyMatrix
+
+UPLOADS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'uploads')
+
+
+def loop_training_set(schedule_df, rooms_list):
+    """Training set room availability versi lama (loop per ruangan x sesi, sebelum OccupancyMatrix)"""
+    sessions_list = schedule_df['Sched. Time'].unique()
+    data = []
+    for room in rooms_list:
+        for session_time in sessions_list:
+            is_occupied = ((schedule_df['Room'] == room) & (schedule_df['Sched. Time'] == session_time)).any()
+            data.append([room, session_time, is_occupied])
+    return pd.DataFrame(data, columns=['Room', 'Sched. Time', 'Is Occupied'])
+
+
+def test_training_set_matches_loop(schedule_df):
+    rooms_list = pd.read_csv(os.path.join(UPLOADS, 'Rooms.csv'))['Name'].unique()
+    occupancy = OccupancyMatrix.from_schedule(schedule_df, rooms_list)
+    expected = loop_training_set(schedule_df, rooms_list)
+    assert occupancy.shape == (len(rooms_list), schedule_df['Sched. Time'].nunique())
+    assert expected['Is Occupied'].any()
+    pd.testing.assert_frame_equal(occupancy.to_frame(), expected, check_dtype=False)
+
+
+def test_unknown_rooms_and_duplicates():
+    schedule_df = pd.DataFrame({
+        'Room': ['R1', 'R1', 'R9', 'R2'],
+        'Sched. Time': ['Mon1', 'Mon1', 'Tue1', 'Tue1'],
+    })
+    rooms_list = ['R1', 'R2', 'R3']
+    occupancy = OccupancyMatrix.from_schedule(schedule_df, rooms_list)
+    pd.testing.assert_frame_equal(
+        occupancy.to_frame(), loop_training_set(schedule_df, rooms_list), check_dtype=False
+    )
+    # Sesi eksplisit: sesi di luar daftar diabaikan
+    fixed = OccupancyMatrix.from_schedule(schedule_df, rooms_list, sessions=['Tue1', 'Wed1'])
+    assert fixed.occupied.tolist() == [[False, False], [True, False], [False, False]]
@@ -0,0 +1,82 @@
+import os
+
+import pandas as pd
+
+from room_assignment import RoomAssignmentEngine, assign_rooms_and_sessions, build_rooms_by_major
+
+UPLOADS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'uploads')
+
+ROOMS = pd.DataFrame({
+    'Name': ['SI1', 'SI2', 'TI1', 'G1'],
+    'Notes': ['PS_SI', 'PS_SI, PS_TInf', 'PS_TInf', None],
+})
+SESSIONS = ['Mon1', 'Mon2', 'Tue1']
+
+
+def drain(engine, major):
+    slots = []
+    while (slot := engine.assign(major)) is not None:
+        slots.append(slot)
+    return slots
+
+
+def test_rooms_by_major_from_notes():
+    assert build_rooms_by_major(ROOMS) == {'PS_SI': ['SI1', 'SI2'], 'PS_TInf': ['SI2', 'TI1'], 'general': ['G1']}
+
+
+def test_full_major_falls_back_to_general_then_none():
+    engine = RoomAssignmentEngine(ROOMS, SESSIONS + ['Mon1'], seed=1)  # Sesi duplikat dihitung sekali
+    slots = drain(engine, 'PS_SI')
+    rooms = [room for room, _ in slots]
+    # Semua sesi ruangan PS_SI dulu, baru ruangan general
+    assert sorted(rooms[:6]) == ['SI1'] * 3 + ['SI2'] * 3
+    assert rooms[6:] == ['G1'] * 3
+    assert len(set(slots)) == len(slots) == 9
+    assert engine.fallbacks == 4  # 3 slot general + panggilan terakhir yang tidak mendapat slot
+    assert engine.assign('PS_SI') is None
+
+    # SI2 sudah penuh lewat pool PS_SI: PS_TInf hanya mendapat TI1, lalu tidak ada slot tersisa
+    assert sorted(drain(engine, 'PS_TInf')) == [('TI1', session) for session in sorted(SESSIONS)]
+    assert engine.retries >= 1
+    assert engine.assign('PS_TInf') is None
+
+
+def test_unknown_major_uses_general_rooms():
+    engine = RoomAssignmentEngine(ROOMS, SESSIONS, seed=0)
+    assert sorted(drain(engine, 'PS_Unknown')) == [('G1', session) for session in sorted(SESSIONS)]
+    assert engine.fallbacks == 0
+
+
+def test_rows_without_slot_are_reported():
+    data_df = pd.DataFrame({'Major': ['PS_TInf'] * 8 + ['PS_SI'] * 8})
+    result, unassigned = assign_rooms_and_sessions(data_df, ROOMS, SESSIONS, seed=3)
+    # 4 ruangan x 3 sesi = 12 slot untuk 16 kelas
+    assert len(unassigned) == 4
+    assert result.loc[unassigned, ['Room', 'Sched. Time']].isna().all().all()
+    assert not result.drop(index=unassigned).duplicated(subset=['Room', 'Sched. Time']).any()
+
+
+def test_seed_is_deterministic():
+    def run(seed):
+        engine = RoomAssignmentEngine(ROOMS, SESSIONS, seed=seed)
+        return [engine.assign(major) for major in ['PS_SI', 'PS_TInf', 'PS_Unknown'] * 5]
+
+    assert run(7) == run(7)
+    assert run(7) != run(8)
+
+
+def test_assign_rooms_and_sessions_on_sample_data():
+    data_df = pd.read_csv(os.path.join(UPLOADS, 'Raw_Schedule.csv'))
+    rooms_df = pd.read_csv(os.path.join(UPLOADS, 'Rooms.csv'))
+    sched = pd.read_csv(os.path.join(UPLOADS, 'Sched.csv'))
+    sessions = (sched['Day'] + sched['Session'].astype(str)).tolist()
+
+    first, unassigned = assign_rooms_and_sessions(data_df.copy(), rooms_df, sessions, seed=42)
+    second, _ = assign_rooms_and_sessions(data_df.copy(), rooms_df, sessions, seed=42)
+    pd.testing.assert_frame_equal(first, second)
+
+    placed = first.drop(index=unassigned)
+    assert first.loc[unassigned, 'Room'].isna().all()
+    assert first['Major'].is_monotonic_increasing
+    assert not placed.duplicated(subset=['Room', 'Sched. Time']).any()
+    assert set(placed['Sched. Time']) <= set(sessions)
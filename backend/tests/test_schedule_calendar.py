@@ -0,0 +1,81 @@
+import io
+
+import pytest
+
+from timeslots import SLOT_IDS
+
+
+@pytest.fixture
+def saved(client, schedule_bytes):
+    def save(term='2025'):
+        response = client.post(
+            '/api/schedule/save', data={'file': (io.BytesIO(schedule_bytes), 'schedule.csv'), 'term': term}
+        )
+        assert response.status_code == 200, response.json
+        return response.json
+
+    save()
+    return save
+
+
+def pages(client, query, limit):
+    """Semua halaman kalender dengan mengikuti X-Next-Cursor"""
+    events, after_id, calls = [], 0, 0
+    while True:
+        response = client.get(f'/api/schedule/calendar?{query}&limit={limit}&after_id={after_id}')
+        assert response.status_code == 200
+        calls += 1
+        events.extend(response.json)
+        cursor = response.headers.get('X-Next-Cursor')
+        if cursor is None:
+            return events, calls
+        assert len(response.json) == limit
+        after_id = int(cursor)
+
+
+def test_keyset_pages_cover_all_slotted_rows_once(client, saved, schedule_df):
+    expected = int(schedule_df['Sched. Time'].isin(list(SLOT_IDS)).sum())
+    events, calls = pages(client, 'term=2025', limit=100)
+    ids = [event['id'] for event in events]
+    assert ids == sorted(set(ids))
+    assert len(events) == expected
+    assert calls == -(-expected // 100)
+
+
+def test_filters_match_single_page(client, saved, schedule_df):
+    major = schedule_df['Major'].iloc[0]
+    events, _ = pages(client, f'major={major}&day=Mon', limit=7)
+    assert events and all(e['major'] == major and e['start'].startswith('Mon') for e in events)
+    single = client.get(f'/api/schedule/calendar?major={major}&day=Mon&limit=5000').json
+    assert [e['id'] for e in events] == [e['id'] for e in single]
+
+
+def test_bad_arguments_rejected(client):
+    assert client.get('/api/schedule/calendar?day=Sun').status_code == 400
+    assert client.get('/api/schedule/calendar?limit=0').status_code == 400
+    assert client.get('/api/schedule/calendar?after_id=x').status_code == 400
+
+
+def test_etag_not_modified_until_next_save(client, saved):
+    url = '/api/schedule/calendar?term=2025&limit=50'
+    first = client.get(url)
+    etag = first.headers['ETag']
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+    # Parameter lain -> ETag lain
+    assert client.get('/api/schedule/calendar?term=2025&limit=51').headers['ETag'] != etag
+
+    # Save ulang term yang sama: SQLite memakai ulang id, isi halaman pertama bisa identik
+    saved()
+    second = client.get(url, headers={'If-None-Match': etag})
+    assert second.status_code == 200
+    assert second.headers['ETag'] != etag
+    assert [e['id'] for e in second.json] == [e['id'] for e in first.json]
+
+
+def test_failed_save_keeps_etag(client, saved, schedule_df):
+    url = '/api/schedule/calendar?limit=10'
+    etag = client.get(url).headers['ETag']
+    bad = schedule_df.assign(Cr=1.5).to_csv(index=False).encode()
+    response = client.post('/api/schedule/save', data={'file': (io.BytesIO(bad), 'bad.csv'), 'term': '2025'})
+    assert response.status_code == 400
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
@@ -0,0 +1,87 @@
+import io
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, func, select
+
+from models import Schedule, db
+from schedule_ingest import IngestError, ingest_schedule, prepare_rows
+from timeslots import SLOT_IDS
+
+
+def save(client, content, term='2025', **params):
+    return client.post('/api/schedule/save', data={'file': (io.BytesIO(content), 'schedule.csv'), 'term': term, **params})
+
+
+def row_count(app, term=None):
+    query = select(func.count()).select_from(Schedule.__table__)
+    if term is not None:
+        query = query.where(Schedule.__table__.c.term == term)
+    with app.app_context():
+        return db.session.execute(query).scalar()
+
+
+def test_save_same_term_replaces_rows(app, client, schedule_bytes, schedule_df):
+    first = save(client, schedule_bytes)
+    assert first.status_code == 200
+    assert first.json['rows'] == len(schedule_df) and first.json['deleted'] == 0
+
+    second = save(client, schedule_bytes)
+    assert second.status_code == 200
+    assert second.json['deleted'] == len(schedule_df)
+    assert row_count(app) == len(schedule_df)
+
+    # Term lain ditambahkan, bukan menggantikan
+    assert save(client, schedule_bytes, term='2026').status_code == 200
+    assert row_count(app, '2025') == row_count(app, '2026') == len(schedule_df)
+
+
+@pytest.mark.parametrize('params', [
+    {'method': 'copy'},  # SQLite tidak punya COPY
+    {'method': 'bulk'},
+    {'batch_size': '0'},
+    {'batch_size': '-5'},
+])
+def test_save_rejects_bad_parameters(app, client, schedule_bytes, params):
+    response = save(client, schedule_bytes, **params)
+    assert response.status_code == 400
+    assert response.json['message']
+    assert row_count(app) == 0
+
+
+def test_save_rejects_fractional_credits(app, client, schedule_df):
+    bad = schedule_df.copy()
+    bad.loc[3, 'Cr'] = 3.5
+    response = save(client, bad.to_csv(index=False).encode())
+    assert response.status_code == 400
+    assert 'Cr' in response.json['message']
+    assert row_count(app) == 0
+
+
+def test_failed_ingest_keeps_previous_rows(app, client, schedule_bytes, schedule_df):
+    assert save(client, schedule_bytes).status_code == 200
+    bad = schedule_df.drop(columns=['Room'])
+    assert save(client, bad.to_csv(index=False).encode()).status_code == 400
+    assert row_count(app) == len(schedule_df)
+
+
+def test_prepare_rows_integer_credits_and_slots(schedule_df):
+    rows = prepare_rows(schedule_df.head(20), 'T')
+    assert all(isinstance(value, int) for value in rows['credit'] if value is not None)
+    assert rows['slot_id'].tolist() == [SLOT_IDS.get(slot) for slot in schedule_df['Sched. Time'].head(20)]
+    assert (rows['term'] == 'T').all()
+    with pytest.raises(IngestError):
+        prepare_rows(schedule_df.head(5).assign(Cr=2.5), 'T')
+
+
+def test_ingest_schedule_in_batches_matches_single_batch(tmp_path, schedule_df):
+    frames = []
+    for batch_size in (1000, 7):
+        engine = create_engine(f'sqlite:///{tmp_path / f"b{batch_size}.db"}')
+        Schedule.__table__.metadata.create_all(engine)
+        stats = ingest_schedule(engine, Schedule.__table__, schedule_df, 'T', batch_size=batch_size)
+        assert stats['method'] == 'insert' and stats['rows'] == len(schedule_df)
+        with engine.connect() as conn:
+            frames.append(pd.read_sql(select(Schedule.__table__).order_by('id'), conn).drop(columns='id'))
+        engine.dispose()
+    pd.testing.assert_frame_equal(frames[0], frames[1])
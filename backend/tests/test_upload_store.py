@@ -0,0 +1,109 @@
+import io
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from upload_store import UploadStore, is_stored_path, read_upload
+
+
+def csv_bytes(n, tag='a'):
+    return pd.DataFrame({'Tag': [tag] * n, 'Value': range(n)}).to_csv(index=False).encode()
+
+
+def age(folder, key, seconds_ago):
+    mtime = time.time() - seconds_ago
+    for name in os.listdir(folder):
+        if name.startswith(key + '.'):
+            os.utime(os.path.join(folder, name), (mtime, mtime))
+
+
+def stored_keys(folder):
+    return sorted({name.split('.', 1)[0] for name in os.listdir(folder)})
+
+
+@pytest.fixture
+def store(tmp_path):
+    return UploadStore(str(tmp_path), max_bytes=10**9, grace_seconds=0)
+
+
+def test_same_content_is_stored_once(store, tmp_path):
+    first = store.save(io.BytesIO(csv_bytes(100)))
+    second = store.save(io.BytesIO(csv_bytes(100)))
+    other = store.save(io.BytesIO(csv_bytes(100, tag='b')))
+    assert first == second != other
+    assert is_stored_path(first) and is_stored_path(other)
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(p) for p in (first, other))
+
+
+def test_dedup_resaves_file_evicted_by_other_process(store, monkeypatch):
+    path = store.save(io.BytesIO(csv_bytes(100)))
+    real_utime = os.utime
+
+    def evicted(target, *args, **kwargs):
+        # Proses lain menghapus file di antara exists() dan utime()
+        if target == path and os.path.exists(path):
+            os.remove(path)
+        return real_utime(target, *args, **kwargs)
+
+    monkeypatch.setattr(os, 'utime', evicted)
+    assert store.save(io.BytesIO(csv_bytes(100))) == path
+    monkeypatch.undo()
+    assert pd.read_csv(path).shape == (100, 2)
+    assert not [name for name in os.listdir(os.path.dirname(path)) if name.endswith('.tmp')]
+
+
+def test_read_upload_caches_parse_per_key(store):
+    path = store.save(io.BytesIO(csv_bytes(50)))
+    calls = []
+
+    def parse(source):
+        calls.append(source)
+        return pd.read_csv(source)
+
+    first = read_upload(path, parse=parse, cache_key='t')
+    second = read_upload(path, parse=parse, cache_key='t')
+    pd.testing.assert_frame_equal(first, second)
+    assert len(calls) == 1
+    assert os.path.exists(f'{os.path.splitext(path)[0]}.t.pkl')
+    read_upload(path, parse=parse, cache_key='other')
+    assert len(calls) == 2
+
+
+def test_read_upload_parses_paths_outside_store(tmp_path):
+    path = tmp_path / 'plain.csv'
+    path.write_bytes(csv_bytes(5))
+    calls = []
+    read_upload(str(path), parse=lambda source: calls.append(source) or pd.read_csv(source))
+    read_upload(str(path), parse=lambda source: calls.append(source) or pd.read_csv(source))
+    assert len(calls) == 2
+    assert os.listdir(tmp_path) == ['plain.csv']
+
+
+def test_evict_removes_least_recently_used_with_parse_cache(store, tmp_path):
+    paths = [store.save(io.BytesIO(csv_bytes(1000, tag))) for tag in 'abc']
+    keys = [os.path.basename(p).split('.', 1)[0] for p in paths]
+    read_upload(paths[0], cache_key='t')
+    for key, seconds_ago in zip(keys, (30, 20, 10)):
+        age(tmp_path, key, seconds_ago)
+
+    store.max_bytes = store.size() - 1
+    assert store.evict() == 1
+    assert stored_keys(tmp_path) == sorted(keys[1:])  # CSV dan .t.pkl milik 'a' ikut dihapus
+
+    # File yang baru disimpan (keep) tidak dihapus walau store melebihi batas
+    store.max_bytes = 0
+    assert store.evict(keep=paths[2]) == 1
+    assert stored_keys(tmp_path) == [keys[2]]
+
+
+def test_evict_skips_files_within_grace_period(tmp_path):
+    store = UploadStore(str(tmp_path), max_bytes=0, grace_seconds=60)
+    old = store.save(io.BytesIO(csv_bytes(100, 'old')))
+    age(tmp_path, os.path.basename(old).split('.', 1)[0], 120)
+    # Upload lain dari request/proses berbeda yang belum di-parse tetap ada
+    recent = store.save(io.BytesIO(csv_bytes(100, 'recent')))
+    newest = store.save(io.BytesIO(csv_bytes(100, 'newest')))
+    assert not os.path.exists(old)
+    assert os.path.exists(recent) and os.path.exists(newest)
@@ -0,0 +1,56 @@
+# Slot jadwal mingguan: kode sesi (Hari + nomor sesi) -> jam mulai-selesai
+time_mapping = {
+    # Monday to Thursday
+    "Mon1": "07:30-09:45",
+    "Mon2": "10:00-12:15",
+    "Mon3": "12:30-14:45",
+    "Mon4": "15:00-17:15",
+    "Mon5": "17:30-19:30",
+    
+    "Tue1": "07:30-09:45",
+    "Tue2": "10:00-12:15",
+    "Tue3": "12:30-14:45",
+    "Tue4": "15:00-17:15",
+    "Tue5": "17:30-19:30",
+
+    "Wed1": "07:30-09:45",
+    "Wed2": "10:00-12:15",
+    "Wed3": "12:30-14:45",
+    "Wed4": "15:00-17:15",
+    "Wed5": "17:30-19:30",
+
+    "Thu1": "07:30-09:45",
+    "Thu2": "10:00-12:15",
+    "Thu3": "12:30-14:45",
+    "Thu4": "15:00-17:15",
+    "Thu5": "17:30-19:30",
+
+    # Friday
+    "Fri1": "07:00-09:15",
+    "Fri2": "09:30-11:45",
+    "Fri4": "13:40-15:55",
+    "Fri5": "16:10-18:25"
+}
+
+DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri']
+
+# Urutan slot tetap, dipakai sebagai posisi bit pada bitmask ketersediaan
+SLOT_NAMES = list(time_mapping)
+SLOT_INDEX = {name: i for i, name in enumerate(SLOT_NAMES)}
+ALL_SLOTS_MASK = (1 << len(SLOT_NAMES)) - 1
+# Primary key tabel slot (1-based, urutan SLOT_NAMES)
+SLOT_IDS = {name: i + 1 for i, name in enumerate(SLOT_NAMES)}
+
+
+def split_slot(slot_name):
+    """'Thu3' -> ('Thu', 3)"""
+    return slot_name[:3], int(slot_name[3:])
+
+
+def slots_mask(predicate):
+    """Bitmask dari semua slot (day, session) yang memenuhi predicate"""
+    mask = 0
+    for name, i in SLOT_INDEX.items():
+        if predicate(*split_slot(name)):
+            mask |= 1 << i
+    return mask
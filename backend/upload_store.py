@@ -0,0 +1,138 @@
+import hashlib
+import os
+import threading
+import time
+
+# Batas total ukuran store (CSV + hasil parse); file yang paling lama tidak dipakai dihapus lebih dulu
+UPLOAD_STORE_MAX_BYTES = int(os.environ.get('UPLOAD_STORE_MAX_BYTES', 512 * 1024 * 1024))
+# File yang dipakai dalam rentang ini tidak di-evict: proses lain mungkin baru menyimpannya
+# dan belum selesai mem-parse (lock store hanya berlaku per proses)
+UPLOAD_STORE_GRACE_SECONDS = float(os.environ.get('UPLOAD_STORE_GRACE_SECONDS', 3600))
+
+_CHUNK_SIZE = 1024 * 1024
+_DIGEST_LENGTH = 64
+
+
+def _tmp_path(path):
+    return f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+
+def is_stored_path(path):
+    """True jika path adalah CSV di upload store (nama file = sha256 isi)"""
+    name = os.path.basename(path)
+    digest, ext = os.path.splitext(name)
+    return ext == '.csv' and len(digest) == _DIGEST_LENGTH and all(c in '0123456789abcdef' for c in digest)
+
+
+def read_upload(source, parse=None, cache_key='raw'):
+    """Baca CSV upload menjadi DataFrame dengan `parse` (default pd.read_csv).
+
+    Untuk CSV di upload store, hasil parse disimpan sebagai pickle di samping
+    file-nya per `cache_key` (isi file tidak pernah berubah karena namanya
+    adalah hash), jadi upload ulang file yang sama tidak di-parse lagi.
+    Sumber lain (path biasa atau file-like) langsung di-parse.
+    """
+    import pandas as pd  # Hanya dipakai task, bukan saat start aplikasi
+
+    parse = parse or pd.read_csv
+    if not (isinstance(source, str) and is_stored_path(source)):
+        return parse(source)
+
+    parsed_path = f'{os.path.splitext(source)[0]}.{cache_key}.pkl'
+    try:
+        df = pd.read_pickle(parsed_path)
+        os.utime(parsed_path)  # Tandai baru dipakai untuk eviction
+        return df
+    except FileNotFoundError:
+        pass
+
+    df = parse(source)
+    tmp_path = _tmp_path(parsed_path)
+    df.to_pickle(tmp_path)
+    os.replace(tmp_path, parsed_path)
+    return df
+
+
+class UploadStore:
+    """Penyimpanan upload content-addressed: uploads/store/<sha256>.csv.
+
+    Stream upload di-hash sambil disimpan, sehingga file dengan isi sama
+    disimpan sekali dan request paralel tidak saling menimpa file (nama
+    file dari client tidak dipakai sebagai path). Ukuran total dibatasi
+    `max_bytes` dengan menghapus file yang paling lama tidak dipakai; file
+    yang dipakai dalam `grace_seconds` terakhir tidak pernah dihapus.
+    """
+
+    def __init__(self, folder, max_bytes=UPLOAD_STORE_MAX_BYTES, grace_seconds=UPLOAD_STORE_GRACE_SECONDS):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.grace_seconds = grace_seconds
+        self._lock = threading.Lock()
+        os.makedirs(folder, exist_ok=True)
+
+    def save(self, file_storage):
+        """Simpan upload (FileStorage atau file-like) dan kembalikan path CSV di store"""
+        stream = getattr(file_storage, 'stream', file_storage)
+        digest = hashlib.sha256()
+        tmp_path = _tmp_path(os.path.join(self.folder, 'upload'))
+        with open(tmp_path, 'wb') as out:
+            while True:
+                chunk = stream.read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                out.write(chunk)
+
+        path = os.path.join(self.folder, f'{digest.hexdigest()}.csv')
+        if os.path.exists(path):
+            try:
+                os.utime(path)
+            except FileNotFoundError:  # Di-evict proses lain setelah exists(): simpan ulang
+                pass
+            else:
+                os.remove(tmp_path)
+                return path
+        os.replace(tmp_path, path)
+        self.evict(keep=path)
+        return path
+
+    def size(self):
+        return sum(entry.stat().st_size for entry in os.scandir(self.folder) if entry.is_file())
+
+    def evict(self, keep=None):
+        """Hapus CSV (beserta semua hasil parse-nya) yang paling lama tidak dipakai sampai ukuran <= max_bytes.
+
+        File yang dipakai dalam `grace_seconds` terakhir dilewati, jadi ukuran
+        store bisa sementara melebihi `max_bytes`.
+        """
+        with self._lock:
+            groups = {}
+            for entry in os.scandir(self.folder):
+                if not entry.is_file() or entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:  # Dihapus proses lain
+                    continue
+                key = entry.name.split('.', 1)[0]  # sha256 isi file
+                size, last_used = groups.get(key, (0, 0.0))
+                groups[key] = (size + stat.st_size, max(last_used, stat.st_mtime))
+
+            total = sum(size for size, _ in groups.values())
+            keep_key = os.path.basename(keep).split('.', 1)[0] if keep else None
+            cutoff = time.time() - self.grace_seconds
+            removed = 0
+            for key, (size, last_used) in sorted(groups.items(), key=lambda item: item[1][1]):
+                if total <= self.max_bytes or last_used > cutoff:
+                    break  # Terurut dari yang paling lama: sisanya juga masih dalam grace period
+                if key == keep_key:
+                    continue
+                for name in os.listdir(self.folder):
+                    if name.startswith(key + '.'):
+                        try:
+                            os.remove(os.path.join(self.folder, name))
+                        except FileNotFoundError:
+                            pass
+                total -= size
+                removed += 1
+            return removed
@@ -62,7 +62,7 @@ const ScheduleCalendar: React.FC = () => {
   useEffect(() => {
     const fetchSchedule = async () => {
       try {
-        const response = await apiService.getSchedule();
+        const response = await apiService.getSchedule({ major });
         const formattedEvents = formatEventData(response);
         setEvents(formattedEvents);
 
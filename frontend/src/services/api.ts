@@ -17,6 +17,15 @@ const api = axios.create({
 //   };
 // };
 
+// Filter /api/schedule/calendar (dikerjakan di SQL oleh backend)
+export interface CalendarFilters {
+  major?: string;
+  room?: string;
+  lecturer?: string;
+  term?: string;
+  day?: string;
+}
+
 // Definisi interface yang belum ada
 export interface FixedConflictResponse {
   message: string;
@@ -50,11 +59,21 @@ export interface ScheduleOptimizationResponse {
   file: string;
 }
 
+export interface ConflictGroup {
+  type: "room" | "lecturer" | "class";
+  key: string;
+  "Sched. Time": string;
+  rows: number[];
+}
+
 export interface ConflictPredictionResponse {
   message: string;
-  accuracy: number;
-  model_file: string;
   conflict_file: string;
+  conflicting_rows: number;
+  conflict_groups: ConflictGroup[];
+  // Hanya ada jika model dilatih (?train=1)
+  accuracy?: number;
+  model_file?: string;
 }
 
 export interface RoomAvailabilityResponse {
@@ -256,9 +275,18 @@ uploadScheduleCSV: async (file: File): Promise<any> => {
     }
   }
 },
- getSchedule: async (): Promise<any[]> => {
-    const response = await api.get('/schedule/calendar');  // Update ke endpoint yang baru
-    return response.data;  // Mengembalikan data jadwal
+ getSchedule: async (filters: CalendarFilters = {}): Promise<any[]> => {
+    // Ambil semua halaman; X-Next-Cursor berisi after_id halaman berikutnya
+    const events: any[] = [];
+    let afterId: string | undefined;
+    do {
+      const response = await api.get('/schedule/calendar', {
+        params: { ...filters, after_id: afterId },
+      });
+      events.push(...response.data);
+      afterId = response.headers['x-next-cursor'];
+    } while (afterId);
+    return events;  // Mengembalikan data jadwal
   },
 
 };